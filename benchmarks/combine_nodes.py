@@ -0,0 +1,71 @@
+"""
+Benchmark of joining the nodes with the types revealed by mypy.
+
+Simulates a large notebook export with many calls, some of them sharing a line, and compares
+TypeInference.combine_nodes_with_inferred_types with the previous implementation, which matched
+every node against every type which was not matched yet.
+
+Run from the root of the repository:
+    python benchmarks/combine_nodes.py [number_of_lines]
+"""
+import sys
+import timeit
+from typing import Dict, List, Tuple
+
+import astroid
+
+from dslinter.utils.ast import ASTUtil
+from dslinter.utils.type_inference import TypeInference
+
+
+def combine_nodes_with_inferred_types_previous(
+    nodes: List[astroid.node_classes.NodeNG], types: List[Tuple[int, str]]
+) -> Dict[astroid.node_classes.NodeNG, str]:
+    """Previous implementation of TypeInference.combine_nodes_with_inferred_types."""
+    unseen_types = types.copy()
+    nodes_with_types = {}
+    for node in nodes:
+        for line, type_inferred in unseen_types:
+            if TypeInference.line_to_add_call(node) == line:
+                nodes_with_types[node] = type_inferred
+                unseen_types.remove((line, type_inferred))
+    return nodes_with_types
+
+
+def generate_code(lines: int) -> str:
+    """
+    Generate code with a call on every line and two calls on every tenth line.
+
+    :param lines: Number of lines of the generated code.
+    :return: The generated code.
+    """
+    code = []
+    for line in range(lines):
+        if line % 10 == 0:
+            code.append("df{0} = df.head(); df.tail()".format(line))
+        elif line % 10 == 5:
+            code.append("for x{0} in df.iterrows():\n    print(x{0})".format(line))
+        else:
+            code.append("df{0} = df.abs()".format(line))
+    return "\n".join(code)
+
+
+def main(lines: int):
+    """
+    Run the benchmark.
+
+    :param lines: Number of lines of the generated code.
+    """
+    module = astroid.parse(generate_code(lines))
+    nodes = ASTUtil.search_nodes(module, astroid.Call)
+    types = sorted((TypeInference.line_to_add_call(node), "pandas.core.frame.DataFrame") for node in nodes)
+
+    current = timeit.timeit(lambda: TypeInference.combine_nodes_with_inferred_types(nodes, types), number=1)
+    previous = timeit.timeit(lambda: combine_nodes_with_inferred_types_previous(nodes, types), number=1)
+    print("{} lines, {} calls".format(lines, len(nodes)))
+    print("previous: {:.3f}s".format(previous))
+    print("current:  {:.3f}s ({:.0f}x faster)".format(current, previous / current))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
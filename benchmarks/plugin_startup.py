@@ -0,0 +1,249 @@
+"""
+Benchmark of the startup time of the plugin.
+
+Measures, in a new interpreter for every run:
+- the time to import pylint, which every run of pylint takes regardless of the plugin,
+- the time to import the plugin, to read the checker manifest and to register the checkers,
+- the time to register the checkers when the modules of all checkers are imported, as the plugin did
+  before its checkers were registered lazily,
+- the time to open the signature database and to look up a signature of every library,
+- the time to import the module of every checker, in a process forked after importing the plugin,
+- the time of a complete pylint run on a module of a few lines, which is the latency before the
+  first module is checked, with all checkers enabled and with only the import checker enabled.
+
+The medians are appended to a history of JSON lines together with the versions of the dependencies,
+and compared with the previous entry in the history, so a regression shows when, e.g., a dependency is
+added or updated.
+
+Run from the root of the repository:
+    python benchmarks/plugin_startup.py [--runs RUNS] [--history PATH] [--no-history]
+"""
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib import metadata
+from typing import Dict, List, Optional
+
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history", "plugin_startup.jsonl")
+
+DEPENDENCIES = ["pylint", "astroid", "mypy", "pandas", "numpy"]
+
+LIBRARIES = {"scikitlearn": "KMeans", "pytorch": "SGD", "tensorflow": "Adam"}
+
+# A measurement regresses when it takes longer by both this fraction and this number of seconds.
+REGRESSION_FRACTION = 0.1
+REGRESSION_SECONDS = 0.005
+
+
+def measure_in_process(eager: bool) -> Dict[str, float]:
+    """
+    Measure the startup of the plugin in this process, which is a new interpreter.
+
+    :param eager: Whether to import the modules of all checkers before registering them.
+    :return: The measurements in seconds by their names.
+    """
+    # pylint: disable = import-outside-toplevel
+    start = time.perf_counter()
+    from pylint.lint import PyLinter
+    results = {"import_pylint": time.perf_counter() - start}
+
+    start = time.perf_counter()
+    import dslinter
+    from dslinter.plugin import CHECKERS
+    from dslinter.utils.lazy_checker import LazyChecker
+    results["import_plugin"] = time.perf_counter() - start
+
+    if eager:
+        start = time.perf_counter()
+        for checker_class in CHECKERS:
+            importlib.import_module(checker_class.rsplit(".", 1)[0])
+        dslinter.register(PyLinter())
+        return {"register_eager": time.perf_counter() - start}
+
+    start = time.perf_counter()
+    LazyChecker.manifest()
+    results["load_manifest"] = time.perf_counter() - start
+
+    linter = PyLinter()
+    start = time.perf_counter()
+    dslinter.register(linter)
+    results["register"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from dslinter.utils.resources import Resources
+    Resources.get_signature_database()
+    results["open_signature_database"] = time.perf_counter() - start
+    for library, name in LIBRARIES.items():
+        start = time.perf_counter()
+        Resources.get_hyperparameters(library)[name]  # pylint: disable = expression-not-assigned
+        results["lookup_signature_" + library] = time.perf_counter() - start
+
+    if hasattr(os, "fork"):
+        for checker_class in CHECKERS:
+            module_name = checker_class.rsplit(".", 1)[0]
+            results["import_checker:" + module_name] = import_in_fork(module_name)
+    return results
+
+
+def import_in_fork(module_name: str) -> float:
+    """
+    Measure the time to import a module in a forked process, so the modules it imports are not imported yet.
+
+    :param module_name: Name of the module.
+    :return: The time in seconds.
+    """
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        start = time.perf_counter()
+        importlib.import_module(module_name)
+        os.write(write, repr(time.perf_counter() - start).encode())
+        os._exit(0)  # pylint: disable = protected-access
+    os.close(write)
+    with os.fdopen(read) as file_handler:
+        duration = float(file_handler.read())
+    os.waitpid(pid, 0)
+    return duration
+
+
+def run(args: List[str]) -> float:
+    """
+    Measure the time of running a command in a new process.
+
+    :param args: The command.
+    :return: The time in seconds.
+    """
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    start = time.perf_counter()
+    subprocess.run(args, check=True, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def measure(runs: int) -> Dict[str, float]:
+    """
+    Measure the startup of the plugin.
+
+    :param runs: Number of runs of every measurement.
+    :return: The median of every measurement in seconds by its name.
+    """
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    samples: Dict[str, List[float]] = {}
+    for eager in (False, True):
+        for _ in range(runs):
+            args = [sys.executable, os.path.abspath(__file__), "--in-process"] + (["--eager"] if eager else [])
+            output = subprocess.run(args, check=True, env=env, capture_output=True, text=True).stdout
+            for name, duration in json.loads(output).items():
+                samples.setdefault(name, []).append(duration)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "module.py")
+        with open(path, "w", encoding="utf-8") as file_handler:
+            file_handler.write('"""Module."""\nimport pandas as pd\n\nprint(pd.DataFrame())\n')
+        pylint = [sys.executable, "-m", "pylint", "--load-plugins=dslinter", "--persistent=n", "-rn", "-sn"]
+        for _ in range(runs):
+            samples.setdefault("first_module", []).append(run(pylint + [path]))
+            samples.setdefault("first_module_import", []).append(
+                run(pylint + ["--disable=all", "--enable=import", path])
+            )
+    return {name: statistics.median(durations) for name, durations in samples.items()}
+
+
+def environment() -> Dict[str, Optional[str]]:
+    """
+    Describe the environment of the measurements.
+
+    :return: The versions of python and the dependencies, and the commit of the repository.
+    """
+    described = {"python": platform.python_version(), "platform": platform.platform()}
+    for dependency in DEPENDENCIES:
+        try:
+            described[dependency] = metadata.version(dependency)
+        except metadata.PackageNotFoundError:
+            described[dependency] = None
+    try:
+        described["commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        described["commit"] = None
+    return described
+
+
+def previous_entry(history: str) -> Optional[Dict]:
+    """
+    Read the last entry of a history.
+
+    :param history: Path of the history.
+    :return: The entry or None when the history is empty.
+    """
+    if not os.path.exists(history):
+        return None
+    with open(history, encoding="utf-8") as file_handler:
+        lines = [line for line in file_handler if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def report(results: Dict[str, float], previous: Optional[Dict]) -> int:
+    """
+    Print the measurements, compared with the previous entry of the history.
+
+    :param results: The measurements.
+    :param previous: The previous entry or None.
+    :return: The number of regressions.
+    """
+    regressions = 0
+    previous_results = previous["results"] if previous is not None else {}
+    for name, duration in sorted(results.items()):
+        line = "{:<80} {:8.4f}s".format(name, duration)
+        if name in previous_results:
+            difference = duration - previous_results[name]
+            line += " {:+8.4f}s".format(difference)
+            if difference > REGRESSION_SECONDS and difference > REGRESSION_FRACTION * previous_results[name]:
+                line += " REGRESSION"
+                regressions += 1
+        print(line)
+    return regressions
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark of the startup time of the plugin.")
+    parser.add_argument("--runs", type=int, default=5, help="number of runs of every measurement")
+    parser.add_argument("--history", default=HISTORY, help="history of JSON lines to append the measurements to")
+    parser.add_argument("--no-history", action="store_true", help="do not append the measurements to the history")
+    parser.add_argument("--in-process", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--eager", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.in_process:
+        print(json.dumps(measure_in_process(args.eager)))
+        return
+
+    results = measure(args.runs)
+    previous = previous_entry(args.history)
+    regressions = report(results, previous)
+    if previous is not None:
+        print("{} regressions compared with {}".format(regressions, previous["date"]))
+    if not args.no_history:
+        entry = {
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "runs": args.runs,
+            "environment": environment(),
+            "results": results,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        with open(args.history, "a", encoding="utf-8") as file_handler:
+            file_handler.write(json.dumps(entry, sort_keys=True) + "\n")
+
+
+if __name__ == "__main__":
+    main()
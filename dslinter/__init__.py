@@ -9,3 +9,4 @@ if sys.version_info < (3,):
     raise DeprecationWarning("Python 2 is not supported. Please migrate to Python 3!")
 
 register = plugin.register  # pylint: disable=invalid-name
+load_configuration = plugin.load_configuration  # pylint: disable=invalid-name
@@ -0,0 +1,4 @@
+"""Run dslinter with python -m dslinter."""
+from dslinter.cli import main
+
+main()
@@ -1,6 +1,7 @@
 """Checker which checks whether chain indexing is used in pandas code."""
 import astroid
 from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from pylint.interfaces import IAstroidChecker
 from typing import Dict
 
@@ -24,8 +25,10 @@ class ChainIndexingPandasChecker(BaseChecker):
     }
     options = ()
 
-    # [subscript node name, inferred type of object the function is called on]
-    _subscript_types: Dict[str, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [subscript node name, inferred type of object the function is called on]
+        self._subscript_types: Dict[str, str] = {}
 
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which libraries the variables are from. """
@@ -34,6 +37,14 @@ class ChainIndexingPandasChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget its inferred types.
+
+        :param _: Node which is left.
+        """
+        self._subscript_types = {}
+
     def visit_subscript(self, subscript_node: astroid.Subscript):
         """Visit subscript node and check whether there is chain indexing."""
         try:
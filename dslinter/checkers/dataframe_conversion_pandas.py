@@ -3,6 +3,7 @@ from typing import Dict
 import astroid
 from pylint.interfaces import IAstroidChecker
 from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 
 from dslinter.utils.exception_handler import ExceptionHandler
 
@@ -23,9 +24,11 @@ class DataframeConversionPandasChecker(BaseChecker):
     }
     options = ()
 
-    # [variable name, inferred type of object the function is called on]
-    _call_types: Dict[str, str] = {}
-    _imported_pandas = False
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [variable name, inferred type of object the function is called on]
+        self._call_types: Dict[str, str] = {}
+        self._imported_pandas = False
 
     def visit_import(self, import_node: astroid.Import):
         """Visit import node to see whether pandas is imported."""
@@ -36,6 +39,15 @@ class DataframeConversionPandasChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, import_node)
 
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget what is found in it.
+
+        :param _: Node which is left.
+        """
+        self._call_types = {}
+        self._imported_pandas = False
+
     def visit_call(self, call_node: astroid.Call):
         """Visit call node to see whether there is rule violation."""
         try:
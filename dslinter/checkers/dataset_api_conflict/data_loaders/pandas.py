@@ -5,10 +5,17 @@ Implements the supported data loading methods for the pandas library.
 import astroid
 import pandas as pd
 
+from dslinter.utils.result_cache import ResultCache
+
 def pandas_read_csv(call_node: astroid.Call) -> pd.DataFrame:
     """Loads the df using pandas load_csv"""
     # NOTE: At this point, I assume everything that's entered is a constant primitive.
     args = [arg.value for arg in call_node.args]
     kwargs = {kw.arg: kw.value.value for kw in call_node.keywords}
+    # The result of the module depends on the dataset, so a cached result is invalidated when it
+    # changes.
+    path = args[0] if args else kwargs.get("filepath_or_buffer")
+    if isinstance(path, str):
+        ResultCache.depend_on_file(call_node, path)
     df = pd.read_csv(*args, **kwargs)
     return df
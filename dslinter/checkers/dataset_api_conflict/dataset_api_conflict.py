@@ -1,18 +1,18 @@
 import astroid
 import logging
 
-from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
 
 from dslinter.checkers.dataset_api_conflict.data_context import DatasetTracker
 from dslinter.checkers.dataset_api_conflict.util import get_function_id_from_call
 from dslinter.checkers.dataset_api_conflict.api_contracts.supported import SUPPORTED
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class DatasetApiConflict(BaseChecker):
+class DatasetApiConflict(DispatchedCallChecker):
     __implements__ = IAstroidChecker
 
     name = "data-api-conflict"
@@ -30,10 +30,15 @@ class DatasetApiConflict(BaseChecker):
         self._data_context = DatasetTracker()
         super().__init__(linter)
 
+    def leave_module(self, _: astroid.Module):
+        """Forget the datasets of the module which is left."""
+        self._data_context = DatasetTracker()
+
     def visit_assign(self, assign_node: astroid.Assign):
         _ = self._data_context.add_dataset_from_assign(assign_node)
 
-    def visit_call(self, call_node: astroid.Call):
+    @CallDispatcher.handles(*{func_id.split(".")[-1] for func_id in SUPPORTED})
+    def check_call(self, call_node: astroid.Call):
         _ = self._handle_function_call(call_node)
 
     def _handle_function_call(self, call_node: astroid.Call) -> bool:
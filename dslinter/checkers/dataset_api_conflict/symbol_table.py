@@ -0,0 +1,186 @@
+"""Symbol table which resolves the names of a module to fully qualified ids."""
+import astroid
+
+from dslinter.utils.module_cache import ModuleCache
+
+
+class SymbolTable:
+    """
+    Maps the global names of a module to fully qualified ids, e.g., `pd` to `pandas` for
+    `import pandas as pd`, `SVC` to `sklearn.svm.SVC` for `from sklearn.svm import SVC` and `svc`
+    to `sklearn.svm.SVC` for `svc = SVC()`. The table is built once per module and kept next to the
+    module instead of on its nodes. Names defined in a function, e.g., its arguments, shadow the
+    globals and are resolved from their definition in the function.
+    """
+
+    def __init__(self, module: astroid.Module):
+        self._globals: "dict[str, list[astroid.NodeNG]]" = module.globals
+        self._symbols: "dict[str, str]" = {}
+        self._function_ids: "dict[astroid.Call, str]" = {}
+        # Names and local definitions which are being resolved, to stop at assignments which refer
+        # to themselves, e.g., `x = x.copy()`.
+        self._resolving: "set[str]" = set()
+        self._resolving_locals: "set[astroid.NodeNG]" = set()
+        for name in self._globals:
+            self._resolve(name)
+
+    @staticmethod
+    def for_module(module: astroid.Module) -> "SymbolTable":
+        """
+        Retrieves the symbol table of a module, which is built once and shared by all checkers.
+
+        Args:
+            module (astroid.Module): The module to retrieve the symbol table of.
+
+        Returns:
+            SymbolTable: The symbol table of the module.
+        """
+        return ModuleCache.get(module, "symbol_table", lambda: SymbolTable(module))
+
+    @staticmethod
+    def name_parts(call_node: astroid.Call) -> "list[str]":
+        """
+        Retrieves the names of the called function and the objects it is an attribute of,
+        e.g., `['svc', 'fit']`.
+
+        Raises:
+            ValueError: If the called function is not an `astroid.Attribute` or `astroid.Name`.
+        """
+        func = call_node.func
+        if not isinstance(func, (astroid.Attribute, astroid.Name)):
+            raise ValueError(
+                "Provided astroid.Call.func object is not astroid.Attribute or astroid.Name"
+            )
+
+        parts = []
+        current = func
+        while isinstance(current, astroid.Attribute):
+            parts.insert(0, current.attrname)
+            current = current.expr
+        if isinstance(current, astroid.Name):
+            parts.insert(0, current.name)
+        return parts
+
+    def lookup(self, name: str) -> str:
+        """
+        Retrieves the fully qualified id of a name, or the name itself when it is not resolved.
+        """
+        return self._symbols.get(name, name)
+
+    def function_id(self, call_node: astroid.Call, cache_result: bool = True) -> str:
+        """
+        Retrieves the full name of a called function, with its root resolved using the symbol table.
+
+        Args:
+            call_node (astroid.Call): The call to retrieve the full name of the called function of.
+            cache_result (bool): Whether to reuse and store the result in the table.
+
+        Raises:
+            ValueError: If the called function is not an `astroid.Attribute` or `astroid.Name`.
+        """
+        if cache_result and call_node in self._function_ids:
+            return self._function_ids[call_node]
+
+        parts = SymbolTable.name_parts(call_node)
+        if len(parts) > 0:
+            root = SymbolTable._root(call_node)
+            parts[0] = self._resolve_in_scope(root) if isinstance(root, astroid.Name) \
+                else self.lookup(parts[0])
+        function_id = ".".join(parts)
+
+        if cache_result:
+            self._function_ids[call_node] = function_id
+        return function_id
+
+    def _resolve(self, name: str) -> str:
+        if name in self._symbols:
+            return self._symbols[name]
+        if name in self._resolving or name not in self._globals:
+            return name
+
+        self._resolving.add(name)
+        # NOTE: I assume the first definition is the related one, like the previous lookups in
+        # globals did.
+        definition = self._globals[name][0]
+        symbol = name
+        if isinstance(definition, astroid.Import):
+            symbol = self._resolve_import(name, definition)
+        elif isinstance(definition, astroid.ImportFrom):
+            symbol = self._resolve_import_from(name, definition)
+        elif isinstance(definition, astroid.AssignName) \
+                and isinstance(definition.parent, astroid.Assign) \
+                and isinstance(definition.parent.value, astroid.Call):
+            symbol = self._resolve_call(definition.parent.value, name)
+        self._resolving.discard(name)
+
+        self._symbols[name] = symbol
+        return symbol
+
+    @staticmethod
+    def _root(call_node: astroid.Call) -> astroid.NodeNG:
+        root = call_node.func
+        while isinstance(root, astroid.Attribute):
+            root = root.expr
+        return root
+
+    def _resolve_in_scope(self, name_node: astroid.Name) -> str:
+        scope, definitions = name_node.lookup(name_node.name)
+        if isinstance(scope, astroid.Module) or len(definitions) == 0:
+            return self.lookup(name_node.name)
+
+        name = name_node.name
+        # NOTE: Like for the globals, I assume the first definition is the related one.
+        definition = definitions[0]
+        if definition in self._resolving_locals:
+            return name
+        self._resolving_locals.add(definition)
+        symbol = name
+        if isinstance(definition, astroid.Import):
+            symbol = self._resolve_import(name, definition)
+        elif isinstance(definition, astroid.ImportFrom):
+            symbol = self._resolve_import_from(name, definition)
+        elif isinstance(definition, astroid.AssignName) \
+                and isinstance(definition.parent, astroid.Assign) \
+                and isinstance(definition.parent.value, astroid.Call):
+            symbol = self._resolve_call_in_scope(definition.parent.value, name)
+        self._resolving_locals.discard(definition)
+        return symbol
+
+    def _resolve_call_in_scope(self, call_node: astroid.Call, name: str) -> str:
+        try:
+            parts = SymbolTable.name_parts(call_node)
+        except ValueError:
+            return name
+        root = SymbolTable._root(call_node)
+        if len(parts) > 0 and isinstance(root, astroid.Name):
+            parts[0] = self._resolve_in_scope(root)
+        return ".".join(parts)
+
+    def _resolve_call(self, call_node: astroid.Call, name: str) -> str:
+        try:
+            parts = SymbolTable.name_parts(call_node)
+        except ValueError:
+            return name
+        if len(parts) > 0:
+            parts[0] = self._resolve(parts[0])
+        return ".".join(parts)
+
+    @staticmethod
+    def _resolve_import(name: str, import_node: astroid.Import) -> str:
+        for module_name, alias in import_node.names:
+            if alias == name:
+                return module_name
+            # `import sklearn.svm` binds `sklearn`.
+            if alias is None and module_name.split(".")[0] == name:
+                return name
+        return name
+
+    @staticmethod
+    def _resolve_import_from(name: str, import_node: astroid.ImportFrom) -> str:
+        # NOTE: Relative imports are not resolved, as the package of the module is not known here.
+        if import_node.level:
+            return name
+        for imported_name, alias in import_node.names:
+            if (alias or imported_name) == name:
+                return f"{import_node.modname}.{imported_name}"
+        return name
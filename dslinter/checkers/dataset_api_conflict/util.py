@@ -3,64 +3,40 @@ from collections.abc import Sequence, Mapping
 
 import logging
 
+from dslinter.checkers.dataset_api_conflict.symbol_table import SymbolTable
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 def get_function_id_from_call(call_node: astroid.Call,
-                              _globals: "Mapping[str, Sequence[astroid.Expr]] | None" = None,
                               search_globals: bool = True,
                               cache_result: bool = True) -> str:
-    """Retrieves the full name of a function."""
-    # TODO: Do something with imports in globals to resolve aliases.
-
+    """
+    Retrieves the full name of a function, e.g., `pandas.read_csv` for `pd.read_csv(path)` after
+    `import pandas as pd`.
+
+    The root of the name is resolved using the symbol table of the module, which maps imported names
+    and names assigned from calls to their fully qualified ids. Names defined in the function the
+    call is in shadow the globals.
+
+    Args:
+        call_node (astroid.Call): The call to retrieve the full name of the called function of.
+        search_globals (bool): Whether to resolve the root of the name using the symbol table of the
+            module.
+        cache_result (bool): Whether to reuse and store the result in the symbol table.
+
+    Raises:
+        ValueError: If the node is not an `astroid.Call` or it does not call an `astroid.Attribute`
+            or `astroid.Name`.
+    """
     if not isinstance(call_node, astroid.Call):
         raise ValueError("The provided node is not an astroid.Call object.")
-    
-    # Uses cached results if possible.
-    if cache_result:
-        full_name = getattr(call_node, 'full_name', None)
-        if full_name:
-            return full_name
-
-    func = call_node.func
-    if not isinstance(func, (astroid.Attribute, astroid.Name)):
-        raise ValueError("Provided astroid.Call.func object is not astroid.Attribute or astroid.Name")
-    
-    parts = []
-    
-    # Resolves attributes untili name is found.
-    current = func
-    while isinstance(current, astroid.Attribute):
-        parts.insert(0, current.attrname)
-        current = current.expr
-    if isinstance(current, astroid.Name):
-        parts.insert(0, current.name)
-
-    # Loads globals if necessary/wanted
-    if _globals is None and search_globals:
-        module = get_expr_module(call_node)
-        # TODO: This should probably not be called globals, nor should it only consider globals (think about function scope etc.)
-        _globals = module.globals
-
-    # Resolves the root using globals (e.g., when its an imported call or a call on an object).
-    root = parts[0]
-    if not _globals is None and root in _globals:
-        # NOTE: I assume there's only one related global; not sure in what cases there would be multiple, though.
-        global_root = _globals[root][0]
-        # NOTE: I assume this is an assign with a call as the value, not an import. This is completely unreasonable.
-        if isinstance(global_root, astroid.AssignName):
-            global_root = global_root.parent.value
-            root_name = get_function_id_from_call(global_root, _globals)
-            parts = parts[1:]
-            parts.insert(0, root_name)
-    
-    full_name = ".".join(parts)
 
-    if cache_result:
-        setattr(call_node, "full_name", full_name)
+    if not search_globals:
+        return ".".join(SymbolTable.name_parts(call_node))
 
-    return full_name
+    return SymbolTable.for_module(get_expr_module(call_node)).function_id(call_node, cache_result)
     
 
 def get_expr_module(expr: astroid.Expr) -> astroid.Module:
@@ -1,12 +1,12 @@
 """Checker that checks whether datatype is set when dataframe is imported from data."""
 import astroid as astroid
-from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
 
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
 from dslinter.utils.exception_handler import ExceptionHandler
 
 
-class DatatypePandasChecker(BaseChecker):
+class DatatypePandasChecker(DispatchedCallChecker):
     """Checker that checks whether datatype is set when a dataframe is imported from data."""
 
     __implements__ = IAstroidChecker
@@ -24,7 +24,8 @@ class DatatypePandasChecker(BaseChecker):
 
     _data_import_functions = ["read_csv", "read_table", "read_excel"]
 
-    def visit_call(self, call_node: astroid.Call):
+    @CallDispatcher.handles(*_data_import_functions)
+    def check_call(self, call_node: astroid.Call):
         """
         Vist call node and see whether datatype is set when a dataframe is imported from data.
         :param call_node:
@@ -1,13 +1,14 @@
 """Checker which checks whether self.net() is used to forward the input into the network in PyTorch instead of self.net.forward()."""
 import astroid
-from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from pylint.interfaces import IAstroidChecker
 
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.randomness_control_helper import has_import
 
 
-class ForwardPytorchChecker(BaseChecker):
+class ForwardPytorchChecker(DispatchedCallChecker):
     """Checker which checks whether self.net() is used to forward the input into the network in PyTorch instead of self.net.forward()."""
 
     __implements__ = IAstroidChecker
@@ -23,13 +24,16 @@ class ForwardPytorchChecker(BaseChecker):
     }
     options = ()
 
-    _import_torch = False
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self._import_torch = False
 
     def visit_import(self, import_node: astroid.Import):
         if self._import_torch is False:
             self._import_torch = has_import(import_node, "torch")
 
-    def visit_call(self, call_node: astroid.Call):
+    @CallDispatcher.handles("forward")
+    def check_call(self, call_node: astroid.Call):
         """
         When a Call node is visited, check whether it violated the rule in this checker.
         :param call_node: The node which is visited.
@@ -65,5 +69,10 @@ class ForwardPytorchChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, call_node)
 
-    def leave_module(self, module: astroid.Module):
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget whether torch is imported in it.
+
+        :param _: Node which is left.
+        """
         self._import_torch = False
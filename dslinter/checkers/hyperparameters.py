@@ -1,5 +1,5 @@
 """Hyperparameter checker checks whether all hyperparameters for learning algorithms are set."""
-from typing import List, Dict
+from typing import Collection, List, Mapping
 import astroid
 from pylint.lint import PyLinter
 from pylint.checkers import BaseChecker
@@ -28,6 +28,14 @@ class HyperparameterChecker(BaseChecker):
         except:
             ExceptionHandler.handle(self, node)
 
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget the names imported in it.
+
+        :param _: Node which is left.
+        """
+        self.call_types = {}
+
     def visit_call(self, node: astroid.Call):
         """
         When a Call node is visited, check whether hyperparameters are set.
@@ -78,12 +86,12 @@ class HyperparameterChecker(BaseChecker):
                 elif len(node.args) == 0 and node.keywords is None:
                     self.add_message(self.MESSAGE, node=node)
 
-    def has_required_hyperparameters(self, node: astroid.Call, hyperparameters: Dict, name: str):
+    def has_required_hyperparameters(self, node: astroid.Call, hyperparameters: Mapping, name: str):
         """
         Evaluate whether a function call has all required hyperparameters defined.
 
         :param node: Node which is visited.
-        :param hyperparameters: Dict of functions with their required hyperparameters.
+        :param hyperparameters: Mapping of functions with their required hyperparameters.
         :return: True when all required hyperparameters are defined.
         """
         return len(node.args) >= hyperparameters[name]["positional"] or self.has_keywords(
@@ -91,7 +99,7 @@ class HyperparameterChecker(BaseChecker):
         )
 
     @staticmethod
-    def has_keywords(keywords: List[astroid.Keyword], keywords_goal: List[str]) -> bool:
+    def has_keywords(keywords: List[astroid.Keyword], keywords_goal: Collection[str]) -> bool:
         """
         Check if a list of keywords contains certain keywords.
 
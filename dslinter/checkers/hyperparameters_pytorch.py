@@ -33,7 +33,7 @@ class HyperparameterPyTorchChecker(HyperparameterChecker):
 
     def __init__(self, linter: PyLinter = HyperparameterChecker):
         super().__init__(linter)
-        self.HYPERPARAMETER_RESOURCE = "hyperparameters_pytorch_dict.pickle"
+        self.HYPERPARAMETER_RESOURCE = "pytorch"
         self.MESSAGE = "hyperparameters-pytorch"
         self.HYPERPARAMETERS_MAIN = {
             # dataloader
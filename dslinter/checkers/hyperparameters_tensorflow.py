@@ -36,7 +36,7 @@ class HyperparameterTensorflowChecker(HyperparameterChecker):
 
     def __init__(self, linter: PyLinter = HyperparameterChecker):
         super().__init__(linter)
-        self.HYPERPARAMETER_RESOURCE = "hyperparameters_tensorflow_dict.pickle"
+        self.HYPERPARAMETER_RESOURCE = "tensorflow"
         self.MESSAGE = "hyperparameters-tensorflow"
         self.HYPERPARAMETERS_MAIN = {
             # training
@@ -2,6 +2,7 @@
 from typing import Dict
 import astroid
 from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from pylint.interfaces import IAstroidChecker
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.inplace_helper import inplace_is_true
@@ -24,8 +25,10 @@ class InPlacePandasChecker(BaseChecker):
     }
     options = ()
 
-    # [node, inferred type of object the function is called on]
-    _call_types: Dict[astroid.Call, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [node, inferred type of object the function is called on]
+        self._call_types: Dict[astroid.Call, str] = {}
 
     # Whitelisted functions for which a DataFrame does not have to be assigned.
     WHITELISTED = [
@@ -75,6 +78,12 @@ class InPlacePandasChecker(BaseChecker):
         "to_***",
     ]
 
+    def open(self):
+        """Register the type inference query of this checker with the pre-pass."""
+        TypeInference.register_prepass_query(
+            astroid.Call, TypeInference.called_object_name, TypeInference.DATAFRAME_LIBRARIES
+        )
+
     def visit_module(self, module: astroid.Module):
         """
         When an Module node is visited, scan for Call nodes and get type the function is called on.
@@ -84,10 +93,20 @@ class InPlacePandasChecker(BaseChecker):
         try:
             # noinspection PyTypeChecker
             # pylint: disable = line-too-long
-            self._call_types = TypeInference.infer_types(module, astroid.Call, lambda x: x.func.expr.name)
+            self._call_types = TypeInference.infer_types(
+                module, astroid.Call, TypeInference.called_object_name, TypeInference.DATAFRAME_LIBRARIES
+            )
         except:  # pylint: disable=bare-except
             ExceptionHandler.handle(self, module)
 
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget its inferred types.
+
+        :param _: Node which is left.
+        """
+        self._call_types = {}
+
     def visit_call(self, node: astroid.Call):
         """
         When a Call node is visited, add messages if it violated the defined rules.
@@ -1,13 +1,15 @@
 """Checker which checks whether there are possible invalid value unmasked."""
 import astroid
-from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from pylint.interfaces import IAstroidChecker
 
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
+from dslinter.utils.call_pattern import CallPatterns
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.type_inference import TypeInference
 
 
-class MaskMissingPytorchChecker(BaseChecker):
+class MaskMissingPytorchChecker(DispatchedCallChecker):
     """Checker which checks whether there are possible invalid value unmasked."""
 
     __implements__ = IAstroidChecker
@@ -24,7 +26,13 @@ class MaskMissingPytorchChecker(BaseChecker):
 
     options = ()
 
-    _variables_with_processing_operation = {}
+    _UNMASKED_LOG = CallPatterns.register(
+        "pytorch-unmasked-log", "torch.log(!*.{clip,clamp}(...), ...)"
+    )
+
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self._variables_with_processing_operation = {}
 
     def visit_module(self, module: astroid.Module):
         try:
@@ -32,7 +40,16 @@ class MaskMissingPytorchChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
-    def visit_call(self, call_node: astroid.Call):
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget its inferred types.
+
+        :param _: Node which is left.
+        """
+        self._variables_with_processing_operation = {}
+
+    @CallDispatcher.handles("log")
+    def check_call(self, call_node: astroid.Call):
         """
         Visit call node to see whether there are rules violations.
         :param call_node:
@@ -42,22 +59,9 @@ class MaskMissingPytorchChecker(BaseChecker):
         try:
             _has_log = False
             _has_mask = False
-            if (
-                hasattr(call_node.func, "attrname")
-                and call_node.func.attrname == "log"
-                and hasattr(call_node.func, "expr")
-                and hasattr(call_node.func.expr, "name")
-                and call_node.func.expr.name == "torch"
-            ):
+            # The log is called on a variable which is not masked in the call itself.
+            if self._UNMASKED_LOG in CallPatterns.matches(call_node):
                 _has_log = True
-            if(
-                hasattr(call_node, "args")
-                and len(call_node.args) > 0
-                and hasattr(call_node.args[0], "func")
-                and hasattr(call_node.args[0].func, "attrname")
-                and call_node.args[0].func.attrname in ["clip", "clamp"]
-            ):
-                _has_mask = True
             if(
                 hasattr(call_node, "args")
                 and len(call_node.args) > 0
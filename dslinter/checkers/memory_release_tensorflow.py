@@ -2,6 +2,7 @@
 from typing import Dict
 import astroid
 from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.type_inference import TypeInference
 
@@ -12,11 +13,11 @@ class MemoryReleaseTensorflowChecker(BaseChecker):
     name = "memory-release-tensorflow"
     priority = -1
     msgs = {
-        "W5506":{
+        "W5506":(
             "The memory has not freed in time.",
             "memory-release-tensorflow",
             "The `clean_session()` can be used to free memory in the loop."
-        }
+        )
     }
     options = ()
 
@@ -25,8 +26,10 @@ class MemoryReleaseTensorflowChecker(BaseChecker):
         "Model"
     ]
 
-    # [variable name, inferred type of object the function is called on]
-    _variable_types: Dict[str, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [variable name, inferred type of object the function is called on]
+        self._variable_types: Dict[str, str] = {}
 
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which library the variables are from. """
@@ -35,6 +38,14 @@ class MemoryReleaseTensorflowChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget its inferred types.
+
+        :param _: Node which is left.
+        """
+        self._variable_types = {}
+
     def visit_for(self, node: astroid.For):
         """Evaluate whether memory is freed in a loop with model creation."""
         try:
@@ -1,14 +1,15 @@
 """Checker which checks whether the parameters for merge operations are set."""
 import astroid as astroid
 from pylint.interfaces import IAstroidChecker
-from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from typing import Dict
 
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.type_inference import TypeInference
 
 
-class MergeParameterPandasChecker(BaseChecker):
+class MergeParameterPandasChecker(DispatchedCallChecker):
     """Checker which checks whether the parameters for merge operations are set."""
 
     __implements__ = IAstroidChecker
@@ -24,8 +25,10 @@ class MergeParameterPandasChecker(BaseChecker):
     }
     options = ()
 
-    # [variable name, inferred type of object the function is called on]
-    _subscript_types: Dict[str, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [variable name, inferred type of object the function is called on]
+        self._subscript_types: Dict[str, str] = {}
 
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which library the variables are from. """
@@ -34,7 +37,16 @@ class MergeParameterPandasChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
-    def visit_call(self, call_node: astroid.Call):
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget its inferred types.
+
+        :param _: Node which is left.
+        """
+        self._subscript_types = {}
+
+    @CallDispatcher.handles("merge")
+    def check_call(self, call_node: astroid.Call):
         """Visit call node and check whether the parameters are set."""
         # call on pandas dataframe object && name "merge" && check parameter
         try:
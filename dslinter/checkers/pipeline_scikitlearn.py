@@ -1,16 +1,16 @@
 """Checker which checks rules for preventing data leakage between training and test data."""
-from typing import List
+from typing import FrozenSet, List
 
 import astroid
-from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
 
 from dslinter.utils.ast import AssignUtil
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.resources import Resources
 
 
-class PipelineScikitLearnChecker(BaseChecker):
+class PipelineScikitLearnChecker(DispatchedCallChecker):
     """Checker which checks rules for preventing data leakage between training and test data."""
 
     __implements__ = IAstroidChecker
@@ -54,7 +54,8 @@ class PipelineScikitLearnChecker(BaseChecker):
         "SelectKBest",
     ]
 
-    def visit_call(self, call_node: astroid.Call):
+    @CallDispatcher.handles(*LEARNING_FUNCTIONS)
+    def check_call(self, call_node: astroid.Call):
         """
         When a Call node is visited, check whether it violated the rules in this checker.
 
@@ -124,20 +125,16 @@ class PipelineScikitLearnChecker(BaseChecker):
         )
 
     @staticmethod
-    def _get_estimator_classes() -> List[str]:
+    def _get_estimator_classes() -> FrozenSet[str]:
         """
         Get all estimator classes.
 
-        The list contains all learning classes which do something in the
+        The set contains all learning classes which do something in the
         fit function from sklearn.
 
-        :return: List of estimator classes.
+        :return: Set of estimator classes.
         """
-        # pylint: disable = line-too-long
-        learning_classes = list(Resources.get_hyperparameters("hyperparameters_scikitlearn_dict.pickle").keys())
-        estimator_classes = learning_classes
-        assert None not in estimator_classes
-        return estimator_classes
+        return Resources.get_learning_classes("scikitlearn")
 
     def _call_initiates_preprocessor(self, call: astroid.Call) -> bool:
         """
@@ -1,12 +1,13 @@
 """Checker which checks whether random seed is set in pytorch dataloader"""
 from pylint.interfaces import IAstroidChecker
-from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 import astroid
 
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
 from dslinter.utils.exception_handler import ExceptionHandler
 
 
-class RandomnessControlDataloaderPytorchChecker(BaseChecker):
+class RandomnessControlDataloaderPytorchChecker(DispatchedCallChecker):
     """Checker which checks whether random seed is set in pytorch dataloader"""
     __implements__ = IAstroidChecker
 
@@ -21,7 +22,9 @@ class RandomnessControlDataloaderPytorchChecker(BaseChecker):
     }
     options = ()
 
-    _import_dataloader = False
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self._import_dataloader = False
 
     def visit_importfrom(self, importfrom_node: astroid.ImportFrom):
         """
@@ -39,7 +42,16 @@ class RandomnessControlDataloaderPytorchChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, importfrom_node)
 
-    def visit_call(self, node: astroid.Call):
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget whether DataLoader is imported in it.
+
+        :param _: Node which is left.
+        """
+        self._import_dataloader = False
+
+    @CallDispatcher.handles("DataLoader")
+    def check_call(self, node: astroid.Call):
         """
         Check whether there is a rule violation.
         :param node:
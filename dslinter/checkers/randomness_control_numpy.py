@@ -3,6 +3,7 @@ from pylint.interfaces import IAstroidChecker
 from pylint.checkers import BaseChecker
 import astroid
 
+from dslinter.utils.call_pattern import CallPatterns
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.randomness_control_helper import check_main_module, has_import, has_importfrom_sklearn
 
@@ -33,6 +34,8 @@ class RandomnessControlNumpyChecker(BaseChecker):
         ),
     )
 
+    _NUMPY_MANUAL_SEED = CallPatterns.register("numpy-manual-seed", "{np,numpy}.random.seed(...)")
+
     def visit_module(self, module: astroid.Module):
         """
         Check whether there is a rule violation.
@@ -88,15 +91,4 @@ class RandomnessControlNumpyChecker(BaseChecker):
 
     @staticmethod
     def _check_numpy_manual_seed_in_call_node(call_node: astroid.Call):
-        if(
-            hasattr(call_node, "func")
-            and hasattr(call_node.func, "attrname")
-            and call_node.func.attrname == "seed"
-            and hasattr(call_node.func.expr, "attrname")
-            and call_node.func.expr.attrname == "random"
-            and hasattr(call_node.func.expr, "expr")
-            and hasattr(call_node.func.expr.expr, "name")
-            and call_node.func.expr.expr.name in ["np", "numpy"]
-        ):
-            return True
-        return False
+        return RandomnessControlNumpyChecker._NUMPY_MANUAL_SEED in CallPatterns.matches(call_node)
@@ -3,6 +3,7 @@ from pylint.interfaces import IAstroidChecker
 from pylint.checkers import BaseChecker
 import astroid
 
+from dslinter.utils.call_pattern import CallPatterns
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.randomness_control_helper import check_main_module, has_import
 
@@ -33,6 +34,8 @@ class RandomnessControlPytorchChecker(BaseChecker):
         ),
     )
 
+    _PYTORCH_MANUAL_SEED = CallPatterns.register("pytorch-manual-seed", "*.manual_seed(...)")
+
     def visit_module(self, module: astroid.Module):
         """
         Check whether there is a rule violation.
@@ -80,10 +83,5 @@ class RandomnessControlPytorchChecker(BaseChecker):
 
     @staticmethod
     def _check_pytorch_manual_seed_in_call_node(call_node: astroid.Call):
-        if(
-            hasattr(call_node, "func")
-            and hasattr(call_node.func, "attrname")
-            and call_node.func.attrname == "manual_seed"
-        ):
-            return True
-        return False
+        manual_seed = RandomnessControlPytorchChecker._PYTORCH_MANUAL_SEED
+        return manual_seed in CallPatterns.matches(call_node)
@@ -2,13 +2,12 @@
 from typing import List
 import traceback
 import astroid
-from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
 from dslinter.utils.exception_handler import ExceptionHandler
-from dslinter.utils.resources import Resources
 
 
-class RandomnessControlScikitLLearnChecker(BaseChecker):
+class RandomnessControlScikitLLearnChecker(DispatchedCallChecker):
     """Checker which checks rules for controlling randomness."""
 
     __implements__ = IAstroidChecker
@@ -47,10 +46,8 @@ class RandomnessControlScikitLLearnChecker(BaseChecker):
         # "TimeSeriesSplit"
     ]
 
-    _HYPERPARAMETER_RESOURCE = "hyperparameters_scikitlearn_dict.pickle"
-    _estimators_all = Resources.get_hyperparameters(_HYPERPARAMETER_RESOURCE)
-
-    def visit_call(self, node: astroid.Call):
+    @CallDispatcher.handles(*SPLITTER_FUNCTIONS, *SPLITTER_CLASSES)
+    def check_call(self, node: astroid.Call):
         """
         When a Call node is visited, check whether it violated the rules in this checker.
 
@@ -3,6 +3,7 @@ from pylint.interfaces import IAstroidChecker
 from pylint.checkers import BaseChecker
 import astroid
 
+from dslinter.utils.call_pattern import CallPatterns
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.randomness_control_helper import check_main_module, has_import
 
@@ -33,6 +34,10 @@ class RandomnessControlTensorflowChecker(BaseChecker):
         ),
     )
 
+    _TENSORFLOW_MANUAL_SEED = CallPatterns.register(
+        "tensorflow-manual-seed", "{tf,tensorflow}.random.set_seed(...)"
+    )
+
     def visit_module(self, module: astroid.Module):
         """
         Check whether there is a rule violation.
@@ -80,15 +85,5 @@ class RandomnessControlTensorflowChecker(BaseChecker):
 
     @staticmethod
     def _check_tensorflow_manual_seed_in_call_node(call_node: astroid.Call):
-        if(
-            hasattr(call_node, "func")
-            and hasattr(call_node.func, "attrname")
-            and call_node.func.attrname == "set_seed"
-            and hasattr(call_node.func.expr, "attrname")
-            and call_node.func.expr.attrname == "random"
-            and hasattr(call_node.func.expr, "expr")
-            and hasattr(call_node.func.expr.expr, "name")
-            and call_node.func.expr.expr.name in ["tf", "tensorflow"]
-        ):
-            return True
-        return False
+        manual_seed = RandomnessControlTensorflowChecker._TENSORFLOW_MANUAL_SEED
+        return manual_seed in CallPatterns.matches(call_node)
@@ -2,13 +2,13 @@
 import traceback
 from typing import List
 import astroid
-from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from dslinter.utils.call_dispatcher import CallDispatcher, DispatchedCallChecker
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.ast import AssignUtil
 
 
-class ScalerMissingScikitLearnChecker(BaseChecker):
+class ScalerMissingScikitLearnChecker(DispatchedCallChecker):
     """Checker checks whether scaler is added before scaling-sensitive operations."""
 
     __implements__ = IAstroidChecker
@@ -56,9 +56,8 @@ class ScalerMissingScikitLearnChecker(BaseChecker):
         "transform",
     ]
 
-    Variables = []
-
-    def visit_call(self, node: astroid.Call):
+    @CallDispatcher.handles(*PIPELINE, *LEARNING_FUNCTIONS)
+    def check_call(self, node: astroid.Call):
         """
         When a node is visited, add a message if the rule is violated.
         :param node:
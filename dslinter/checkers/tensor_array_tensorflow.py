@@ -1,6 +1,7 @@
 """Checker which checks whether tf.TensorArray() is used for growing array in the loop in tensorflow code. """
 import astroid
 from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from pylint.interfaces import IAstroidChecker
 
 from dslinter.utils.exception_handler import ExceptionHandler
@@ -24,8 +25,10 @@ class TensorArrayTensorflowChecker(BaseChecker):
     }
     options = ()
 
-     # [variable name, inferred type of object the function is called on]
-    _variable_types: Dict[str, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [variable name, inferred type of object the function is called on]
+        self._variable_types: Dict[str, str] = {}
 
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which libraries the variables are from."""
@@ -34,6 +37,14 @@ class TensorArrayTensorflowChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget its inferred types.
+
+        :param _: Node which is left.
+        """
+        self._variable_types = {}
+
     def visit_for(self, for_node: astroid.For):
         """Visit for node and see whether the rule is violated."""
         try:
@@ -0,0 +1,147 @@
+"""Checker which holds the options of the type inference shared by the other checkers."""
+import astroid
+from pylint.checkers import BaseChecker
+from pylint.interfaces import IAstroidChecker
+from pylint.reporters.ureports.nodes import Table
+
+from dslinter.utils.module_cache import ModuleCache
+from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.type_inference_prepass import TypeInferencePrepass
+
+
+def report_fallbacks(sect, stats, _):
+    """
+    Report the number of modules of which the types are inferred heuristically.
+
+    :param sect: Section of the report to add the table to.
+    :param stats: Statistics of the current run.
+    """
+    fallbacks = stats.by_msg.get("type-inference-timeout", 0)
+    lines = ["", "number", "modules type checked heuristically", str(fallbacks)]
+    sect.append(Table(children=lines, cols=2, rheaders=1))
+
+
+class TypeInferenceChecker(BaseChecker):
+    """Checker which holds the options of the type inference shared by the other checkers."""
+
+    __implements__ = IAstroidChecker
+
+    name = "type-inference"
+    priority = -1
+    msgs = {
+        "I5501": (
+            "Type inference timed out, the types in this module are inferred heuristically.",
+            "type-inference-timeout",
+            "mypy took longer than the type-inference-timeout option allows on this module. The "
+            "checkers relying on type inference may miss or wrongly report issues in it.",
+        ),
+    }
+    reports = (("RP5501", "Type inference", report_fallbacks),)
+    options = (
+        (
+            "type-inference-cache-dir",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<directory>",
+                "help": "Directory to cache the types inferred by mypy in between runs. "
+                "The cache is disabled when no directory is given.",
+            },
+        ),
+        (
+            "type-inference-cache-size",
+            {
+                "default": 256,
+                "type": "int",
+                "metavar": "<megabytes>",
+                "help": "Maximum size of the type inference cache in megabytes.",
+            },
+        ),
+        (
+            "type-inference-prepass",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y_or_n>",
+                "help": "Infer the types of all modules of the linted package in a single mypy "
+                "run, instead of running mypy for every module separately.",
+            },
+        ),
+        (
+            "type-inference-prepass-jobs",
+            {
+                "default": 0,
+                "type": "int",
+                "metavar": "<n-processes>",
+                "help": "Number of processes the pre-pass splits the modules of the linted package "
+                "over, each type checking its share in a single mypy run. 0 means the number of "
+                "available cores.",
+            },
+        ),
+        (
+            "type-inference-backend",
+            {
+                "default": "mypy",
+                "type": "choice",
+                "choices": ["mypy", "dmypy", "propagation"],
+                "metavar": "<mypy_or_dmypy_or_propagation>",
+                "help": "Run mypy for every module (mypy), keep mypy running in its daemon "
+                "(dmypy), which keeps the stubs loaded in between modules, or infer the types "
+                "without mypy (propagation), from the library functions the variables are assigned "
+                "from.",
+            },
+        ),
+        (
+            "type-inference-dmypy-dir",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<directory>",
+                "help": "Directory of a persistent mypy daemon, which keeps running after linting "
+                "so it can be reused, e.g., when linting on save in an editor. Without a "
+                "directory, the daemon only runs while linting.",
+            },
+        ),
+        (
+            "type-inference-timeout",
+            {
+                "default": 0,
+                "type": "float",
+                "metavar": "<seconds>",
+                "help": "Maximum number of seconds mypy may take to type check a single module. "
+                "When mypy takes longer, the types in the module are inferred heuristically. 0 "
+                "means no limit. The limit does not apply to the mypy daemon.",
+            },
+        ),
+    )
+
+    def configure(self):
+        """Apply the options of this checker to the type inference."""
+        TypeInference.configure_cache(
+            self.config.type_inference_cache_dir,
+            self.config.type_inference_cache_size * 1024 * 1024,
+        )
+        TypeInference.prepass = (
+            TypeInferencePrepass(self.config.type_inference_prepass_jobs)
+            if self.config.type_inference_prepass
+            else None
+        )
+        TypeInference.configure_backend(
+            self.config.type_inference_backend, self.config.type_inference_dmypy_dir
+        )
+        TypeInference.timeout = self.config.type_inference_timeout
+
+    def leave_module(self, module: astroid.Module):
+        """
+        When a Module node is left, add a message if its types are inferred heuristically and
+        release the results shared for it between the checkers.
+
+        This checker is registered after all other checkers and is enabled with them, so the module
+        is left by all checkers before its results are released.
+
+        :param module: Node which is left.
+        """
+        if module in TypeInference.fallback_modules:
+            TypeInference.fallback_modules.discard(module)
+            self.add_message("type-inference-timeout", node=module)
+        ModuleCache.release(module)
@@ -2,6 +2,7 @@
 from typing import List
 from typing import Dict
 from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from pylint.interfaces import IAstroidChecker
 import astroid
 from dslinter.utils.exception_handler import ExceptionHandler
@@ -29,8 +30,16 @@ class UnnecessaryIterationPandasChecker(BaseChecker):
     }
     options = ()
 
-    # [node, inferred type of object the function is called on]
-    _call_types: Dict[astroid.Call, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [node, inferred type of object the function is called on]
+        self._call_types: Dict[astroid.Call, str] = {}
+
+    def open(self):
+        """Register the type inference query of this checker with the pre-pass."""
+        TypeInference.register_prepass_query(
+            astroid.Call, TypeInference.called_object_name, TypeInference.DATAFRAME_LIBRARIES
+        )
 
     def visit_module(self, node: astroid.Module):
         """
@@ -42,10 +51,19 @@ class UnnecessaryIterationPandasChecker(BaseChecker):
             # noinspection PyTypeChecker
             self._call_types = TypeInference.infer_types(node,
                                                          astroid.Call,
-                                                         lambda x: x.func.expr.name)
+                                                         TypeInference.called_object_name,
+                                                         TypeInference.DATAFRAME_LIBRARIES)
         except:  # pylint: disable=bare-except
             ExceptionHandler.handle(self, node)
 
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget its inferred types.
+
+        :param _: Node which is left.
+        """
+        self._call_types = {}
+
     def visit_call(self, node: astroid.Call):
         """
         When a Call node is visited, add messages if it violated the defined rules.
@@ -1,6 +1,7 @@
 """Check whether there is an unnecessary iteration in Tensorflow code."""
 from typing import Dict
 from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from pylint.interfaces import IAstroidChecker
 import astroid
 from dslinter.utils.exception_handler import ExceptionHandler
@@ -14,16 +15,18 @@ class UnnecessaryIterationTensorflowChecker(BaseChecker):
     name = "unnecessary-iteration-tensorflow"
     priority = -1
     msgs = {
-        "R5502": {
+        "R5502": (
             "There is an unnecessary iteration in the tensorflow code.",
             "unnecessary-iteration-tensorflow",
             "There is a efficient solution(Vectorization or Reduction) to replace the iteration.",
-        }
+        )
     }
     options = ()
 
-    # [variable name, inferred type of object the function is called on]
-    _variable_types: Dict[str, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [variable name, inferred type of object the function is called on]
+        self._variable_types: Dict[str, str] = {}
 
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which library the variables are from. """
@@ -32,6 +35,14 @@ class UnnecessaryIterationTensorflowChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    def leave_module(self, _: astroid.Module):
+        """
+        When a Module node is left, forget its inferred types.
+
+        :param _: Node which is left.
+        """
+        self._variable_types = {}
+
     def visit_for(self, node: astroid.For):
         """Evaluate whether there is an augmented assign in the loop, it can be replaced
             by a reduction operation, which is faster."""
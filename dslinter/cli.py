@@ -0,0 +1,114 @@
+"""Command line interface which runs the checkers of dslinter without the checkers of pylint."""
+import sys
+from typing import List, Optional, Sequence, Union
+
+from pylint import reporters
+from pylint.lint import PyLinter, Run
+
+from dslinter.utils.result_cache import ResultCache
+from dslinter.utils.scheduler import ScheduledCheck
+
+
+class DslinterLinter(PyLinter):
+    """
+    Linter which registers the checkers of dslinter instead of the checkers of pylint.
+
+    The options, configuration files, reporters and output of pylint are kept, so the messages are
+    reported in the format of pylint. With more than one job, the files are checked in parallel
+    processes scheduled by their size, see ScheduledCheck. With a result cache, only the files which
+    changed, or of which a dependency changed, are checked again, see ResultCache.
+    """
+
+    OPTIONS = (
+        (
+            "result-cache-dir",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<directory>",
+                "help": "Directory to cache the messages of every checked file in between runs. A "
+                "file is only checked again when it, a module it imports or a file read while "
+                "checking it changed, or when the configuration changed. The cache is disabled "
+                "when no directory is given.",
+            },
+        ),
+    )
+
+    def __init__(self, options=(), reporter=None, option_groups=(), pylintrc=None):
+        """
+        Create the linter, with the options of dslinter added to the options of pylint.
+
+        :param options: Options added by the run, e.g., 'rcfile'.
+        :param reporter: Reporter of the messages.
+        :param option_groups: Groups of the added options.
+        :param pylintrc: Path of the configuration file.
+        """
+        super().__init__(tuple(options) + DslinterLinter.OPTIONS, reporter, option_groups, pylintrc)
+
+    # Messages of the checkers of pylint which pylint enables when it runs, which are not registered
+    # here.
+    PYLINT_ENABLED_MESSAGES = ("c-extension-no-member",)
+
+    def enable(
+        self,
+        msgid: str,
+        scope: str = "package",
+        line: Optional[int] = None,
+        ignore_unknown: bool = False,
+    ):
+        """
+        Enable a message, like pylint does, ignoring the messages of pylint which pylint enables
+        when it runs.
+
+        :param msgid: Id or symbol of the message.
+        :param scope: 'package' or 'module'.
+        :param line: Line from which the message is enabled, None for the whole scope.
+        :param ignore_unknown: Whether to ignore a message which is not registered.
+        """
+        ignore_unknown = ignore_unknown or msgid in DslinterLinter.PYLINT_ENABLED_MESSAGES
+        super().enable(msgid, scope, line, ignore_unknown)
+
+    def load_default_plugins(self):
+        """Register the reporters of pylint and the checkers of dslinter."""
+        reporters.initialize(self)
+        self.load_plugin_modules(["dslinter"])
+        # Make sure to load the default reporter, like pylint does.
+        if not self.reporter:
+            self._load_reporters()
+
+    def check(self, files_or_modules: Union[Sequence[str], str]) -> None:
+        """
+        Check files or modules, in parallel processes when more than one job or a result cache is
+        configured.
+
+        :param files_or_modules: The files or modules to check.
+        """
+        cached = bool(self.config.result_cache_dir)
+        if (
+            self.config.from_stdin
+            or isinstance(files_or_modules, str)
+            or (self.config.jobs == 1 and not cached)
+        ):
+            super().check(files_or_modules)
+            return
+        self.initialize()
+        cache = None
+        if cached:
+            cache = ResultCache(self.config.result_cache_dir, ResultCache.configuration(self))
+        files = self._iterate_file_descrs(files_or_modules)
+        ScheduledCheck.check(self, self.config.jobs, files, files_or_modules, cache)
+
+
+class DslinterRun(Run):
+    """Run of pylint with the checkers of dslinter only."""
+
+    LinterClass = DslinterLinter
+
+
+def main(args: Optional[List[str]] = None):
+    """
+    Run dslinter from the command line.
+
+    :param args: The command line arguments, sys.argv[1:] when not given.
+    """
+    DslinterRun(sys.argv[1:] if args is None else args)
@@ -1,41 +1,62 @@
 """Main module for the plugin."""
-from dslinter.checkers.chain_indexing_pandas import ChainIndexingPandasChecker
-from dslinter.checkers.column_selection_pandas import ColumnSelectionPandasChecker
-from dslinter.checkers.dataframe_conversion_pandas import DataframeConversionPandasChecker
-from dslinter.checkers.datatype_pandas import DatatypePandasChecker
-from dslinter.checkers.dependent_threshold_pytorch import DependentThresholdPytorchChecker
-from dslinter.checkers.dependent_threshold_scikitlearn import DependentThresholdScikitLearnChecker
-from dslinter.checkers.dependent_threshold_tensorflow import DependentThresholdTensorflowChecker
-from dslinter.checkers.forward_pytorch import ForwardPytorchChecker
-from dslinter.checkers.gradient_clear_pytorch import GradientClearPytorchChecker
-from dslinter.checkers.imports import ImportChecker
-from dslinter.checkers.inplace_pandas import InPlacePandasChecker
-from dslinter.checkers.deprecated.inplace_numpy import InPlaceNumpyChecker
-from dslinter.checkers.mask_missing_pytorch import MaskMissingPytorchChecker
-from dslinter.checkers.mask_missing_tensorflow import MaskMissingTensorflowChecker
-from dslinter.checkers.memory_release_tensorflow import MemoryReleaseTensorflowChecker
-from dslinter.checkers.merge_parameter_pandas import MergeParameterPandasChecker
-from dslinter.checkers.deprecated.mode_toggling_pytorch import ModeTogglingPytorchChecker
-from dslinter.checkers.randomness_control_numpy import RandomnessControlNumpyChecker
-from dslinter.checkers.randomness_control_pytorch import RandomnessControlPytorchChecker
-# pylint: disable = line-too-long
-from dslinter.checkers.randomness_control_dataloader_pytorch import RandomnessControlDataloaderPytorchChecker
-# pylint: disable = line-too-long
-from dslinter.checkers.randomness_control_tensorflow import RandomnessControlTensorflowChecker
-from dslinter.checkers.randomness_control_scikitlearn import RandomnessControlScikitLLearnChecker
-from dslinter.checkers.tensor_array_tensorflow import TensorArrayTensorflowChecker
-from dslinter.checkers.unnecessary_iteration_pandas import UnnecessaryIterationPandasChecker
-from dslinter.checkers.unnecessary_iteration_tensorflow import UnnecessaryIterationTensorflowChecker
-from dslinter.checkers.deterministic_pytorch import DeterministicAlgorithmChecker
-from dslinter.checkers.pipeline_scikitlearn import PipelineScikitLearnChecker
-from dslinter.checkers.hyperparameters_pytorch import HyperparameterPyTorchChecker
-from dslinter.checkers.hyperparameters_tensorflow import HyperparameterTensorflowChecker
-# pylint: disable = line-too-long
-from dslinter.checkers.hyperparameters_scikitlearn import HyperparameterScikitLearnChecker
-from dslinter.checkers.nan_numpy import NanNumpyChecker
-from dslinter.checkers.scaler_missing_scikitlearn import ScalerMissingScikitLearnChecker
+import importlib
 
-from dslinter.checkers.dataset_api_conflict.dataset_api_conflict import DatasetApiConflict
+from dslinter.checkers.type_inference import TypeInferenceChecker
+from dslinter.utils.lazy_checker import LazyChecker
+
+# The checkers are imported when one of their messages is enabled, see LazyChecker.
+# After changing the name, priority, messages or options of a checker, regenerate the checker
+# manifest with dslinter/scripts/checkers_manifest.py.
+CHECKERS = [
+    "dslinter.checkers.imports.ImportChecker",
+    "dslinter.checkers.inplace_pandas.InPlacePandasChecker",
+    "dslinter.checkers.deprecated.inplace_numpy.InPlaceNumpyChecker",
+    "dslinter.checkers.unnecessary_iteration_pandas.UnnecessaryIterationPandasChecker",
+    "dslinter.checkers.unnecessary_iteration_tensorflow.UnnecessaryIterationTensorflowChecker",
+    "dslinter.checkers.scaler_missing_scikitlearn.ScalerMissingScikitLearnChecker",
+    "dslinter.checkers.hyperparameters_pytorch.HyperparameterPyTorchChecker",
+    "dslinter.checkers.hyperparameters_tensorflow.HyperparameterTensorflowChecker",
+    "dslinter.checkers.hyperparameters_scikitlearn.HyperparameterScikitLearnChecker",
+    "dslinter.checkers.memory_release_tensorflow.MemoryReleaseTensorflowChecker",
+    "dslinter.checkers.deterministic_pytorch.DeterministicAlgorithmChecker",
+    "dslinter.checkers.randomness_control_scikitlearn.RandomnessControlScikitLLearnChecker",
+    "dslinter.checkers.randomness_control_pytorch.RandomnessControlPytorchChecker",
+    "dslinter.checkers.randomness_control_dataloader_pytorch."
+    "RandomnessControlDataloaderPytorchChecker",
+    "dslinter.checkers.randomness_control_tensorflow.RandomnessControlTensorflowChecker",
+    "dslinter.checkers.randomness_control_numpy.RandomnessControlNumpyChecker",
+    "dslinter.checkers.pipeline_scikitlearn.PipelineScikitLearnChecker",
+    "dslinter.checkers.dependent_threshold_pytorch.DependentThresholdPytorchChecker",
+    "dslinter.checkers.dependent_threshold_tensorflow.DependentThresholdTensorflowChecker",
+    "dslinter.checkers.dependent_threshold_scikitlearn.DependentThresholdScikitLearnChecker",
+    "dslinter.checkers.mask_missing_tensorflow.MaskMissingTensorflowChecker",
+    "dslinter.checkers.mask_missing_pytorch.MaskMissingPytorchChecker",
+    "dslinter.checkers.nan_numpy.NanNumpyChecker",
+    "dslinter.checkers.chain_indexing_pandas.ChainIndexingPandasChecker",
+    "dslinter.checkers.merge_parameter_pandas.MergeParameterPandasChecker",
+    "dslinter.checkers.datatype_pandas.DatatypePandasChecker",
+    "dslinter.checkers.column_selection_pandas.ColumnSelectionPandasChecker",
+    "dslinter.checkers.dataframe_conversion_pandas.DataframeConversionPandasChecker",
+    "dslinter.checkers.tensor_array_tensorflow.TensorArrayTensorflowChecker",
+    "dslinter.checkers.forward_pytorch.ForwardPytorchChecker",
+    "dslinter.checkers.deprecated.mode_toggling_pytorch.ModeTogglingPytorchChecker",
+    "dslinter.checkers.gradient_clear_pytorch.GradientClearPytorchChecker",
+    "dslinter.checkers.dataset_api_conflict.dataset_api_conflict.DatasetApiConflict",
+]
+
+
+def __getattr__(name: str):
+    """
+    Get the class of a checker of the plugin by its name, importing the module of the checker.
+
+    :param name: Name of the class of the checker, e.g., 'ImportChecker'.
+    :return: The class of the checker.
+    """
+    for checker_class in CHECKERS:
+        module_name, class_name = checker_class.rsplit(".", 1)
+        if class_name == name:
+            return getattr(importlib.import_module(module_name), class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def register(linter):
@@ -44,37 +65,17 @@ def register(linter):
 
     :param linter: Linter to add the checkers to.
     """
-    linter.register_checker(ImportChecker(linter))
-    linter.register_checker(InPlacePandasChecker(linter))
-    linter.register_checker(InPlaceNumpyChecker(linter))
-    linter.register_checker(UnnecessaryIterationPandasChecker(linter))
-    linter.register_checker(UnnecessaryIterationTensorflowChecker(linter))
-    linter.register_checker(ScalerMissingScikitLearnChecker(linter))
-    linter.register_checker(HyperparameterPyTorchChecker(linter))
-    linter.register_checker(HyperparameterTensorflowChecker(linter))
-    linter.register_checker(HyperparameterScikitLearnChecker(linter))
-    linter.register_checker(MemoryReleaseTensorflowChecker(linter))
-    linter.register_checker(DeterministicAlgorithmChecker(linter))
-    linter.register_checker(RandomnessControlScikitLLearnChecker(linter))
-    linter.register_checker(RandomnessControlPytorchChecker(linter))
-    linter.register_checker(RandomnessControlDataloaderPytorchChecker(linter))
-    linter.register_checker(RandomnessControlTensorflowChecker(linter))
-    linter.register_checker(RandomnessControlNumpyChecker(linter))
-    linter.register_checker(PipelineScikitLearnChecker(linter))
-    linter.register_checker(DependentThresholdPytorchChecker(linter))
-    linter.register_checker(DependentThresholdTensorflowChecker(linter))
-    linter.register_checker(DependentThresholdScikitLearnChecker(linter))
-    linter.register_checker(MaskMissingTensorflowChecker(linter))
-    linter.register_checker(MaskMissingPytorchChecker(linter))
+    for checker_class in CHECKERS:
+        linter.register_checker(LazyChecker(linter, checker_class))
+    linter.register_checker(TypeInferenceChecker(linter))
+
 
-    linter.register_checker(NanNumpyChecker(linter))
-    linter.register_checker(ChainIndexingPandasChecker(linter))
-    linter.register_checker(MergeParameterPandasChecker(linter))
-    linter.register_checker(DatatypePandasChecker(linter))
-    linter.register_checker(ColumnSelectionPandasChecker(linter))
-    linter.register_checker(DataframeConversionPandasChecker(linter))
-    linter.register_checker(TensorArrayTensorflowChecker(linter))
-    linter.register_checker(ForwardPytorchChecker(linter))
-    linter.register_checker(ModeTogglingPytorchChecker(linter))
-    linter.register_checker(GradientClearPytorchChecker(linter))
-    linter.register_checker(DatasetApiConflict(linter))
+def load_configuration(linter):
+    """
+    Apply the options of the plugin after pylint has read the configuration.
+
+    :param linter: Linter the checkers of the plugin are registered with.
+    """
+    for checker in linter.get_checkers():
+        if isinstance(checker, TypeInferenceChecker):
+            checker.configure()
@@ -0,0 +1,28 @@
+"""Write the name, priority, messages and options of the checkers of the plugin to the manifest."""
+# pylint: disable = line-too-long
+import importlib
+import json
+
+from pylint.lint import PyLinter
+
+from dslinter.plugin import CHECKERS
+from dslinter.utils.lazy_checker import LazyChecker
+
+
+def save_checkers_manifest(path: str):
+    """Write the checker manifest, which the LazyChecker registers the checkers from."""
+    linter = PyLinter()
+    manifest = {}
+    for checker_class in CHECKERS:
+        module_name, class_name = checker_class.rsplit(".", 1)
+        checker = getattr(importlib.import_module(module_name), class_name)(linter)
+        manifest[checker_class] = LazyChecker.describe(checker)
+
+    with open(path, "w", encoding="utf-8") as file_handler:
+        json.dump(manifest, file_handler, indent=1)
+        file_handler.write("\n")
+    print("The checker manifest is written to disk.")
+
+
+if __name__ == "__main__":
+    save_checkers_manifest("../resources/checkers.json")
@@ -1,12 +1,19 @@
 """Functions for getting the signatures of Classes."""
 # pylint: disable = line-too-long
 import inspect
-import pickle
+import os
+import re
 from typing import List
 
+from dslinter.utils.signature_database import SignatureDatabase
 
-def save_hyperparameter(classes: List, path: str):
+
+def save_hyperparameter(classes: List, library: str, version: str, path: str):
     """Functions for getting the signatures of Classes."""
+    # The section of the library is looked up by its version, so it has to be the version of a release.
+    if re.match(r"\d+(\.\d+)+", version) is None:
+        raise ValueError(f"The version '{version}' of {library} is not the version of a release.")
+
     # Collect all signatures of the learning classes.
     signatures = []
     for c in classes:
@@ -20,16 +27,19 @@ def save_hyperparameter(classes: List, path: str):
     for class_name, signature in signatures:
         keywords_amount = len(signature.parameters)
         keywords = list(signature.parameters.keys())
-        hyperparameters[class_name] = {"positional": keywords_amount, "keywords": keywords}
+        hyperparameters[class_name] = (keywords_amount, keywords)
 
     print(hyperparameters)
 
-    # Write the pickled hyperparameters dict to disk and verify it.
-    with open(path, "wb") as file_handler:
-        pickle.dump(hyperparameters, file_handler)
-        print("The pickle with all hyperparameters is written to disk.")
-    with open(path, "rb") as file_handler:
-        hyperparameters_loaded = pickle.load(file_handler)
-        assert hyperparameters == hyperparameters_loaded
+    # Replace the section of this version of the library in the signature database and verify it.
+    sections = SignatureDatabase(path).read_sections() if os.path.exists(path) else []
+    sections = [section for section in sections if section[:2] != (library, version)]
+    sections.append((library, version, hyperparameters))
+    SignatureDatabase.write(path, sections)
+    print("The signature database with all hyperparameters is written to disk.")
+    hyperparameters_loaded = SignatureDatabase(path).signatures(library, version)
+    assert {name: (positional, set(keywords)) for name, (positional, keywords) in hyperparameters.items()} == {
+        name: (signature["positional"], set(signature["keywords"])) for name, signature in hyperparameters_loaded.items()
+    }
 
     print("Done!")
@@ -1,6 +1,7 @@
 """Get all parameters of the learning algorithms in scikit-learn 0.22.2."""
 # pylint: disable = line-too-long
 # pylint: disable = import-error
+import sklearn
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.cluster import AffinityPropagation, AgglomerativeClustering, Birch, DBSCAN, FeatureAgglomeration, KMeans, MiniBatchKMeans, MeanShift, OPTICS, SpectralClustering, SpectralBiclustering, SpectralCoclustering
 from sklearn.covariance import EmpiricalCovariance, EllipticEnvelope, GraphicalLasso, GraphicalLassoCV, LedoitWolf, MinCovDet, OAS, ShrunkCovariance
@@ -52,4 +53,4 @@ learning_classes.extend([LinearSVC, LinearSVR, NuSVC, NuSVR, OneClassSVM, SVC, S
 learning_classes.extend([DecisionTreeClassifier, DecisionTreeRegressor, ExtraTreeClassifier, ExtraTreeRegressor])  # tree
 
 if __name__ == "__main__":
-    save_hyperparameter(learning_classes, "../resources/hyperparameters_scikitlearn_dict.pickle")
+    save_hyperparameter(learning_classes, "scikitlearn", sklearn.__version__, "../resources/signatures.db")
@@ -1,6 +1,7 @@
 """Get all parameters of the learning algorithms in pytorch."""
 # pylint: disable = line-too-long
 # pylint: disable = import-error
+import tensorflow
 from tensorflow.keras.optimizers import Adadelta, Adagrad, Adam, Adamax, Ftrl, Nadam, RMSprop, SGD
 from dslinter.scripts.hyperparameters import save_hyperparameter
 
@@ -9,4 +10,4 @@ learning_classes = []
 learning_classes.extend([Adadelta, Adagrad, Adam, Adamax, Ftrl, Nadam, RMSprop, SGD]) #optimizer
 
 if __name__ == "__main__":
-    save_hyperparameter(learning_classes, "../resources/hyperparameters_tensorflow_dict.pickle")
+    save_hyperparameter(learning_classes, "tensorflow", tensorflow.__version__, "../resources/signatures.db")
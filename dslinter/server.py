@@ -0,0 +1,413 @@
+"""Lint server which keeps the checkers of dslinter loaded in between the requests of an editor."""
+import functools
+import json
+import os
+import socket
+import sys
+import sysconfig
+from contextlib import redirect_stdout
+from typing import BinaryIO, Dict, List, Optional, Sequence, Union
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+import astroid
+from astroid import MANAGER
+from astroid.exceptions import AstroidBuildingError
+from pylint.lint import fix_import_path
+from pylint.message import Message
+from pylint.reporters import CollectingReporter
+
+from dslinter.cli import DslinterLinter, DslinterRun
+
+
+class LintServer:
+    """
+    Server which lints the files an editor sends, over the Language Server Protocol.
+
+    The messages are exchanged as JSON-RPC 2.0 messages with a 'Content-Length' header, over stdio
+    or a local socket. The messages of a file are published as LSP diagnostics when the file is
+    opened, changed or saved. Clients which do not speak LSP can send a 'dslinter/lint' request
+    instead, which returns the diagnostics of a file.
+
+    The linter stays loaded in between requests: the checkers and their resources, the modules
+    parsed by astroid from the standard library and the installed packages, and the type inference
+    backend, which is the mypy daemon unless another backend is configured. Only the modules of the
+    linted code are parsed again for every request, as they may have changed since the previous
+    request.
+    """
+
+    # Severities of LSP diagnostics by the category of a pylint message.
+    SEVERITIES = {"fatal": 1, "error": 1, "warning": 2, "convention": 3, "info": 3, "refactor": 4}
+    # Methods the server handles, other requests are answered with an error and other notifications
+    # ignored.
+    METHODS = (
+        "initialize", "initialized", "shutdown", "exit", "textDocument/didOpen",
+        "textDocument/didChange", "textDocument/didSave", "textDocument/didClose", "dslinter/lint",
+    )
+    # Errors of JSON-RPC.
+    PARSE_ERROR = -32700
+    METHOD_NOT_FOUND = -32601
+    INTERNAL_ERROR = -32603
+
+    def __init__(self, linter: DslinterLinter, roots: Sequence[str]):
+        """
+        Create a server with a configured linter.
+
+        :param linter: The linter, after its configuration is loaded.
+        :param roots: Directories of the linted code, which are added to sys.path like the arguments
+            of pylint.
+        """
+        self.linter = linter
+        self.roots = [os.path.abspath(root) for root in roots]
+        # Text of the files opened in the editor, which may differ from the text on disk, by their
+        # path.
+        self.documents: Dict[str, str] = {}
+        self.shutdown = False
+        self.exited = False
+        self._library = tuple(
+            os.path.abspath(path) for name in ("stdlib", "platstdlib", "purelib", "platlib")
+            for path in [sysconfig.get_paths().get(name)] if path
+        )
+        self.linter.initialize()
+
+    def serve(self, reader: BinaryIO, writer: BinaryIO):
+        """
+        Handle the messages of a client until it exits or closes the connection.
+
+        :param reader: Stream the messages of the client are read from.
+        :param writer: Stream the responses and notifications are written to.
+        """
+        while not self.exited:
+            try:
+                message = LintServer.read_message(reader)
+            except ValueError as error:
+                error_message = LintServer.error(None, LintServer.PARSE_ERROR, str(error))
+                LintServer.write_message(writer, error_message)
+                continue
+            if message is None:
+                return
+            for outgoing in self.handle(message):
+                LintServer.write_message(writer, outgoing)
+
+    def handle(self, message: Dict) -> List[Dict]:
+        """
+        Handle a request or notification of the client.
+
+        :param message: The JSON-RPC message.
+        :return: The messages to send to the client: the response to a request and the published
+            diagnostics.
+        """
+        method, request_id = message.get("method"), message.get("id")
+        params = message.get("params") or {}
+        if method not in LintServer.METHODS:
+            if request_id is None:
+                return []  # Notifications which are not supported are ignored, as LSP requires.
+            text = f"Unknown method {method}"
+            return [LintServer.error(request_id, LintServer.METHOD_NOT_FOUND, text)]
+        try:
+            result, outgoing = self._dispatch(method, params)
+        except Exception as error:  # pylint: disable = broad-except
+            if request_id is None:
+                return []
+            text = f"{type(error).__name__}: {error}"
+            return [LintServer.error(request_id, LintServer.INTERNAL_ERROR, text)]
+        if request_id is not None:
+            outgoing.insert(0, {"jsonrpc": "2.0", "id": request_id, "result": result})
+        return outgoing
+
+    def _dispatch(self, method: str, params: Dict):
+        """
+        Run the handler of a method.
+
+        :param method: Name of the method.
+        :param params: Parameters of the message.
+        :return: The result of a request, and the notifications to send.
+        """
+        # pylint: disable = too-many-return-statements
+        document = params.get("textDocument", {})
+        path = LintServer.uri_to_path(document["uri"]) if "uri" in document else None
+        if method == "initialize":
+            root = params.get("rootUri")
+            if root and LintServer.uri_to_path(root) not in self.roots:
+                self.roots.append(LintServer.uri_to_path(root))
+            capabilities = {
+                "textDocumentSync": {"openClose": True, "change": 1, "save": {"includeText": True}}
+            }
+            return {"capabilities": capabilities, "serverInfo": {"name": "dslinter"}}, []
+        if method == "initialized":
+            return None, []
+        if method == "shutdown":
+            self.shutdown = True
+            return None, []
+        if method == "exit":
+            self.exited = True
+            return None, []
+        if method == "textDocument/didOpen":
+            self.documents[path] = document["text"]
+        elif method == "textDocument/didChange":
+            # Only full synchronization is offered, so the last change holds the whole text.
+            self.documents[path] = params["contentChanges"][-1]["text"]
+        elif method == "textDocument/didSave":
+            if "text" in params:
+                self.documents[path] = params["text"]
+        elif method == "textDocument/didClose":
+            self.documents.pop(path, None)
+            return None, [LintServer.publish(document["uri"], [])]
+        elif method == "dslinter/lint":
+            return self.diagnostics(path, params.get("text", self.documents.get(path))), []
+        diagnostics = self.diagnostics(path, self.documents.get(path))
+        return None, [LintServer.publish(document["uri"], diagnostics)]
+
+    def diagnostics(self, path: str, text: Optional[str] = None) -> List[Dict]:
+        """
+        Lint a file and convert its messages to LSP diagnostics.
+
+        :param path: Path of the file.
+        :param text: Text of the file, None to read it from disk.
+        :return: The diagnostics.
+        """
+        if text is None:
+            with open(path, encoding="utf-8") as file:
+                text = file.read()
+        lines = text.splitlines()
+        return [LintServer.diagnostic(message, lines) for message in self.lint(path, text)]
+
+    def lint(self, path: str, text: str) -> List[Message]:
+        """
+        Lint the text of a file, as pylint lints a file read from stdin.
+
+        :param path: Path of the file, which determines the name of its module.
+        :param text: Text of the file.
+        :return: The messages.
+        """
+        reporter = CollectingReporter()
+        self.linter.set_reporter(reporter)
+        self._forget_linted_code()
+        with fix_import_path(self.roots + [path]):
+            self.linter._check_files(  # pylint: disable = protected-access
+                functools.partial(self.linter.get_ast, data=text),
+                [self.linter._get_file_descr_from_stdin(path)],  # pylint: disable = protected-access
+            )
+        return reporter.messages
+
+    def _forget_linted_code(self):
+        """
+        Remove the modules of the linted code from the caches of astroid, keeping the other parsed
+        modules.
+        """
+        for name, module in list(MANAGER.astroid_cache.items()):
+            if module.file and not self._is_library(module.file):
+                del MANAGER.astroid_cache[name]
+        # Modules which were not found before may have been created since.
+        for key, value in list(MANAGER._mod_file_cache.items()):  # pylint: disable = protected-access
+            if isinstance(value, AstroidBuildingError):
+                del MANAGER._mod_file_cache[key]  # pylint: disable = protected-access
+        # The inferred values refer to the nodes of the forgotten modules.
+        astroid.context._invalidate_cache()  # pylint: disable = protected-access
+
+    def _is_library(self, path: str) -> bool:
+        """
+        Determine whether a file is part of the standard library or an installed package.
+
+        :param path: Path of the file.
+        :return: True when the file is not part of the linted code.
+        """
+        if not os.path.isabs(path):
+            # Modules which are not built from a file, e.g., the frozen modules of the standard
+            # library.
+            return True
+        return path.startswith(self._library) or "site-packages" in path
+
+    @staticmethod
+    def diagnostic(message: Message, lines: List[str]) -> Dict:
+        """
+        Convert a pylint message to an LSP diagnostic, which ranges to the end of the line of the
+        message.
+
+        :param message: The message.
+        :param lines: Lines of the linted text.
+        :return: The diagnostic.
+        """
+        line = max(message.line - 1, 0)
+        column = message.column or 0
+        end = len(lines[line]) if line < len(lines) else column
+        return {
+            "range": {
+                "start": {"line": line, "character": column},
+                "end": {"line": line, "character": max(end, column)},
+            },
+            "severity": LintServer.SEVERITIES.get(message.category, 3),
+            "code": message.symbol,
+            "source": "dslinter",
+            "message": message.msg,
+        }
+
+    @staticmethod
+    def publish(uri: str, diagnostics: List[Dict]) -> Dict:
+        """
+        Create the notification which publishes the diagnostics of a file.
+
+        :param uri: URI of the file.
+        :param diagnostics: The diagnostics.
+        :return: The notification.
+        """
+        return {
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "diagnostics": diagnostics},
+        }
+
+    @staticmethod
+    def error(request_id: Union[int, str, None], code: int, text: str) -> Dict:
+        """
+        Create an error response.
+
+        :param request_id: Id of the request, None when it is unknown.
+        :param code: JSON-RPC error code.
+        :param text: Description of the error.
+        :return: The response.
+        """
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": text}}
+
+    @staticmethod
+    def uri_to_path(uri: str) -> str:
+        """
+        Convert a file URI to a path. A path is returned as is.
+
+        :param uri: The URI, e.g., 'file:///home/user/module.py'.
+        :return: The absolute path.
+        """
+        parsed = urlparse(uri)
+        if parsed.scheme != "file":
+            return os.path.abspath(uri)
+        return os.path.abspath(url2pathname(unquote(parsed.path)))
+
+    @staticmethod
+    def read_message(reader: BinaryIO) -> Optional[Dict]:
+        """
+        Read a message preceded by its headers.
+
+        :param reader: The stream.
+        :return: The message or None when the stream is closed.
+        :raises ValueError: When the message is not valid JSON or has no 'Content-Length' header.
+        """
+        length = None
+        while True:
+            header = reader.readline()
+            if not header:
+                return None
+            header = header.decode("ascii").strip()
+            if not header:
+                break
+            name, _, value = header.partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        if length is None:
+            raise ValueError("Missing Content-Length header")
+        content = reader.read(length)
+        if len(content) < length:
+            return None
+        return json.loads(content.decode("utf-8"))
+
+    @staticmethod
+    def write_message(writer: BinaryIO, message: Dict):
+        """
+        Write a message preceded by its 'Content-Length' header.
+
+        :param writer: The stream.
+        :param message: The message.
+        """
+        content = json.dumps(message).encode("utf-8")
+        writer.write(f"Content-Length: {len(content)}\r\n\r\n".encode("ascii") + content)
+        writer.flush()
+
+
+class LintServerLinter(DslinterLinter):
+    """Linter which serves lint requests instead of checking the files given on the command line."""
+
+    OPTIONS = (
+        (
+            "server-port",
+            {
+                "default": 0,
+                "type": "int",
+                "metavar": "<port>",
+                "help": "Port on localhost to accept the connections of clients on, one at a time. "
+                "The server communicates over stdio when no port is given.",
+            },
+        ),
+    )
+
+    def __init__(self, options=(), reporter=None, option_groups=(), pylintrc=None):
+        """
+        Create the linter, with the options of the server added to the options of dslinter.
+
+        :param options: Options added by the run, e.g., 'rcfile'.
+        :param reporter: Reporter of the messages.
+        :param option_groups: Groups of the added options.
+        :param pylintrc: Path of the configuration file.
+        """
+        options = tuple(options) + LintServerLinter.OPTIONS
+        super().__init__(options, reporter, option_groups, pylintrc)
+
+    def load_default_plugins(self):
+        """
+        Register the reporters of pylint and the checkers of dslinter, with mypy kept running in its
+        daemon.
+        """
+        super().load_default_plugins()
+        # The configuration file and the command line are loaded later, so they can still choose
+        # another backend.
+        self.global_set_option("type-inference-backend", "dmypy")
+
+    def load_command_line_configuration(self, args=None):
+        """
+        Load the options given on the command line.
+
+        :param args: The command line arguments.
+        :return: The directories of the linted code, the working directory when none are given.
+        """
+        return super().load_command_line_configuration(args) or [os.getcwd()]
+
+    def check(self, files_or_modules: Union[Sequence[str], str]) -> None:
+        """
+        Serve lint requests until the client exits, then exit as LSP requires.
+
+        :param files_or_modules: Directories of the linted code.
+        """
+        roots = [files_or_modules] if isinstance(files_or_modules, str) else files_or_modules
+        server = LintServer(self, roots)
+        if self.config.server_port:
+            with socket.create_server(("127.0.0.1", self.config.server_port)) as listener:
+                print(f"Listening on port {self.config.server_port}", file=sys.stderr, flush=True)
+                while not server.exited:
+                    connection, _ = listener.accept()
+                    with connection, connection.makefile("rb") as reader:
+                        with connection.makefile("wb") as writer:
+                            server.serve(reader, writer)
+        else:
+            writer = sys.stdout.buffer
+            # Anything printed while linting, e.g., by the exception handler, would corrupt the
+            # messages.
+            with redirect_stdout(sys.stderr):
+                server.serve(sys.stdin.buffer, writer)
+        sys.exit(0 if server.shutdown else 1)
+
+
+class LintServerRun(DslinterRun):
+    """Run of the lint server, configured like a run of dslinter."""
+
+    LinterClass = LintServerLinter
+
+
+def main(args: Optional[List[str]] = None):
+    """
+    Run the lint server from the command line.
+
+    :param args: The command line arguments, sys.argv[1:] when not given.
+    """
+    LintServerRun(sys.argv[1:] if args is None else args)
+
+
+if __name__ == "__main__":
+    main()
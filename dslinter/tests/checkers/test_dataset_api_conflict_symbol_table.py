@@ -0,0 +1,73 @@
+"""Class which tests the SymbolTable of the DatasetApiConflict checker."""
+import astroid
+
+from dslinter.checkers.dataset_api_conflict.symbol_table import SymbolTable
+from dslinter.checkers.dataset_api_conflict.util import get_function_id_from_call
+
+
+class TestSymbolTable:
+    """Class which tests the SymbolTable of the DatasetApiConflict checker."""
+
+    CODE = """
+    import pandas as pd
+    import sklearn.svm
+    from sklearn.svm import SVC as S, LinearSVC
+    from . import sibling
+    df = pd.read_csv('data.csv')
+    svc = sklearn.svm.SVC(kernel='linear')
+    model = S()
+    x = x.copy()
+    f = fs[0]()
+    """
+
+    def test_lookup(self):
+        """Test whether imported names and names assigned from calls are resolved."""
+        table = SymbolTable(astroid.parse(self.CODE))
+        assert table.lookup("pd") == "pandas"
+        assert table.lookup("sklearn") == "sklearn"
+        assert table.lookup("S") == "sklearn.svm.SVC"
+        assert table.lookup("LinearSVC") == "sklearn.svm.LinearSVC"
+        assert table.lookup("sibling") == "sibling"
+        assert table.lookup("df") == "pandas.read_csv"
+        assert table.lookup("svc") == "sklearn.svm.SVC"
+        assert table.lookup("model") == "sklearn.svm.SVC"
+        assert table.lookup("x") == "x.copy"
+        assert table.lookup("f") == "f"
+        assert table.lookup("unknown") == "unknown"
+
+    def test_get_function_id_from_call(self):
+        """Test whether the full name of a called function is resolved using the symbol table."""
+        module = astroid.parse(self.CODE + "svc.fit(df)\n    model.fit(df)\n")
+        svc_fit, model_fit = module.body[-2].value, module.body[-1].value
+        assert get_function_id_from_call(module.body[4].value) == "pandas.read_csv"
+        assert get_function_id_from_call(svc_fit) == "sklearn.svm.SVC.fit"
+        assert get_function_id_from_call(model_fit) == "sklearn.svm.SVC.fit"
+        assert get_function_id_from_call(model_fit, search_globals=False) == "model.fit"
+        assert not hasattr(svc_fit, "full_name")
+
+    def test_get_function_id_from_call_in_function(self):
+        """Test whether the names defined in a function shadow the globals."""
+        module = astroid.parse(self.CODE + """
+    def train(svc, data):
+        import numpy as pd
+        from sklearn.linear_model import LinearRegression as S
+        model = S()
+        svc.fit(df)
+        model.fit(df)
+        pd.load(data)
+        df.dropna()
+        x.fit(df)
+    """)
+        calls = [statement.value for statement in module.body[-1].body[-5:]]
+        assert [get_function_id_from_call(call) for call in calls] == [
+            "svc.fit",
+            "sklearn.linear_model.LinearRegression.fit",
+            "numpy.load",
+            "pandas.read_csv.dropna",
+            "x.copy.fit",
+        ]
+
+    def test_of_shared(self):
+        """Test whether the symbol table of a module is built once."""
+        module = astroid.parse(self.CODE)
+        assert SymbolTable.for_module(module) is SymbolTable.for_module(module)
@@ -0,0 +1,72 @@
+"""Class which tests whether the checkers report the same messages when pylint checks modules in parallel."""
+import os
+import subprocess
+import sys
+
+from dslinter.utils.lazy_checker import LazyChecker
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+IMPORTING_MODULE = (
+    '"""Module which imports the libraries."""\n'
+    "import torch\n"
+    "import pandas as pd\n"
+    "from torch.utils.data import DataLoader\n"
+    "\n"
+    "\n"
+    "def load(dataset, net, x):\n"
+    '    """Load the dataset."""\n'
+    "    df = pd.DataFrame([1])\n"
+    "    df.dropna(inplace=True)\n"
+    "    net.forward(x)\n"
+    "    return DataLoader(dataset), df.values\n"
+)
+
+NOT_IMPORTING_MODULE = (
+    '"""Module which uses the same names without importing the libraries."""\n'
+    "\n"
+    "\n"
+    "def load(dataset, net, x, df):\n"
+    '    """Load the dataset."""\n'
+    "    net.forward(x)\n"
+    "    df.dropna(inplace=True)\n"
+    "    return DataLoader(dataset), df.values\n"
+)
+
+
+class TestParallel:
+    """Class which tests whether the checkers report the same messages when pylint checks modules in parallel."""
+
+    @staticmethod
+    def run_pylint(paths, jobs: int):
+        """
+        Run pylint with all messages of the plugin enabled.
+
+        :param paths: Paths of the modules to check.
+        :param jobs: Number of processes pylint checks the modules in.
+        :return: The sorted lines of the output of pylint.
+        """
+        messages = [
+            message[1] for checker in LazyChecker.manifest().values() for message in checker["msgs"].values()
+        ]
+        args = [
+            sys.executable, "-m", "pylint", "-j", str(jobs), "--load-plugins=dslinter", "--persistent=n",
+            "-rn", "-sn", "--disable=all", "--enable=" + ",".join(messages),
+        ]
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        output = subprocess.run(args + paths, capture_output=True, text=True, env=env, check=False).stdout
+        return sorted(line for line in output.splitlines() if line.strip())
+
+    def test_parallel_equals_serial(self, tmp_path):
+        """Test whether checking modules in parallel reports the same messages as checking them one by one."""
+        paths = []
+        for number, code in enumerate([IMPORTING_MODULE, NOT_IMPORTING_MODULE] * 2):
+            path = tmp_path / "module_{}.py".format(number)
+            path.write_text(code)
+            paths.append(str(path))
+
+        serial = TestParallel.run_pylint(paths, 1)
+        assert any("randomness-control-dataloader-pytorch" in line for line in serial)
+        # What a checker finds in a module is not reported for the modules checked after it.
+        assert not [line for line in serial if "module_1.py" in line and "dataloader" in line]
+        assert TestParallel.run_pylint(paths, 2) == serial
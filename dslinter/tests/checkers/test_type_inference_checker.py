@@ -0,0 +1,47 @@
+"""Class which tests the TypeInferenceChecker."""
+import astroid
+import pylint.testutils
+from pylint.lint import PyLinter
+
+import dslinter
+from dslinter.utils.module_cache import ModuleCache
+from dslinter.utils.type_inference import TypeInference
+
+
+class TestTypeInferenceChecker(pylint.testutils.CheckerTestCase):
+    """Class which tests the TypeInferenceChecker."""
+
+    CHECKER_CLASS = dslinter.plugin.TypeInferenceChecker
+
+    def test_timeout(self, monkeypatch):
+        """Test whether a message is added when the types of a module are inferred heuristically."""
+        module_tree = astroid.parse("import pandas as pd\ndf = pd.read_csv('a.csv')\ndf.abs()")
+        call = module_tree.body[-1].value
+
+        def run_mypy(_):
+            raise TimeoutError()
+
+        monkeypatch.setattr(TypeInference, "run_mypy", run_mypy)
+        result = TypeInference.infer_types(module_tree, astroid.Call, TypeInference.called_object_name)
+        assert result == {call: '"pandas.core.frame.DataFrame"'}
+        with self.assertAddsMessages(pylint.testutils.MessageTest(msg_id="type-inference-timeout", node=module_tree)):
+            self.checker.leave_module(module_tree)
+        with self.assertNoMessages():
+            self.checker.leave_module(module_tree)
+
+    def test_release(self):
+        """Test whether the results shared between the checkers are released when the module is left."""
+        module_tree = astroid.parse("import pandas as pd\n")
+        assert ModuleCache.get(module_tree, "key", lambda: 1) == 1
+        self.checker.leave_module(module_tree)
+        assert ModuleCache.get(module_tree, "key", lambda: 2) == 2
+
+    def test_disabled(self):
+        """Test whether the message stays disabled when it is disabled in the configuration."""
+        linter = PyLinter()
+        dslinter.register(linter)
+        assert linter.is_message_enabled("type-inference-timeout")
+        linter.disable("type-inference-timeout")
+        linter.enable("forward-pytorch")
+        dslinter.plugin.load_configuration(linter)
+        assert not linter.is_message_enabled("type-inference-timeout")
@@ -0,0 +1,43 @@
+"""Class which tests the AssignmentIndex utils class."""
+import astroid
+
+from dslinter.utils.assignment_index import AssignmentIndex
+from dslinter.utils.ast import AssignUtil
+
+
+class TestAssignmentIndex:
+    """Class which tests the AssignmentIndex utils class."""
+
+    CODE = (
+        "scaler = StandardScaler()\n"
+        "x: int = 1\n"
+        "a = b = scaler\n"
+        "scaler = MinMaxScaler()\n"
+        "def f(data, model=None):\n"
+        "    scaler = RobustScaler()\n"
+        "    return model.fit(data)\n"
+        "f(x, model=SVC())\n"
+        "f(scaler)\n"
+    )
+
+    def test_values(self):
+        """Test whether the values of the assignments in the body of the module are indexed in order."""
+        index = AssignmentIndex(astroid.parse(self.CODE))
+        assert [value.func.name for value in index.values("scaler")] == ["StandardScaler", "MinMaxScaler"]
+        assert [value.value for value in index.values("x")] == [1]
+        assert [value.name for value in index.values("a")] == ["scaler"]
+        assert index.values("data") == []
+
+    def test_assignment_values(self):
+        """Test whether AssignUtil resolves names from the index of the module."""
+        module = astroid.parse(self.CODE)
+        model, data = module.body[4].body[1].value.func.expr, module.body[4].body[1].value.args[0]
+        assert [value.func.name for value in AssignUtil.assignment_values(model)] == ["SVC"]
+        assert [value.name for value in AssignUtil.assignment_values(data)] == ["x", "scaler"]
+        scaler = module.body[6].value.args[0]
+        assert len(AssignUtil.assignment_values(scaler)) == 2
+
+    def test_of_shared(self):
+        """Test whether the index of a module is built once."""
+        module = astroid.parse(self.CODE)
+        assert AssignmentIndex.for_module(module) is AssignmentIndex.for_module(module)
@@ -0,0 +1,61 @@
+"""Class which tests the CallDispatcher utils class."""
+import astroid
+from pylint.testutils import UnittestLinter
+from pylint.utils import ASTWalker
+
+from dslinter.checkers.forward_pytorch import ForwardPytorchChecker
+from dslinter.checkers.mask_missing_pytorch import MaskMissingPytorchChecker
+from dslinter.utils.call_dispatcher import CallDispatcher
+
+
+class TestCallDispatcher:
+    """Class which tests the CallDispatcher utils class."""
+
+    CODE = "import torch\nx = torch.log(y)\nnet.forward(x)\nnet.forward(torch.log(x))\nf()()\n"
+
+    def test_called_name(self):
+        """Test whether the name of the called function or method is found."""
+        calls = list(astroid.parse(self.CODE).nodes_of_class(astroid.Call))
+        assert [CallDispatcher.called_name(call) for call in calls] == ["log", "forward", "forward", "log", "", "f"]
+
+    def test_dispatch(self):
+        """Test whether each Call node is visited once and forwarded to the checkers of its called name only."""
+        linter = UnittestLinter()
+        forward, mask = ForwardPytorchChecker(linter), MaskMissingPytorchChecker(linter)
+        walker = ASTWalker(linter)
+        for checker in (forward, mask):
+            checker.open()
+            walker.add_checker(checker)
+        assert "visit_call" in dir(forward) and "visit_call" not in dir(mask)
+        assert len(walker.visit_events["call"]) == 1
+        walker.walk(astroid.parse(self.CODE))
+        messages = linter.release_messages()
+        assert [(message.msg_id, message.node.lineno) for message in messages] == [
+            ("missing-mask-pytorch", 2),
+            ("forward-pytorch", 3),
+            ("forward-pytorch", 4),
+            ("missing-mask-pytorch", 4),
+        ]
+
+    def test_handles_other_names(self, monkeypatch):
+        """Test whether the checkers do not check the calls to other names."""
+        checker = ForwardPytorchChecker(UnittestLinter())
+        checked = []
+        monkeypatch.setattr(checker, "check_call", checked.append)
+        checker.open()
+        forward, backward = astroid.extract_node("net.forward(x)"), astroid.extract_node("net.backward(x)")
+        checker.visit_call(forward)
+        checker.visit_call(backward)
+        assert checked == [forward]
+
+    def test_close(self):
+        """Test whether the dispatcher of a linter is released when the checkers are closed."""
+        linter = UnittestLinter()
+        forward, mask = ForwardPytorchChecker(linter), MaskMissingPytorchChecker(linter)
+        for checker in (forward, mask):
+            checker.open()
+        for checker in (mask, forward):
+            checker.close()
+        assert not hasattr(forward, "visit_call") and not hasattr(mask, "visit_call")
+        mask.open()
+        assert hasattr(mask, "visit_call")
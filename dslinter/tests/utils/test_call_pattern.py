@@ -0,0 +1,74 @@
+"""Class which tests the CallPattern and CallPatterns utils classes."""
+import astroid
+import pytest
+
+from dslinter.utils.call_pattern import CallPattern, CallPatterns, _TrieNode
+
+
+class TestCallPattern:
+    """Class which tests the CallPattern and CallPatterns utils classes."""
+
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        """Replace the registered patterns by an empty registry for the duration of a test."""
+        monkeypatch.setattr(CallPatterns, "_root", _TrieNode())
+        monkeypatch.setattr(CallPatterns, "_patterns", {})
+
+    def test_names(self):
+        """Test whether the called function has to match every part of the dotted name."""
+        pattern = CallPattern.parse("{np,numpy}.random.seed(...)")
+        assert pattern.matches(astroid.extract_node("np.random.seed(0)"))
+        assert pattern.matches(astroid.extract_node("numpy.random.seed()"))
+        assert not pattern.matches(astroid.extract_node("random.seed(0)"))
+        assert not pattern.matches(astroid.extract_node("x.np.random.seed(0)"))
+        assert not pattern.matches(astroid.extract_node("np.random.seed"))
+
+    def test_any_receiver(self):
+        """Test whether '*' matches any expression the function is an attribute of, but not none."""
+        pattern = CallPattern.parse("*.clip(...)")
+        assert pattern.matches(astroid.extract_node("x.clip(0, 1)"))
+        assert pattern.matches(astroid.extract_node("f().y.clip(0, 1)"))
+        assert not pattern.matches(astroid.extract_node("clip(x, 0, 1)"))
+
+    def test_arguments(self):
+        """Test whether the positional arguments are matched by their patterns."""
+        pattern = CallPattern.parse("torch.log(!*.{clip,clamp}(...), ...)")
+        assert pattern.matches(astroid.extract_node("torch.log(x)"))
+        assert pattern.matches(astroid.extract_node("torch.log()"))
+        assert pattern.matches(astroid.extract_node("torch.log(clip(x), 2)"))
+        assert not pattern.matches(astroid.extract_node("torch.log(x.clamp(min=1))"))
+        exact = CallPattern.parse("f(_, g())")
+        assert exact.matches(astroid.extract_node("f(1, g())"))
+        assert not exact.matches(astroid.extract_node("f(1, h())"))
+        assert not exact.matches(astroid.extract_node("f(1)"))
+        assert not exact.matches(astroid.extract_node("f(1, g(), 3)"))
+
+    @pytest.mark.parametrize("pattern", ["np.", "np.seed", "np.seed(x", "*(...)", "f() g", "{a,}.b()", "f(1)"])
+    def test_invalid(self, pattern):
+        """Test whether an invalid pattern is rejected."""
+        with pytest.raises(ValueError):
+            CallPattern.parse(pattern)
+
+    @pytest.mark.usefixtures("registry")
+    def test_registry(self):
+        """Test whether a call is matched against all registered patterns at once."""
+        CallPatterns.register("test-seed", "{np,numpy}.random.seed(...)")
+        CallPatterns.register("test-any-seed", "*.seed(...)")
+        CallPatterns.register("test-plain-seed", "seed()")
+        module = astroid.parse("np.random.seed(1)\nx.np.random.seed(1)\nseed()\nseed(1)\n")
+        assert [CallPatterns.match(expr.value) for expr in module.body] == [
+            {"test-seed", "test-any-seed"},
+            {"test-any-seed"},
+            {"test-plain-seed"},
+            set(),
+        ]
+        assert CallPatterns.matches(module.body[0].value) == CallPatterns.match(module.body[0].value)
+        assert CallPatterns.matches(module.body[0]) == frozenset()
+
+    @pytest.mark.usefixtures("registry")
+    def test_register_conflict(self):
+        """Test whether a key can not be registered with another pattern."""
+        assert CallPatterns.register("test-conflict", "f()") == "test-conflict"
+        assert CallPatterns.register("test-conflict", "f()") == "test-conflict"
+        with pytest.raises(ValueError):
+            CallPatterns.register("test-conflict", "g()")
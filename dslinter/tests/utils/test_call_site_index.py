@@ -0,0 +1,49 @@
+"""Class which tests the CallSiteIndex utils class."""
+import astroid
+
+from dslinter.utils.call_site_index import CallSiteIndex
+
+
+class TestCallSiteIndex:
+    """Class which tests the CallSiteIndex utils class."""
+
+    CODE = (
+        "def f(data, model=None):\n"
+        "    def g(data):\n"
+        "        return data\n"
+        "    g(model)\n"
+        "    return model.fit(data)\n"
+        "f(x, model=SVC())\n"
+        "f(y)\n"
+        "f(model=z, model=w)\n"
+        "g(q)\n"
+        "obj.f(v)\n"
+    )
+
+    def test_call_sites(self):
+        """Test whether the calls to a name are found in the subtree of a node only."""
+        module = astroid.parse(self.CODE)
+        index = CallSiteIndex(module)
+        assert [call.lineno for call, _, _ in index.call_sites("f", module)] == [6, 7, 8]
+        assert [call.lineno for call, _, _ in index.call_sites("g", module)] == [4, 9]
+        assert [call.lineno for call, _, _ in index.call_sites("g", module.body[0])] == [4]
+        assert index.call_sites("h", module) == []
+
+    def test_argument_values(self):
+        """Test whether the values passed to an argument by position and by keyword are found."""
+        module = astroid.parse(self.CODE)
+        index = CallSiteIndex(module)
+        function = module.body[0]
+        assert [value.name for value in index.argument_values(function, "data", 0)] == ["x", "y"]
+        values = index.argument_values(function, "model", 1)
+        assert [value.func.name if isinstance(value, astroid.Call) else value.name for value in values] == [
+            "SVC",
+            "z",
+        ]
+        inner = function.body[0]
+        assert [value.name for value in index.argument_values(inner, "data", 0)] == ["model"]
+
+    def test_of_shared(self):
+        """Test whether the index of a module is built once."""
+        module = astroid.parse(self.CODE)
+        assert CallSiteIndex.for_module(module) is CallSiteIndex.for_module(module)
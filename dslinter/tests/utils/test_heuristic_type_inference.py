@@ -0,0 +1,18 @@
+"""Class which tests the HeuristicTypeInference utils class."""
+import astroid
+
+from dslinter.utils.heuristic_type_inference import HeuristicTypeInference
+from dslinter.utils.type_inference import TypeInference
+
+
+class TestHeuristicTypeInference:
+    """Class which tests the HeuristicTypeInference utils class."""
+
+    def test_infer_types(self):
+        """Test if variables assigned the result of a known library function get its type."""
+        code = "from pandas import read_csv as rc\nimport pandas\na = rc('a.csv')\nb = pandas.DataFrame()\nc = f()\n" \
+               "a.abs(); b.abs(); c.abs()"
+        module_node = astroid.parse(code)
+        nodes = [call.value for call in module_node.body[-3:]]
+        result = HeuristicTypeInference.infer_types(module_node, nodes, TypeInference.called_object_name)
+        assert result == {nodes[0]: '"pandas.core.frame.DataFrame"', nodes[1]: '"pandas.core.frame.DataFrame"'}
@@ -0,0 +1,75 @@
+"""Class which tests the LazyChecker utils class."""
+import importlib
+import subprocess
+import sys
+
+import astroid
+from pylint.testutils import UnittestLinter
+from pylint.utils import ASTWalker
+
+from dslinter.plugin import CHECKERS
+from dslinter.utils.lazy_checker import LazyChecker
+
+
+class TestLazyChecker:
+    """Class which tests the LazyChecker utils class."""
+
+    def test_manifest_up_to_date(self):
+        """Test whether the checker manifest describes the checkers as they are implemented."""
+        linter = UnittestLinter()
+        assert sorted(LazyChecker.manifest()) == sorted(CHECKERS)
+        for checker_class in CHECKERS:
+            module_name, class_name = checker_class.rsplit(".", 1)
+            checker = getattr(importlib.import_module(module_name), class_name)(linter)
+            # pylint: disable = protected-access
+            assert LazyChecker._from_json(LazyChecker.describe(checker)) == LazyChecker.manifest()[checker_class], (
+                "The checker manifest is outdated, run dslinter/scripts/checkers_manifest.py."
+            )
+
+    def test_register_imports_no_checkers(self):
+        """Test whether registering the plugin does not import the checkers and the libraries they use."""
+        code = (
+            "import sys\n"
+            "from pylint.lint import PyLinter\n"
+            "import dslinter\n"
+            "dslinter.register(PyLinter())\n"
+            "print(' '.join(sorted(sys.modules)))\n"
+        )
+        modules = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.split()
+        assert not [module for module in modules if module.split(".")[0] in ("pandas", "numpy", "mypy")]
+        assert "dslinter.checkers.imports" not in modules
+        assert "dslinter.checkers.dataset_api_conflict.dataset_api_conflict" not in modules
+
+    def test_open_imports_checker(self):
+        """Test whether the checker is imported when the LazyChecker is opened and then visits the nodes."""
+        linter = UnittestLinter()
+        checker = LazyChecker(linter, "dslinter.checkers.imports.ImportChecker")
+        assert checker.name == "import" and "C5501" in checker.msgs
+        assert checker.checker is None and not hasattr(checker, "visit_import")
+
+        checker.open()
+        assert checker.checker.config is checker.config
+        walker = ASTWalker(linter)
+        walker.add_checker(checker)
+        walker.walk(astroid.parse("import pandas\nimport numpy as np\n"))
+        assert [message.msg_id for message in linter.release_messages()] == ["import-pandas"]
+        checker.close()
+
+    def test_open_dispatches_calls(self):
+        """Test whether the Call nodes are visited once for the checkers of which the calls are dispatched."""
+        linter = UnittestLinter()
+        checkers = [
+            LazyChecker(linter, "dslinter.checkers.forward_pytorch.ForwardPytorchChecker"),
+            LazyChecker(linter, "dslinter.checkers.mask_missing_pytorch.MaskMissingPytorchChecker"),
+        ]
+        walker = ASTWalker(linter)
+        for checker in checkers:
+            checker.open()
+            walker.add_checker(checker)
+        assert len(walker.visit_events["call"]) == 1
+        walker.walk(astroid.parse("import torch\nx = torch.log(y)\nnet.forward(x)\n"))
+        assert [message.msg_id for message in linter.release_messages()] == ["missing-mask-pytorch", "forward-pytorch"]
+        for checker in reversed(checkers):
+            checker.close()
@@ -0,0 +1,30 @@
+"""Class which tests the ModuleCache utils class."""
+import astroid
+
+from dslinter.utils.module_cache import ModuleCache
+
+
+class TestModuleCache:
+    """Class which tests the ModuleCache utils class."""
+
+    def test_get_computes_once(self):
+        """Test whether a result is computed only once for the same module and key."""
+        module = astroid.parse("a = 5")
+        computed = []
+        for _ in range(3):
+            result = ModuleCache.get(module, "key", lambda: computed.append(1) or "result")
+        assert result == "result" and len(computed) == 1
+
+    def test_get_separates_modules(self):
+        """Test whether results are not shared between different modules."""
+        module_a = astroid.parse("a = 5")
+        module_b = astroid.parse("a = 5")
+        ModuleCache.get(module_a, "key", lambda: "a")
+        assert ModuleCache.get(module_b, "key", lambda: "b") == "b"
+
+    def test_release(self):
+        """Test whether a released module computes its results again."""
+        module = astroid.parse("a = 5")
+        ModuleCache.get(module, "key", lambda: "first")
+        ModuleCache.release(module)
+        assert ModuleCache.get(module, "key", lambda: "second") == "second"
@@ -0,0 +1,69 @@
+"""Class which tests the MypyDaemon utils class."""
+import os
+import subprocess
+import sys
+
+from dslinter.utils.mypy_daemon import MypyDaemon
+from dslinter.utils.type_inference import TypeInference
+
+
+class TestMypyDaemon:
+    """Class which tests the MypyDaemon utils class."""
+
+    def test_run_filters_anchor(self, tmp_path, monkeypatch):
+        """Test whether the report of the anchor file is left out of the result."""
+        daemon = MypyDaemon(str(tmp_path))
+        report = (
+            MypyDaemon.ANCHOR_FILE + ':3: error: Cannot find implementation or library stub for module named "pyspark"\n'
+            '_dslinter.py:1: note: Revealed type is "builtins.int"\n'
+            "Found 1 error in 1 file (checked 2 source files)\n"
+        )
+        monkeypatch.setattr(daemon, "_start", lambda: True)
+        monkeypatch.setattr(daemon, "_dmypy", lambda *args: (report, "", 1))
+
+        result = daemon.run("reveal_type(1)\n")
+        assert result == '_dslinter.py:1: note: Revealed type is "builtins.int"\n' \
+                         "Found 1 error in 1 file (checked 2 source files)\n"
+        assert (tmp_path / "_dslinter.py").read_text() == "reveal_type(1)\n"
+
+    def test_run_mypy_unavailable_daemon(self, monkeypatch, capsys):
+        """Test whether mypy is ran without the daemon when the daemon cannot be started."""
+        daemon = MypyDaemon()
+        monkeypatch.setattr(daemon, "_start_daemon", lambda *args: 2)
+        monkeypatch.setattr(TypeInference, "daemon", daemon)
+
+        result = TypeInference.run_mypy("a = 1\nreveal_type(a)\n")
+        assert 'Revealed type is "builtins.int"' in result
+        assert daemon.run("") is None
+        # The report of pylint is written to stdout, so the fallback is reported on stderr.
+        output = capsys.readouterr()
+        assert output.out == "" and "Could not start the mypy daemon" in output.err
+
+    def test_run_restarts_stopped_daemon(self, tmp_path, monkeypatch):
+        """Test whether a daemon which stopped by itself is started again instead of running mypy without it."""
+        daemon = MypyDaemon(str(tmp_path))
+        running = []
+        monkeypatch.setattr(daemon, "_start", lambda: True)
+        monkeypatch.setattr(daemon, "_start_daemon", lambda *args: running.append(True) or 0)
+        monkeypatch.setattr(
+            daemon, "_dmypy", lambda command, *args: ("", "", 0) if running else ("", "Daemon has died", 2)
+        )
+
+        assert daemon.run("a = 1\n") == ""
+        assert running == [True]
+
+    def test_start_daemon_relative_directory(self, tmp_path, monkeypatch):
+        """Test whether a relative directory is resolved once, although the daemon runs in it."""
+        monkeypatch.chdir(tmp_path)
+        daemon = MypyDaemon("daemon")
+        commands = []
+        monkeypatch.setattr(
+            subprocess,
+            "run",
+            lambda command, cwd, **kwargs: commands.append((command, cwd)) or subprocess.CompletedProcess(command, 0),
+        )
+
+        assert daemon._start_daemon() == 0  # pylint: disable = protected-access
+        directory = str(tmp_path / "daemon")
+        status_file = os.path.join(directory, "dmypy.json")
+        assert commands == [([sys.executable, "-m", "mypy.dmypy", "--status-file", status_file, "start"], directory)]
@@ -0,0 +1,65 @@
+"""Class which tests the NodeIndex utils class."""
+import astroid
+
+from dslinter.utils.node_index import NodeIndex
+
+
+def search_nodes_recursively(node, type_searched):
+    """Search nodes the way ASTUtil.search_nodes did before the index."""
+    found = []
+    for child in node.get_children():
+        found += search_nodes_recursively(child, type_searched)
+    if isinstance(node, type_searched):
+        found.append(node)
+    return found
+
+
+class TestNodeIndex:
+    """Class which tests the NodeIndex utils class."""
+
+    CODE = (
+        "import pandas as pd\n"
+        "df = pd.read_csv('a.csv')\n"
+        "def f(x):\n"
+        "    g = lambda y: y.head()\n"
+        "    return g(x).tail()\n"
+        "class A:\n"
+        "    def m(self):\n"
+        "        return [f(x) for x in range(3)]\n"
+        "print(f(df))\n"
+    )
+
+    TYPES = [astroid.Call, astroid.Name, astroid.Lambda, astroid.FunctionDef, astroid.node_classes.Statement]
+
+    def test_search_module(self):
+        """Test whether the nodes of a module are found in the same order as a recursive search."""
+        module = astroid.parse(self.CODE)
+        index = NodeIndex(module)
+        for type_searched in self.TYPES:
+            assert index.search(module, type_searched) == search_nodes_recursively(module, type_searched)
+
+    def test_search_subtree(self):
+        """Test whether only the nodes in the subtree of a node are found."""
+        module = astroid.parse(self.CODE)
+        index = NodeIndex(module)
+        for function in module.nodes_of_class(astroid.FunctionDef):
+            for type_searched in self.TYPES:
+                assert index.search(function, type_searched) == search_nodes_recursively(function, type_searched)
+
+    def test_search_subclasses(self):
+        """Test whether searching a type finds the nodes of its subclasses, e.g., FunctionDef for Lambda."""
+        module = astroid.parse(self.CODE)
+        found = NodeIndex(module).search(module, astroid.Lambda)
+        assert {type(node) for node in found} == {astroid.Lambda, astroid.FunctionDef}
+
+    def test_contains(self):
+        """Test whether only the nodes of the indexed tree are contained."""
+        module = astroid.parse(self.CODE)
+        index = NodeIndex(module)
+        assert index.contains(module.body[1].value)
+        assert not index.contains(astroid.parse(self.CODE).body[1].value)
+
+    def test_of_shared(self):
+        """Test whether the index of a module is built once."""
+        module = astroid.parse(self.CODE)
+        assert NodeIndex.for_module(module) is NodeIndex.for_module(module)
@@ -0,0 +1,42 @@
+"""Class which tests the Resources utils class."""
+import re
+
+import pytest
+
+from dslinter.utils.resources import Resources
+
+LIBRARY = "scikitlearn"
+
+
+class TestResources:
+    """Class which tests the Resources utils class."""
+
+    def test_get_hyperparameters_reads_once(self):
+        """Test whether the same resource is shared by every call."""
+        assert Resources.get_hyperparameters(LIBRARY) is Resources.get_hyperparameters(LIBRARY)
+
+    def test_get_hyperparameters_indexed(self):
+        """Test whether the keywords of a learning algorithm are a frozenset next to its positional count."""
+        parameters = Resources.get_hyperparameters(LIBRARY)["KMeans"]
+        assert isinstance(parameters["positional"], int)
+        assert isinstance(parameters["keywords"], frozenset) and "n_clusters" in parameters["keywords"]
+
+    def test_get_hyperparameters_read_only(self):
+        """Test whether the shared resource cannot be modified."""
+        hyperparameters = Resources.get_hyperparameters(LIBRARY)
+        with pytest.raises(TypeError):
+            hyperparameters["KMeans"] = {}
+        with pytest.raises(TypeError):
+            hyperparameters["KMeans"]["positional"] = 0
+
+    def test_get_learning_classes(self):
+        """Test whether the learning classes are the names in the resource."""
+        learning_classes = Resources.get_learning_classes(LIBRARY)
+        assert isinstance(learning_classes, frozenset)
+        assert learning_classes == set(Resources.get_hyperparameters(LIBRARY))
+
+    def test_signature_database_versions(self):
+        """Test whether every section of the signature database is recorded with the version of a release."""
+        sections = Resources.get_signature_database().sections()
+        assert {library for library, _ in sections} == {"scikitlearn", "pytorch", "tensorflow"}
+        assert all(re.fullmatch(r"\d+(\.\d+)+", version) for _, version in sections)
@@ -0,0 +1,97 @@
+"""Class which tests the ResultCache utils class."""
+import os
+import subprocess
+import sys
+
+import astroid
+
+from dslinter.checkers.dataset_api_conflict.data_loaders.pandas import pandas_read_csv
+from dslinter.utils.result_cache import ResultCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class TestResultCache:
+    """Class which tests the ResultCache utils class."""
+
+    def test_put_get(self, tmp_path):
+        """Test whether a stored result is returned while the file and its dependencies are unchanged."""
+        (tmp_path / "module.py").write_text("import helper\n")
+        (tmp_path / "helper.py").write_text("x = 1\n")
+        module, helper = str(tmp_path / "module.py"), str(tmp_path / "helper.py")
+        ResultCache(str(tmp_path / "cache"), "configuration").put(module, ("result",), [helper])
+        assert ResultCache(str(tmp_path / "cache"), "configuration").get(module) == ("result",)
+
+    def test_invalidated(self, tmp_path):
+        """Test whether a stored result is not returned after the file, a dependency or the configuration changed."""
+        (tmp_path / "module.py").write_text("import helper\n")
+        (tmp_path / "helper.py").write_text("x = 1\n")
+        module, helper, added = str(tmp_path / "module.py"), str(tmp_path / "helper.py"), str(tmp_path / "added.py")
+        ResultCache(str(tmp_path / "cache"), "configuration").put(module, ("result",), [helper, added])
+        assert ResultCache(str(tmp_path / "cache"), "other configuration").get(module) is None
+
+        (tmp_path / "helper.py").write_text("x = 2\n")
+        assert ResultCache(str(tmp_path / "cache"), "configuration").get(module) is None
+        (tmp_path / "helper.py").write_text("x = 1\n")
+        assert ResultCache(str(tmp_path / "cache"), "configuration").get(module) == ("result",)
+
+        (tmp_path / "added.py").write_text("")
+        assert ResultCache(str(tmp_path / "cache"), "configuration").get(module) is None
+        os.remove(added)
+        (tmp_path / "module.py").write_text("import helper as h\n")
+        assert ResultCache(str(tmp_path / "cache"), "configuration").get(module) is None
+
+    def test_dependencies(self, tmp_path, monkeypatch):
+        """Test whether the dependencies are the modules imported directly and indirectly, and the shadowing paths."""
+        (tmp_path / "package").mkdir()
+        (tmp_path / "package" / "__init__.py").write_text("")
+        (tmp_path / "package" / "first.py").write_text("from . import second\n")
+        (tmp_path / "package" / "second.py").write_text("import os\n")
+        (tmp_path / "module.py").write_text("from package.first import name\n")
+        monkeypatch.setattr(sys, "path", [str(tmp_path)] + sys.path)
+
+        dependencies = ResultCache.dependencies(str(tmp_path / "module.py"))
+        package = str(tmp_path / "package")
+        assert os.path.join(package, "__init__.py") in dependencies
+        assert os.path.join(package, "first.py") in dependencies
+        assert os.path.join(package, "second.py") in dependencies
+        # Adding these files changes what is imported.
+        assert str(tmp_path / "package.py") in dependencies and str(tmp_path / "os.py") in dependencies
+        # 'name' is imported from a module, so it is not a module itself.
+        assert os.path.join(package, "first", "name.py") not in dependencies
+        assert not [dependency for dependency in dependencies if "site-packages" in dependency]
+
+    def test_depend_on_file(self, tmp_path, monkeypatch):
+        """Test whether the files read while checking a module are dependencies of the module."""
+        monkeypatch.setattr(ResultCache, "record_read_files", True)
+        (tmp_path / "module.py").write_text("import pandas as pd\npd.read_csv('data.csv')\n")
+        module = astroid.parse("import pandas as pd\npd.read_csv('data.csv')\n", path=str(tmp_path / "module.py"))
+        ResultCache.depend_on_file(module.body[1], str(tmp_path / "data.csv"))
+        assert str(tmp_path / "data.csv") in ResultCache.dependencies(str(tmp_path / "module.py"))
+        assert str(tmp_path / "data.csv") not in ResultCache.dependencies(str(tmp_path / "module.py"))
+
+    def test_depend_on_file_keyword(self, tmp_path, monkeypatch):
+        """Test whether a dataset passed by keyword is a dependency of the module reading it."""
+        monkeypatch.setattr(ResultCache, "record_read_files", True)
+        (tmp_path / "data.csv").write_text("a,b\n1,2\n")
+        code = "import pandas as pd\npd.read_csv(filepath_or_buffer='" + str(tmp_path / "data.csv") + "')\n"
+        (tmp_path / "module.py").write_text(code)
+        module = astroid.parse(code, path=str(tmp_path / "module.py"))
+        pandas_read_csv(module.body[1].value)
+        assert str(tmp_path / "data.csv") in ResultCache.dependencies(str(tmp_path / "module.py"))
+
+    def test_cli_cached(self, tmp_path):
+        """Test whether the dslinter command line interface reports the same messages from the cache."""
+        (tmp_path / "module.py").write_text(
+            '"""Module."""\nimport torch\n\n\ndef run(net, x):\n    """Run."""\n    return net.forward(x)\n'
+        )
+        args = [
+            sys.executable, "-m", "dslinter", "--persistent=n", "-sn", "--result-cache-dir", str(tmp_path / "cache"),
+            str(tmp_path / "module.py"),
+        ]
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        first = subprocess.run(args, capture_output=True, text=True, env=env, check=False)
+        assert "(forward-pytorch)" in first.stdout
+        assert os.listdir(tmp_path / "cache")
+        second = subprocess.run(args, capture_output=True, text=True, env=env, check=False)
+        assert (second.returncode, second.stdout) == (first.returncode, first.stdout)
@@ -0,0 +1,92 @@
+"""Class which tests the scheduler utils module."""
+import os
+import subprocess
+import sys
+
+from dslinter.utils.scheduler import FileScheduler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class TestFileScheduler:
+    """Class which tests the FileScheduler."""
+
+    @staticmethod
+    def take_all(scheduler: FileScheduler, worker: int):
+        """
+        Take files for a worker until all files are taken.
+
+        :param scheduler: The scheduler.
+        :param worker: Number of the worker.
+        :return: Positions of the files.
+        """
+        files = []
+        file = scheduler.next(worker)
+        while file is not None:
+            files.append(file)
+            file = scheduler.next(worker)
+        return files
+
+    def test_largest_first(self):
+        """Test whether the files are assigned largest first to the worker with the least bytes assigned."""
+        scheduler = FileScheduler([10, 50, 20, 40], 2)
+        assert [scheduler.next(0), scheduler.next(1), scheduler.next(0), scheduler.next(1)] == [1, 3, 0, 2]
+        assert scheduler.next(0) is None and scheduler.next(1) is None
+
+    def test_steal(self):
+        """Test whether a worker without files steals from the worker with the most bytes remaining."""
+        scheduler = FileScheduler([1000, 10, 10, 10, 10], 3)
+        assert scheduler.next(0) == 0
+        assert TestFileScheduler.take_all(scheduler, 1) == [1, 3, 2, 4]
+        assert scheduler.next(2) is None
+
+    def test_more_workers_than_files(self):
+        """Test whether workers without files get none."""
+        scheduler = FileScheduler([5], 3)
+        assert scheduler.next(2) == 0
+        assert scheduler.next(0) is None
+
+
+class TestScheduledCheck:
+    """Class which tests checking files in parallel with the dslinter command line interface."""
+
+    MODULE = (
+        '"""Module {}."""\n'
+        "import torch\n"
+        "from torch.utils.data import DataLoader\n"
+        "\n"
+        "\n"
+        "def load(dataset, net, x):\n"
+        '    """Load the dataset."""\n'
+        "    net.forward(x)\n"
+        "    return DataLoader(dataset){}\n"
+    )
+
+    @staticmethod
+    def run_dslinter(paths, jobs: int):
+        """
+        Run the dslinter command line interface.
+
+        :param paths: Paths of the modules to check.
+        :param jobs: Number of processes.
+        :return: The exit status and the output.
+        """
+        args = [sys.executable, "-m", "dslinter", "-j", str(jobs), "--persistent=n", "-sn"]
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        process = subprocess.run(args + paths, capture_output=True, text=True, env=env, check=False)
+        return process.returncode, process.stdout
+
+    def test_parallel_equals_serial(self, tmp_path):
+        """Test whether the messages are reported in the same order and format as in a single process."""
+        paths = []
+        for number in range(5):
+            path = tmp_path / "module_{}.py".format(number)
+            # The sizes differ, so the files are checked in another order than they are reported in.
+            path.write_text(TestScheduledCheck.MODULE.format(number, "\n" * 100 * number))
+            paths.append(str(path))
+
+        status, serial = TestScheduledCheck.run_dslinter(paths, 1)
+        assert "module_4.py:8:4: W5516: " in serial and "(forward-pytorch)" in serial
+        # Only the checkers of dslinter run, e.g., not the import checker of pylint.
+        assert "import-error" not in serial
+        assert TestScheduledCheck.run_dslinter(paths, 3) == (status, serial)
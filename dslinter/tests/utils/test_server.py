@@ -0,0 +1,89 @@
+"""Class which tests the lint server."""
+import io
+import os
+import subprocess
+import sys
+import time
+
+from astroid import MANAGER
+
+from dslinter.cli import DslinterLinter
+from dslinter.server import LintServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class TestLintServer:
+    """Class which tests the lint server."""
+
+    MODULE = '"""Module."""\nimport torch\n\n\ndef run(net, x):\n    """Run."""\n    return net.forward(x)\n'
+
+    def test_messages(self):
+        """Test whether the messages written are read back with their headers."""
+        stream = io.BytesIO()
+        LintServer.write_message(stream, {"jsonrpc": "2.0", "id": 1, "method": "initialize"})
+        LintServer.write_message(stream, {"jsonrpc": "2.0", "method": "exit", "params": {"text": "é"}})
+        stream.seek(0)
+        assert LintServer.read_message(stream) == {"jsonrpc": "2.0", "id": 1, "method": "initialize"}
+        assert LintServer.read_message(stream)["params"] == {"text": "é"}
+        assert LintServer.read_message(stream) is None
+
+    def test_uri_to_path(self):
+        """Test whether file URIs are converted to paths."""
+        assert LintServer.uri_to_path("file:///tmp/my%20module.py") == "/tmp/my module.py"
+        assert LintServer.uri_to_path("/tmp/module.py") == "/tmp/module.py"
+
+    def test_forget_linted_code(self, tmp_path):
+        """Test whether the modules of the linted code are parsed again, unlike the modules of the standard library."""
+        server = LintServer(DslinterLinter(), [str(tmp_path)])
+        (tmp_path / "helper.py").write_text("x = 1\n")
+        MANAGER.ast_from_file(str(tmp_path / "helper.py"), "helper")
+        MANAGER.ast_from_module_name("json")
+        MANAGER.ast_from_module_name("os")
+        server._forget_linted_code()  # pylint: disable = protected-access
+        assert "helper" not in MANAGER.astroid_cache
+        assert "json" in MANAGER.astroid_cache and "os" in MANAGER.astroid_cache
+
+    def test_serve(self, tmp_path):
+        """Test whether the diagnostics of an edited file are published over stdio, quickly once the server runs."""
+        uri = (tmp_path / "module.py").as_uri()
+        process = subprocess.Popen(
+            [
+                sys.executable, "-m", "dslinter.server", "--persistent=n", "--type-inference-backend=propagation",
+                str(tmp_path),
+            ],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=dict(os.environ, PYTHONPATH=ROOT),
+        )
+
+        def send(method, params, request_id=None):
+            message = {"jsonrpc": "2.0", "method": method, "params": params}
+            if request_id is not None:
+                message["id"] = request_id
+            LintServer.write_message(process.stdin, message)
+
+        try:
+            send("initialize", {"rootUri": tmp_path.as_uri()}, 1)
+            assert "capabilities" in LintServer.read_message(process.stdout)["result"]
+            send("textDocument/didOpen", {"textDocument": {"uri": uri, "text": TestLintServer.MODULE, "version": 1}})
+            diagnostics = LintServer.read_message(process.stdout)["params"]["diagnostics"]
+            assert [diagnostic["code"] for diagnostic in diagnostics] == ["forward-pytorch"]
+            assert diagnostics[0]["range"]["start"] == {"line": 6, "character": 11}
+
+            start = time.time()
+            text = TestLintServer.MODULE.replace("net.forward(x)", "net(x)")
+            send(
+                "textDocument/didChange",
+                {"textDocument": {"uri": uri, "version": 2}, "contentChanges": [{"text": text}]},
+            )
+            notification = LintServer.read_message(process.stdout)
+            assert time.time() - start < 1
+            assert notification["params"] == {"uri": uri, "diagnostics": []}
+
+            send("dslinter/unknown", {}, 2)
+            assert LintServer.read_message(process.stdout)["error"]["code"] == LintServer.METHOD_NOT_FOUND
+            send("shutdown", None, 3)
+            assert LintServer.read_message(process.stdout) == {"jsonrpc": "2.0", "id": 3, "result": None}
+            send("exit", None)
+            assert process.wait(timeout=10) == 0
+        finally:
+            process.kill()
@@ -0,0 +1,74 @@
+"""Class which tests the SignatureDatabase utils class."""
+import struct
+
+import pytest
+
+from dslinter.utils.signature_database import SignatureDatabase
+
+SECTIONS = [
+    ("scikitlearn", "0.22.2", {"KMeans": (2, ["n_clusters", "init"]), "PCA": (1, ["n_components"])}),
+    ("pytorch", "1.10", {"SGD": (2, ["params", "lr"])}),
+    ("scikitlearn", "1.0", {"KMeans": (1, ["n_clusters"]), "Ridge": (1, ["alpha"])}),
+]
+
+
+@pytest.fixture(name="database")
+def fixture_database(tmp_path) -> SignatureDatabase:
+    """Write the sections to a database and open it."""
+    path = str(tmp_path / "signatures.db")
+    SignatureDatabase.write(path, SECTIONS)
+    return SignatureDatabase(path)
+
+
+class TestSignatureDatabase:
+    """Class which tests the SignatureDatabase utils class."""
+
+    def test_sections(self, database):
+        """Test whether the sections are keyed by library and version in the order they are written."""
+        assert database.sections() == [("scikitlearn", "0.22.2"), ("pytorch", "1.10"), ("scikitlearn", "1.0")]
+
+    def test_signatures_of_version(self, database):
+        """Test whether the signature of a class is read from the section of a version of a library."""
+        signature = database.signatures("scikitlearn", "0.22.2")["KMeans"]
+        assert signature["positional"] == 2 and signature["keywords"] == frozenset(["n_clusters", "init"])
+
+    def test_signatures_of_latest_version(self, database):
+        """Test whether the last section of a library is used when no version is given."""
+        signatures = database.signatures("scikitlearn")
+        assert "Ridge" in signatures and "PCA" not in signatures
+        assert signatures["KMeans"]["positional"] == 1
+
+    def test_signatures_missing_class(self, database):
+        """Test whether a class which is not in the section is not found."""
+        signatures = database.signatures("pytorch")
+        assert "Adam" not in signatures
+        with pytest.raises(KeyError):
+            signatures["Adam"]  # pylint: disable = pointless-statement
+
+    def test_signatures_missing_library(self, database):
+        """Test whether a library which is not in the database raises a KeyError."""
+        with pytest.raises(KeyError):
+            database.signatures("tensorflow")
+
+    def test_iteration(self, database):
+        """Test whether the classes of a section are iterated in sorted order."""
+        signatures = database.signatures("scikitlearn", "0.22.2")
+        assert list(signatures) == ["KMeans", "PCA"] and len(signatures) == 2
+
+    def test_read_sections(self, database):
+        """Test whether all sections can be read back as they are written."""
+        assert database.read_sections() == SECTIONS
+
+    def test_schema_version(self, tmp_path):
+        """Test whether a database of another schema version is refused."""
+        path = tmp_path / "signatures.db"
+        path.write_bytes(struct.pack("<8sII", SignatureDatabase.MAGIC, SignatureDatabase.SCHEMA_VERSION + 1, 0))
+        with pytest.raises(ValueError):
+            SignatureDatabase(str(path))
+
+    def test_not_a_database(self, tmp_path):
+        """Test whether a file which is not a database is refused."""
+        path = tmp_path / "signatures.pickle"
+        path.write_bytes(b"\x80\x04\x95" + bytes(32))
+        with pytest.raises(ValueError):
+            SignatureDatabase(str(path))
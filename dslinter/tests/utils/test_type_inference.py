@@ -16,6 +16,36 @@ class TestTypeInference:
     #
     #     assert result == {module_node.body[1].value: "builtins.str"}
 
+    def test_infer_types_shared(self, monkeypatch):
+        """Test whether the same query on the same module runs mypy only once."""
+        module_node = astroid.parse("a = 'b'\na.join([])")
+        mypy_runs = []
+        monkeypatch.setattr(TypeInference, "run_mypy", lambda code: mypy_runs.append(code) or "")
+
+        first = TypeInference.infer_types(module_node, astroid.Call, lambda x: x.func.expr.name)
+        second = TypeInference.infer_types(module_node, astroid.Call, lambda node: node.func.expr.name)
+        assert first is second and len(mypy_runs) == 1
+
+    def test_infer_types_without_libraries(self, monkeypatch):
+        """Test whether mypy is not ran on a module which does not use the libraries."""
+        module_node = astroid.parse("import os\na = 'b'\na.join([])")
+        mypy_runs = []
+        monkeypatch.setattr(TypeInference, "run_mypy", lambda code: mypy_runs.append(code) or "")
+
+        result = TypeInference.infer_types(module_node, astroid.Call, lambda x: x.func.expr.name, ("pandas",))
+        assert result == {} and mypy_runs == []
+
+    def test_uses_libraries(self):
+        """Test whether modules importing and referencing the libraries are recognized."""
+        libraries = ("pandas", "pyspark")
+        assert TypeInference.uses_libraries(astroid.parse("import pandas as pd\npd.DataFrame()"), libraries)
+        assert TypeInference.uses_libraries(astroid.parse("from pyspark.sql import Row\nRow()"), libraries)
+        assert TypeInference.uses_libraries(astroid.parse("import pandas.io\npandas.io"), libraries)
+        assert TypeInference.uses_libraries(astroid.parse("from pandas import *"), libraries)
+        assert not TypeInference.uses_libraries(astroid.parse("import pandas as pd\nx = 1"), libraries)
+        assert not TypeInference.uses_libraries(astroid.parse("import numpy as np\nnp.zeros(1)"), libraries)
+        assert not TypeInference.uses_libraries(astroid.parse("from . import pandas\npandas.f()"), libraries)
+
     def test_add_reveal_type_calls(self):
         """Test the add_reveal_type_calls() method with a single expression."""
         code = "a = b.c(d)"
@@ -43,6 +73,22 @@ class TestTypeInference:
         result = TypeInference.run_mypy("a: str = 5")
         assert result.splitlines()[1] == "Found 1 error in 1 file (checked 1 source file)"
 
+    def test_run_mypy_in_memory(self, tmp_path, monkeypatch):
+        """Test if mypy runs on the code without writing it to the working directory."""
+        monkeypatch.chdir(tmp_path)
+        result = TypeInference.run_mypy("a = 5\nreveal_type(a)")
+        assert result.startswith('<string>:2: note: Revealed type is "builtins.int"')
+        assert [path.name for path in tmp_path.iterdir()] in ([], [".mypy_cache"])
+
+    def test_run_mypy_timeout(self, monkeypatch):
+        """Test if a TimeoutError is raised when mypy runs longer than the timeout."""
+        monkeypatch.setattr(TypeInference, "timeout", 0.01)
+        try:
+            TypeInference.run_mypy("a = 5")
+            assert False, "TimeoutError expected"
+        except TimeoutError:
+            pass
+
     def test_parse_mypy_result(self):
         """Test if the parse_mypy_result method returns the correct type."""
         mypy_result = "<string>:1: note: Revealed type is 'builtins.int'"
@@ -63,6 +109,14 @@ class TestTypeInference:
         result = TypeInference.combine_nodes_with_inferred_types(nodes, types)
         assert result == {nodes[0]: types[0][1]}
 
+    def test_combine_nodes_with_inferred_types_same_line(self):
+        """Test if combine_nodes_with_inferred_types assigns the types on a line in order."""
+        module = astroid.parse("a.b(); c.d(); e.f()\ng.h()")
+        nodes = [module.body[0].value, module.body[1].value, module.body[2].value, module.body[3].value]
+        types = [(1, "t1"), (1, "t2"), (1, "t3"), (2, "t4")]
+        result = TypeInference.combine_nodes_with_inferred_types(nodes, types)
+        assert result == {nodes[0]: "t1", nodes[1]: "t2", nodes[2]: "t3", nodes[3]: "t4"}
+
     def test_add_reveal_type_calls_block(self):
         """Test if the reveal_type() call is added to the body of a block statement."""
         code = "y = ''\nfor x in y.join([]):\n\tpass"
@@ -0,0 +1,47 @@
+"""Class which tests the TypeInferenceCache utils class."""
+import os
+
+from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+
+
+class TestTypeInferenceCache:
+    """Class which tests the TypeInferenceCache utils class."""
+
+    def test_put_get(self, tmp_path):
+        """Test whether stored types are returned for the same code."""
+        cache = TypeInferenceCache(str(tmp_path), 1024 * 1024)
+        cache.put("a = 5; reveal_type(a)", [(1, '"builtins.int"')])
+        assert cache.get("a = 5; reveal_type(a)") == [(1, '"builtins.int"')]
+
+    def test_get_miss(self, tmp_path):
+        """Test whether None is returned for code which is not cached."""
+        cache = TypeInferenceCache(str(tmp_path), 1024 * 1024)
+        cache.put("a = 5; reveal_type(a)", [(1, '"builtins.int"')])
+        assert cache.get("a = '5'; reveal_type(a)") is None
+
+    def test_persistent(self, tmp_path):
+        """Test whether stored types are returned by another cache on the same directory."""
+        TypeInferenceCache(str(tmp_path), 1024 * 1024).put("a = 5", [])
+        assert TypeInferenceCache(str(tmp_path), 1024 * 1024).get("a = 5") == []
+
+    def test_eviction(self, tmp_path):
+        """Test whether the least recently used entries are evicted when the cache is too large."""
+        cache = TypeInferenceCache(str(tmp_path), 1000)
+        for i in range(100):
+            cache.put("a = {}".format(i), [(1, '"builtins.int"')])
+        sizes = [os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(tmp_path) for name in names]
+        assert sum(sizes) <= 1000 and cache.get("a = 99") is not None
+
+    def test_reveal_types_cached(self, tmp_path, monkeypatch):
+        """Test whether mypy is not ran again for code which is cached."""
+        mypy_runs = []
+        monkeypatch.setattr(TypeInference, "cache", TypeInferenceCache(str(tmp_path), 1024 * 1024))
+        monkeypatch.setattr(
+            TypeInference,
+            "run_mypy",
+            lambda code: mypy_runs.append(code) or "<string>:1: note: Revealed type is \"builtins.int\"",
+        )
+        TypeInference.reveal_types("a = 5; reveal_type(a)")
+        assert TypeInference.reveal_types("a = 5; reveal_type(a)") == [(1, '"builtins.int"')]
+        assert len(mypy_runs) == 1
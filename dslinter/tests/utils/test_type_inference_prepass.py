@@ -0,0 +1,95 @@
+"""Class which tests the TypeInferencePrepass utils class."""
+import os
+
+import astroid
+
+from dslinter.utils.ast import ASTUtil
+from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+from dslinter.utils.type_inference_prepass import TypeInferencePrepass
+
+
+class TestTypeInferencePrepass:
+    """Class which tests the TypeInferencePrepass utils class."""
+
+    def test_prepare(self, tmp_path, monkeypatch):
+        """Test whether types inferred by the pre-pass are used without running mypy again."""
+        code = "a = 'b'\na.join([])"
+        for name in ["first.py", "second.py"]:
+            (tmp_path / name).write_text(code, encoding="utf-8")
+        monkeypatch.setattr(TypeInference, "prepass_queries", [])
+        TypeInference.register_prepass_query(astroid.Call, TypeInference.called_object_name)
+        prepass = TypeInferencePrepass()
+        prepass.prepare([str(tmp_path / "first.py"), str(tmp_path / "second.py")])
+        monkeypatch.setattr(TypeInference, "prepass", prepass)
+
+        monkeypatch.setattr(TypeInference, "run_mypy", lambda code: "")
+        module_node = astroid.parse(code)
+        result = TypeInference.infer_types(module_node, astroid.Call, TypeInference.called_object_name)
+        assert result == {module_node.body[1].value: '"builtins.str"'}
+
+    def test_run_mypy_batch_syntax_error(self):
+        """Test whether a syntax error in one piece of code does not block the others."""
+        result = TypeInferencePrepass.run_mypy_batch({"valid": "a = 5\nreveal_type(a)", "invalid": "a = ("})
+        assert TypeInference.parse_mypy_result(result["valid"]) == [(2, '"builtins.int"')]
+        assert ": error: " in result["invalid"]
+
+    def test_run_mypy_batch_without_report(self, tmp_path, monkeypatch):
+        """Test whether code mypy does not report on is left out, instead of getting an empty report."""
+        monkeypatch.chdir(tmp_path)
+        result = TypeInferencePrepass.run_mypy_batch({"revealed": "a = 5\nreveal_type(a)", "silent": "b = 5"})
+        assert list(result) == ["revealed"]
+        assert TypeInference.parse_mypy_result(result["revealed"]) == [(2, '"builtins.int"')]
+
+    def test_run_mypy_batch_stable_paths(self, tmp_path, monkeypatch):
+        """Test whether the modules keep their paths in between runs, with the incremental cache of mypy."""
+        monkeypatch.setattr(TypeInference, "cache", TypeInferenceCache(str(tmp_path), 1024 * 1024))
+        directory = TypeInferencePrepass.batch_directory()
+        assert directory == str(tmp_path / TypeInferenceCache.MYPY_DIRECTORY)
+
+        first = TypeInferencePrepass.run_mypy_batch({"a": "a = 5\nreveal_type(a)"})
+        modules = sorted(name for name in os.listdir(directory) if name.endswith(".py"))
+        assert len(modules) == 1 and os.path.isdir(os.path.join(directory, ".mypy_cache"))
+        assert TypeInferencePrepass.run_mypy_batch({"b": "a = 5\nreveal_type(a)"}) == {"b": first["a"]}
+        assert sorted(name for name in os.listdir(directory) if name.endswith(".py")) == modules
+
+        # A module which was not type checked for a while is removed.
+        monkeypatch.setattr(TypeInferencePrepass, "BATCH_STALE_AFTER", -1)
+        TypeInferencePrepass.run_mypy_batch({"c": "c = 'c'\nreveal_type(c)"})
+        assert not [name for name in os.listdir(directory) if name.endswith(".py")]
+
+    def test_prepare_cache_in_working_directory(self, tmp_path, monkeypatch):
+        """Test whether the pre-pass stores the revealed types with an absolute cache directory in the working directory."""
+        monkeypatch.chdir(tmp_path)
+        code = "a = 'b'\na.join([])"
+        (tmp_path / "module.py").write_text(code, encoding="utf-8")
+        cache = TypeInferenceCache(str(tmp_path / ".cache"), 1024 * 1024)
+        monkeypatch.setattr(TypeInference, "cache", cache)
+        monkeypatch.setattr(TypeInference, "prepass_queries", [])
+        TypeInference.register_prepass_query(astroid.Call, TypeInference.called_object_name)
+        TypeInferencePrepass().prepare([str(tmp_path / "module.py")])
+
+        nodes = ASTUtil.search_nodes(astroid.parse(code), astroid.Call)
+        mypy_code = TypeInference.add_reveal_type_calls(code, nodes, TypeInference.called_object_name)
+        assert cache.get(mypy_code) == [(2, '"builtins.str"')]
+
+    def test_run_mypy_shards(self):
+        """Test whether type checking shards in parallel processes reports on every piece of code."""
+        codes = {"int": "a = 5\nreveal_type(a)", "str": "a = 'b'\nreveal_type(a)", "invalid": "a = ("}
+        result = TypeInferencePrepass(2).run_mypy_shards(codes)
+        assert TypeInference.parse_mypy_result(result["int"]) == [(2, '"builtins.int"')]
+        assert TypeInference.parse_mypy_result(result["str"]) == [(2, '"builtins.str"')]
+        assert ": error: " in result["invalid"]
+
+    def test_run_mypy_shards_cache_in_working_directory(self, tmp_path, monkeypatch):
+        """Test whether the shards report on every piece of code with a cache directory in the working directory."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(TypeInference, "cache", TypeInferenceCache(str(tmp_path / ".cache"), 1024 * 1024))
+        result = TypeInferencePrepass(2).run_mypy_shards({"int": "a = 5\nreveal_type(a)", "str": "a = 'b'\nreveal_type(a)"})
+        assert TypeInference.parse_mypy_result(result["int"]) == [(2, '"builtins.int"')]
+        assert TypeInference.parse_mypy_result(result["str"]) == [(2, '"builtins.str"')]
+
+    def test_processes(self):
+        """Test whether the pre-pass runs in the configured number of processes, or one per available core."""
+        assert TypeInferencePrepass(3).processes() == 3
+        assert TypeInferencePrepass().processes() >= 1
@@ -0,0 +1,88 @@
+"""Class which tests the TypePropagation utils class."""
+import astroid
+
+from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.type_propagation import TypePropagation
+
+
+class TestTypePropagation:
+    """Class which tests the TypePropagation utils class."""
+
+    DF = TypePropagation.DATAFRAME
+
+    @staticmethod
+    def _types(code: str):
+        """Infer the types of the objects the functions are called on, by line number."""
+        module = astroid.parse(code)
+        calls = list(module.nodes_of_class(astroid.Call))
+        result = TypePropagation.infer_types(calls, TypeInference.called_object_name)
+        return {call.lineno: inferred_type for call, inferred_type in result.items()}
+
+    def test_factory_and_methods(self):
+        """Test whether the types of library functions and methods are propagated."""
+        code = "import pandas as pd\ndf = pd.read_csv('a')\ndf2 = df.dropna()\ndf2.abs()\nx = df.sum()\nx.abs()"
+        assert self._types(code) == {3: self.DF, 4: self.DF, 5: self.DF}
+
+    def test_scopes(self):
+        """Test whether variables with the same name in different functions do not overwrite each other."""
+        code = (
+            "import pandas as pd\n"
+            "def f():\n"
+            "    df = pd.DataFrame()\n"
+            "    df.abs()\n"
+            "def g():\n"
+            "    df = 5\n"
+            "    df.abs()\n"
+            "def h(df: pd.DataFrame, other):\n"
+            "    df.abs()\n"
+            "    other.abs()\n"
+        )
+        assert self._types(code) == {4: self.DF, 9: self.DF}
+
+    def test_flow_sensitive(self):
+        """Test whether a variable only has a type when every path to a program point gives it that type."""
+        code = (
+            "import pandas as pd\n"
+            "df = pd.DataFrame()\n"
+            "df.abs()\n"
+            "if c:\n"
+            "    df = 1\n"
+            "df.abs()\n"
+            "for x in y:\n"
+            "    df = pd.DataFrame()\n"
+            "    df.abs()\n"
+            "df.abs()\n"
+        )
+        assert self._types(code) == {3: self.DF, 9: self.DF}
+
+    def test_loop(self):
+        """Test whether a variable assigned later in a loop has no type at the start of the loop."""
+        code = "import pandas as pd\ndf = pd.DataFrame()\nfor x in y:\n    df.abs()\n    df = 1\n"
+        assert self._types(code) == {}
+
+    def test_inplace(self):
+        """Test whether the result of a method called with the inplace argument has no type."""
+        code = "import pandas as pd\ndf = pd.DataFrame()\ndf2 = df.dropna(inplace=True)\ndf2.abs()"
+        assert self._types(code) == {3: self.DF}
+
+    def test_enclosing_scope(self):
+        """Test whether a variable of the module has a type in a function when it always has the same type."""
+        code = (
+            "from pandas import read_csv\n"
+            "df = read_csv('a')\n"
+            "other = read_csv('b')\n"
+            "other = 1\n"
+            "def f():\n"
+            "    df.abs()\n"
+            "    other.abs()\n"
+            "    [df.abs() for df in range(3)]\n"
+        )
+        assert self._types(code) == {6: self.DF}
+
+    def test_infer_types_backend(self, monkeypatch):
+        """Test whether TypeInference uses the type propagation instead of mypy when configured."""
+        monkeypatch.setattr(TypeInference, "backend", "propagation")
+        monkeypatch.setattr(TypeInference, "run_mypy", lambda code: None)
+        module = astroid.parse("import pandas as pd\ndf = pd.DataFrame()\ndf.abs(); df.abs()")
+        result = TypeInference.infer_types(module, astroid.Call, TypeInference.called_object_name)
+        assert list(result.values()) == [self.DF, self.DF]
@@ -0,0 +1,39 @@
+"""Class which tests the VariableProvenance utils class."""
+import astroid
+
+from dslinter.utils.variable_provenance import VariableProvenance
+
+
+class TestVariableProvenance:
+    """Class which tests the VariableProvenance utils class."""
+
+    CODE = "import tensorflow as tf\nx = tf.math.add(1, 2)\nx = f(x)\ny = tf.constant(1)\ny = 5\ny = tf.Variable(y)\nz = [1]"
+
+    def test_queries(self):
+        """Test whether all queries answer from the values assigned to a variable."""
+        provenance = VariableProvenance(astroid.parse(self.CODE))
+        assert provenance.names() == ["x", "y"]
+        assert provenance.all("x") == ["tf.math.add", "f"]
+        assert provenance.first("x") == "tf.math.add"
+        assert provenance.most_recent("x") == "f"
+        assert provenance.root_library("x") == "f"
+        assert provenance.library_submodule("x") is None
+        assert provenance.library_submodule("x", first=True) == "tf.math"
+
+    def test_const_replaces_values(self):
+        """Test whether assigning a constant replaces the values assigned before."""
+        provenance = VariableProvenance(astroid.parse(self.CODE))
+        assert provenance.all("y") == ["const", "tf.Variable"]
+        assert provenance.first("y") == "const"
+
+    def test_unknown_variable(self):
+        """Test whether a variable which is not assigned from a call or constant is not indexed."""
+        provenance = VariableProvenance(astroid.parse(self.CODE))
+        assert provenance.all("z") == []
+        assert provenance.first("z") is None and provenance.most_recent("z") is None
+        assert provenance.root_library("z") is None and provenance.library_submodule("z") is None
+
+    def test_of_shared(self):
+        """Test whether the index of a module is built once."""
+        module = astroid.parse(self.CODE)
+        assert VariableProvenance.for_module(module) is VariableProvenance.for_module(module)
@@ -0,0 +1,50 @@
+"""Utility module for looking up the values assigned to names in a module."""
+from typing import Dict, List
+
+import astroid
+
+from dslinter.utils.module_cache import ModuleCache
+
+
+class AssignmentIndex:
+    """
+    Index of the values assigned to the names in a module.
+
+    The values of a name are those of the (Ann)Assign nodes in the body of the module with the name
+    as a target, which is what AssignUtil.assignment_values resolves a name to.
+    """
+
+    def __init__(self, module: astroid.Module):
+        """
+        Build the index of a module.
+
+        :param module: The module to index.
+        """
+        self._values: Dict[str, List[astroid.node_classes.NodeNG]] = {}
+        for node in module.body:
+            if isinstance(node, astroid.Assign):
+                names = {target.name for target in node.targets if hasattr(target, "name")}
+                for name in sorted(names):
+                    self._values.setdefault(name, []).append(node.value)
+            elif isinstance(node, astroid.AnnAssign) and hasattr(node.target, "name"):
+                self._values.setdefault(node.target.name, []).append(node.value)
+
+    @staticmethod
+    def for_module(module: astroid.Module) -> "AssignmentIndex":
+        """
+        Get the index of a module, which is built once and shared by all checkers.
+
+        :param module: The module to get the index of.
+        :return: The index of the module.
+        """
+        return ModuleCache.get(module, "assignment_index", lambda: AssignmentIndex(module))
+
+    def values(self, name: str) -> List[astroid.node_classes.NodeNG]:
+        """
+        Get the values assigned to a name in the body of the module.
+
+        :param name: The name.
+        :return: The value nodes in the order they are assigned, empty when the name is
+            not assigned.
+        """
+        return list(self._values.get(name, []))
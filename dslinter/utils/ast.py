@@ -2,6 +2,10 @@
 from typing import List, Optional, Tuple, Union
 import astroid
 
+from dslinter.utils.assignment_index import AssignmentIndex
+from dslinter.utils.call_site_index import CallSiteIndex
+from dslinter.utils.node_index import NodeIndex
+
 
 class ASTUtil:
     """Utility class for working with the Abstract Syntax Tree (AST)."""
@@ -10,18 +14,21 @@ class ASTUtil:
     @staticmethod
     def search_nodes(node: astroid.node_classes.NodeNG, type_searched: type) -> List[astroid.node_classes.NodeNG]:
         """
-        Search recursively for all nodes of a certain type.
+        Search for all nodes of a certain type in the subtree of a node.
+
+        The nodes of a module are indexed once and the index is shared by all searches in the module,
+        see NodeIndex.
 
         :param node: Node which is visited.
         :param type_searched: Type of node where is searched for.
+        :return: The nodes found, the children of a node before the node itself.
         """
-        found: List = []
-        for child in node.get_children():
-            found += ASTUtil.search_nodes(child, type_searched)
-
-        if isinstance(node, type_searched):
-            found.append(node)
-        return found
+        root = node.root()
+        if isinstance(root, astroid.Module):
+            index = NodeIndex.for_module(root)
+            if index.contains(node):
+                return index.search(node, type_searched)
+        return NodeIndex(node).search(node, type_searched)
 
     @staticmethod
     def get_source_code(node: astroid.Module) -> str:
@@ -123,6 +130,8 @@ class AssignUtil:
         """
         Search for the value of the assignment to the name of a Name node.
 
+        The values are looked up in the AssignmentIndex of the module, shared by all checkers.
+
         :param name_node: Node of which the assignment value is searched.
         :return: Value nodes which are assigned to the name from the Name node.
         """
@@ -131,28 +140,7 @@ class AssignUtil:
         if function_with_arg is not None:
             return AssignUtil._function_arg_values(function_with_arg, name, idx)
 
-        return AssignUtil._assign_values_in_body_of_parents(name, name_node)
-
-    @staticmethod
-    def _assign_values_in_body_of_parents(
-        name: str, node: astroid.node_classes.NodeNG
-    ) -> List[astroid.node_classes.NodeNG]:
-        """
-        Search for the value of the assignment to the name of a Name node in body of parents.
-
-        :param name: Name to look for.
-        :param node: Node of which is searched in the body of its parents.
-        :return: The value node of the assignment or None when it is not found.
-        """
-        values = []
-        body_block = ASTUtil.search_body(node)
-        for child in body_block:
-            if isinstance(child, (astroid.AnnAssign, astroid.Assign)) \
-                    and AssignUtil.is_target(name, child):
-                values.append(child.value)
-        if hasattr(node, "parent") and node.parent is not None:
-            return AssignUtil._assign_values_in_body_of_parents(name, node.parent)
-        return values
+        return AssignmentIndex.for_module(name_node.root()).values(name)
 
     @staticmethod
     def _name_is_arg_from_function(
@@ -180,23 +168,15 @@ class AssignUtil:
         """
         Search the values a certain argument of a function gets assigned.
 
-        Calls to the function will be searched for in the parent of the FunctionDef node.
+        Calls to the function will be searched for in the parent of the FunctionDef node, using the
+        CallSiteIndex of the module.
 
         :param node: FunctionDef node which contains the argument.
         :param arg_name: Name of the argument.
         :param arg_position: Position of the argument.
         :return: All values this argument gets assigned.
         """
-        values = []
-        for call_node in ASTUtil.search_nodes(node.parent, astroid.Call):
-            if hasattr(call_node.func, "name") and call_node.func.name == node.name:
-                if call_node.args is not None and len(call_node.args) > arg_position:
-                    values.append(call_node.args[arg_position])
-                if call_node.keywords is not None:
-                    keyword = ASTUtil.retrieve_keyword_from_list(call_node.keywords, arg_name)
-                    if keyword is not None:
-                        values.append(keyword.value)
-        return values
+        return CallSiteIndex.for_module(node.root()).argument_values(node, arg_name, arg_position)
 
     @staticmethod
     def get_assigned_target_names(node: astroid.node_classes.NodeNG) -> List[str]:
@@ -0,0 +1,150 @@
+"""Utility module for inspecting every Call node once for all checkers which check calls."""
+from typing import Any, Callable, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+import astroid
+from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
+
+
+class CallDispatcher:
+    """
+    Dispatcher of the Call nodes to the checkers which check calls to the called name.
+
+    Checkers which only check the calls to certain functions or methods extend
+    DispatchedCallChecker and decorate the methods checking these calls with
+    CallDispatcher.handles, listing the names of the functions and methods, e.g., 'fit' for
+    'model.fit(x)'. Every linter has one dispatcher, of which the methods are registered by name
+    when the linter opens the checkers. The dispatcher visits every Call node once, looks up the
+    called name and calls only the methods which handle that name.
+    """
+
+    _dispatchers: "WeakKeyDictionary[PyLinter, CallDispatcher]" = WeakKeyDictionary()
+
+    def __init__(self):
+        """Create a dispatcher without registered methods."""
+        self._handlers: Dict[str, List[Callable[[astroid.Call], None]]] = {}
+
+    @staticmethod
+    def handles(*names: str) -> Callable:
+        """
+        Decorate a method of a checker to be called for calls to certain names only.
+
+        :param names: Names of the called functions or methods, the name after the last dot.
+        :return: Decorator of the method.
+        """
+
+        def mark(check_call: Callable) -> Callable:
+            check_call.call_names = frozenset(names)
+            return check_call
+
+        return mark
+
+    @staticmethod
+    def register(checker: BaseChecker) -> Optional["CallDispatcher"]:
+        """
+        Register the decorated methods of a checker with the dispatcher of its linter.
+
+        :param checker: Checker of which the methods are decorated with CallDispatcher.handles.
+        :return: The dispatcher, when the checker is the first checker registered with it, which
+            visits the Call nodes for the dispatcher. None otherwise.
+        """
+        created = checker.linter not in CallDispatcher._dispatchers
+        dispatcher = CallDispatcher._dispatchers.setdefault(checker.linter, CallDispatcher())
+        dispatcher.add(checker)
+        return dispatcher if created else None
+
+    def add(self, checker: BaseChecker):
+        """
+        Add the decorated methods of a checker to the methods which handle the called names.
+
+        :param checker: Checker of which the methods are decorated with CallDispatcher.handles.
+        """
+        for name in dir(type(checker)):
+            for call_name in getattr(getattr(type(checker), name), "call_names", ()):
+                self._handlers.setdefault(call_name, []).append(getattr(checker, name))
+
+    @staticmethod
+    def release(linter: PyLinter):
+        """
+        Release the dispatcher of a linter, when the linter closes the checkers.
+
+        :param linter: Linter the checkers are registered with.
+        """
+        CallDispatcher._dispatchers.pop(linter, None)
+
+    @staticmethod
+    def called_name(node: astroid.Call) -> str:
+        """
+        Get the name of the function or method called by a Call node, e.g., 'fit' for
+        'model.fit(x)'.
+
+        :param node: The Call node.
+        :return: The name or an empty string when the called expression has no name, e.g., 'f()()'.
+        """
+        if hasattr(node.func, "attrname"):
+            return node.func.attrname
+        if hasattr(node.func, "name"):
+            return node.func.name
+        return ""
+
+    def visit_call(self, node: astroid.Call):
+        """
+        Forward a Call node to the methods which handle its called name.
+
+        :param node: The Call node which is visited.
+        """
+        for check_call in self._handlers.get(CallDispatcher.called_name(node), ()):
+            check_call(node)
+
+
+class DispatchedCallChecker(BaseChecker):
+    """
+    Checker of which the calls to certain names are dispatched by the CallDispatcher.
+
+    The checker does not visit the Call nodes itself. The first of these checkers the linter opens
+    visits them for all of them, through the visit_call of the dispatcher.
+    """
+
+    def __init__(self, linter: PyLinter = None):
+        """
+        Create the checker.
+
+        :param linter: Linter to register the checker with.
+        """
+        super().__init__(linter)
+        self._call_dispatcher: Optional[CallDispatcher] = None
+
+    def open(self):
+        """Register the checker with the dispatcher of the Call nodes when the linter starts."""
+        self._call_dispatcher = CallDispatcher.register(self)
+
+    def close(self):
+        """Release the dispatcher of the Call nodes when the linter is done."""
+        if self._call_dispatcher is not None:
+            CallDispatcher.release(self.linter)
+            self._call_dispatcher = None
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get the visit_call of the dispatcher, when the checker visits the Call nodes for it.
+
+        :param name: Name of the attribute which is not an attribute of the checker.
+        :return: The visit_call of the dispatcher.
+        """
+        dispatcher = self.__dict__.get("_call_dispatcher")
+        if dispatcher is not None and name == "visit_call":
+            return dispatcher.visit_call
+        raise AttributeError(name)
+
+    def __dir__(self) -> List[str]:
+        """
+        List the attributes of the checker and visit_call, when it visits the Call nodes for the
+        dispatcher.
+
+        :return: The names of the attributes.
+        """
+        names = set(super().__dir__())
+        if self.__dict__.get("_call_dispatcher") is not None:
+            names.add("visit_call")
+        return sorted(names)
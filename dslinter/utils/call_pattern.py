@@ -0,0 +1,341 @@
+"""Utility module for matching calls against declarative call patterns."""
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import astroid
+
+from dslinter.utils.module_cache import ModuleCache
+from dslinter.utils.node_index import NodeIndex
+
+
+class CallPattern:
+    """
+    Pattern of the shape of a call, e.g., '{np,numpy}.random.seed(...)'.
+
+    The called function is a dotted name of which every part is a name or a set of names, e.g.,
+    '{tf,tensorflow}'. The first part can be '*', which matches any expression the function is an
+    attribute of, e.g., '*.clip(...)' matches 'x.clip(0)' and 'f().clip(0)', but not 'clip(0)'.
+
+    The arguments are '...' for any arguments, or patterns for the first positional arguments,
+    optionally followed by ', ...' for any further arguments:
+    - '_' matches any argument,
+    - a call pattern matches an argument which is a call of that shape,
+    - '!' before a call pattern matches an argument which is not a call of that shape, or a
+      missing one.
+    E.g., 'torch.log(!*.{clip,clamp}(...))' matches 'torch.log(x)', but not
+    'torch.log(x.clip(0, 1))'.
+    """
+
+    def __init__(  # pylint: disable = too-many-arguments
+        self,
+        pattern: str,
+        names: List[FrozenSet[str]],
+        any_receiver: bool,
+        arguments: List[Tuple[bool, Optional["CallPattern"]]],
+        more_arguments: bool,
+    ):
+        """
+        Create a parsed call pattern, see CallPattern.parse.
+
+        :param pattern: The pattern it is parsed from.
+        :param names: The names of each part of the called function.
+        :param any_receiver: Whether the function is an attribute of any expression.
+        :param arguments: Whether each argument pattern is negated and its call pattern, None
+            for '_'.
+        :param more_arguments: Whether further arguments are allowed.
+        """
+        self.pattern = pattern
+        self.names = names
+        self.any_receiver = any_receiver
+        self.arguments = arguments
+        self.more_arguments = more_arguments
+
+    @staticmethod
+    def parse(pattern: str) -> "CallPattern":
+        """
+        Parse a call pattern.
+
+        :param pattern: The pattern.
+        :return: The parsed pattern.
+        :raises ValueError: When the pattern is invalid.
+        """
+        return _CallPatternParser(pattern).parse()
+
+    def matches(self, node: astroid.node_classes.NodeNG) -> bool:
+        """
+        Evaluate whether a node is a call of the shape of the pattern.
+
+        :param node: The node.
+        :return: True when the node matches the pattern.
+        """
+        if not isinstance(node, astroid.Call):
+            return False
+        current = node.func
+        for names in reversed(self.names):
+            if isinstance(current, astroid.Attribute) and current.attrname in names:
+                current = current.expr
+            elif isinstance(current, astroid.Name) and current.name in names:
+                current = None
+            else:
+                return False
+        if (current is not None) != self.any_receiver:
+            return False
+        return self.matches_arguments(node)
+
+    def matches_arguments(self, node: astroid.Call) -> bool:
+        """
+        Evaluate whether the arguments of a call match the argument patterns.
+
+        :param node: The Call node.
+        :return: True when the arguments match.
+        """
+        args = node.args or []
+        if not self.more_arguments and len(args) > len(self.arguments):
+            return False
+        for position, (negated, argument) in enumerate(self.arguments):
+            if position >= len(args):
+                if not negated:
+                    return False
+            elif argument is not None and argument.matches(args[position]) == negated:
+                return False
+        return True
+
+
+class _CallPatternParser:  # pylint: disable = too-few-public-methods
+    """Recursive descent parser of call patterns."""
+
+    _TOKEN = re.compile(r"\s*(\.\.\.|[A-Za-z_][A-Za-z0-9_]*|[.,(){}*!])")
+
+    def __init__(self, pattern: str):
+        """
+        Split a call pattern in its tokens.
+
+        :param pattern: The pattern.
+        """
+        self._pattern = pattern
+        self._tokens: List[str] = []
+        self._position = 0
+        position = 0
+        while position < len(pattern.rstrip()):
+            match = _CallPatternParser._TOKEN.match(pattern, position)
+            if match is None:
+                raise ValueError(f"Invalid call pattern '{pattern}' at position {position}.")
+            self._tokens.append(match.group(1))
+            position = match.end()
+
+    def parse(self) -> CallPattern:
+        """
+        Parse the whole pattern.
+
+        :return: The parsed pattern.
+        """
+        pattern = self._parse_call()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected '{self._peek()}' in call pattern '{self._pattern}'.")
+        return pattern
+
+    def _next(self, expected: Optional[str] = None) -> str:
+        """
+        Consume the next token.
+
+        :param expected: The token which is expected or None when any token is expected.
+        :return: The token.
+        """
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of call pattern '{self._pattern}'.")
+        if expected is not None and token != expected:
+            raise ValueError(
+                f"Expected '{expected}' instead of '{token}' in call pattern '{self._pattern}'."
+            )
+        self._position += 1
+        return token
+
+    def _peek(self) -> Optional[str]:
+        """
+        Get the next token without consuming it.
+
+        :return: The token or None at the end of the pattern.
+        """
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _parse_call(self) -> CallPattern:
+        """
+        Parse a call: a dotted name followed by its arguments.
+
+        :return: The parsed call pattern.
+        """
+        any_receiver = self._peek() == "*"
+        if any_receiver:
+            self._next("*")
+            self._next(".")
+        names = [self._parse_names()]
+        while self._peek() == ".":
+            self._next(".")
+            names.append(self._parse_names())
+
+        self._next("(")
+        arguments: List[Tuple[bool, Optional[CallPattern]]] = []
+        more_arguments = False
+        while self._peek() != ")":
+            if arguments:
+                self._next(",")
+            if self._peek() == "...":
+                self._next("...")
+                more_arguments = True
+                break
+            arguments.append(self._parse_argument())
+        self._next(")")
+        return CallPattern(self._pattern, names, any_receiver, arguments, more_arguments)
+
+    def _parse_names(self) -> FrozenSet[str]:
+        """
+        Parse a part of a dotted name: a name or a set of names.
+
+        :return: The names.
+        """
+        if self._peek() != "{":
+            return frozenset([self._parse_name()])
+        self._next("{")
+        names = {self._parse_name()}
+        while self._peek() == ",":
+            self._next(",")
+            names.add(self._parse_name())
+        self._next("}")
+        return frozenset(names)
+
+    def _parse_name(self) -> str:
+        """
+        Parse a name.
+
+        :return: The name.
+        """
+        name = self._next()
+        if not name.isidentifier():
+            raise ValueError(
+                f"Expected a name instead of '{name}' in call pattern '{self._pattern}'."
+            )
+        return name
+
+    def _parse_argument(self) -> Tuple[bool, Optional[CallPattern]]:
+        """
+        Parse an argument pattern.
+
+        :return: Whether the pattern is negated and the call pattern, which is None for '_'.
+        """
+        if self._peek() == "_":
+            self._next("_")
+            return False, None
+        negated = self._peek() == "!"
+        if negated:
+            self._next("!")
+        return negated, self._parse_call()
+
+
+class _TrieNode:  # pylint: disable = too-few-public-methods
+    """Node of the trie of call patterns, reached by the names of a called function backwards."""
+
+    def __init__(self):
+        """Create a node without children and patterns."""
+        self.children: Dict[str, _TrieNode] = {}
+        # Patterns which end at this node, with a Name node or with any receiver.
+        self.ends: List[Tuple[str, CallPattern]] = []
+        self.receivers: List[Tuple[str, CallPattern]] = []
+
+
+class CallPatterns:
+    """
+    Registry of the call patterns of all checkers, compiled into a single trie.
+
+    The trie is keyed by the names of the called function from right to left, e.g., 'seed', 'random'
+    and 'np' for 'np.random.seed(x)', so a call is matched against all patterns in a single walk
+    over its called function. The calls of a module are matched once and shared by all checkers.
+    """
+
+    _root = _TrieNode()
+    _patterns: Dict[str, CallPattern] = {}
+
+    @staticmethod
+    def register(key: str, pattern: str) -> str:
+        """
+        Register a call pattern under a key.
+
+        :param key: Key of the pattern, which is returned for the matching calls.
+        :param pattern: The call pattern, see CallPattern.
+        :return: The key.
+        """
+        if key in CallPatterns._patterns:
+            if CallPatterns._patterns[key].pattern != pattern:
+                raise ValueError(f"Call pattern '{key}' is registered with another pattern.")
+            return key
+        compiled = CallPattern.parse(pattern)
+        CallPatterns._patterns[key] = compiled
+        nodes = [CallPatterns._root]
+        for names in reversed(compiled.names):
+            nodes = [
+                node.children.setdefault(name, _TrieNode())
+                for node in nodes
+                for name in sorted(names)
+            ]
+        for node in nodes:
+            (node.receivers if compiled.any_receiver else node.ends).append((key, compiled))
+        return key
+
+    @staticmethod
+    def match(node: astroid.Call) -> FrozenSet[str]:
+        """
+        Match a call against all registered patterns.
+
+        :param node: The Call node.
+        :return: The keys of the matching patterns.
+        """
+        found = set()
+        trie_node = CallPatterns._root
+        current = node.func
+        while True:
+            if isinstance(current, astroid.Attribute):
+                name, current = current.attrname, current.expr
+            elif isinstance(current, astroid.Name):
+                name, current = current.name, None
+            else:
+                break
+            trie_node = trie_node.children.get(name)
+            if trie_node is None:
+                break
+            for key, pattern in trie_node.ends if current is None else trie_node.receivers:
+                if pattern.matches_arguments(node):
+                    found.add(key)
+            if current is None:
+                break
+        return frozenset(found)
+
+    @staticmethod
+    def matches(node: astroid.node_classes.NodeNG) -> FrozenSet[str]:
+        """
+        Get the keys of the patterns a node matches, matching all calls of its module at once.
+
+        :param node: The node.
+        :return: The keys of the matching patterns, empty when the node is not a call.
+        """
+        if not isinstance(node, astroid.Call):
+            return frozenset()
+        module = node.root()
+        # The number of patterns is part of the key, so patterns registered later are matched too.
+        key = ("call_patterns", len(CallPatterns._patterns))
+        matched = ModuleCache.get(module, key, lambda: CallPatterns._match_module(module))
+        return matched.get(node, frozenset())
+
+    @staticmethod
+    def _match_module(module: astroid.Module) -> Dict[astroid.Call, FrozenSet[str]]:
+        """
+        Match all calls in a module against all registered patterns.
+
+        :param module: The module.
+        :return: The keys of the matching patterns by the calls which match any pattern.
+        """
+        matched = {}
+        for call in NodeIndex.for_module(module).search(module, astroid.Call):
+            keys = CallPatterns.match(call)
+            if keys:
+                matched[call] = keys
+        return matched
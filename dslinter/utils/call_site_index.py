@@ -0,0 +1,91 @@
+"""Utility module for looking up the calls to the functions in a module."""
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+import astroid
+
+from dslinter.utils.module_cache import ModuleCache
+from dslinter.utils.node_index import NodeIndex
+
+
+# A call with its arguments by position and by keyword.
+CallSite = Tuple[
+    astroid.Call, List[astroid.node_classes.NodeNG], Dict[str, astroid.node_classes.NodeNG]
+]
+
+
+class CallSiteIndex:
+    """
+    Index of the calls in a module by the name of the called function, built in a single pass over
+    its Call nodes.
+
+    Only calls to a plain name, e.g., 'f(x)', are indexed, as these are the calls which can be
+    matched to a FunctionDef by its name. The call sites of a name are in the order of
+    ASTUtil.search_nodes, so the call sites in any subtree are found with a binary search on their
+    node numbers.
+    """
+
+    def __init__(self, module: astroid.Module):
+        """
+        Build the index of a module.
+
+        :param module: The module to index.
+        """
+        self._node_index = NodeIndex.for_module(module)
+        self._sites: Dict[str, List[CallSite]] = {}
+        self._numbers: Dict[str, List[int]] = {}
+        for call in self._node_index.search(module, astroid.Call):
+            if not hasattr(call.func, "name"):
+                continue
+            keywords: Dict[str, astroid.node_classes.NodeNG] = {}
+            for keyword in call.keywords or []:
+                # The first keyword with an arg is used, like ASTUtil.retrieve_keyword_from_list.
+                keywords.setdefault(keyword.arg, keyword.value)
+            site = (call, list(call.args or []), keywords)
+            self._sites.setdefault(call.func.name, []).append(site)
+            self._numbers.setdefault(call.func.name, []).append(self._node_index.span(call)[1])
+
+    @staticmethod
+    def for_module(module: astroid.Module) -> "CallSiteIndex":
+        """
+        Get the index of a module, which is built once and shared by all checkers.
+
+        :param module: The module to get the index of.
+        :return: The index of the module.
+        """
+        return ModuleCache.get(module, "call_site_index", lambda: CallSiteIndex(module))
+
+    def call_sites(self, name: str, scope: astroid.node_classes.NodeNG) -> List[CallSite]:
+        """
+        Get the calls to a function by its name in the subtree of a node.
+
+        :param name: Name of the called function.
+        :param scope: Node to find the calls in, which has to be in the indexed module.
+        :return: The call sites in the order of ASTUtil.search_nodes.
+        """
+        numbers = self._numbers.get(name)
+        if not numbers:
+            return []
+        start, end = self._node_index.span(scope)
+        return self._sites[name][bisect_left(numbers, start):bisect_right(numbers, end)]
+
+    def argument_values(
+        self, function: astroid.FunctionDef, arg_name: str, arg_position: int
+    ) -> List[astroid.node_classes.NodeNG]:
+        """
+        Get the values an argument of a function is passed in the calls in the parent of its
+        FunctionDef node.
+
+        :param function: FunctionDef node which contains the argument.
+        :param arg_name: Name of the argument.
+        :param arg_position: Position of the argument.
+        :return: The values passed by position and by keyword, per call in the order of
+            ASTUtil.search_nodes.
+        """
+        values = []
+        for _, positional, keywords in self.call_sites(function.name, function.parent):
+            if len(positional) > arg_position:
+                values.append(positional[arg_position])
+            if arg_name in keywords:
+                values.append(keywords[arg_name])
+        return values
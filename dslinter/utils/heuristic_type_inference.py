@@ -0,0 +1,63 @@
+"""Utility module for inferring types without mypy."""
+from typing import Callable, Dict, List
+
+import astroid
+
+from dslinter.utils.variable_provenance import VariableProvenance
+
+
+class HeuristicTypeInference:  # pylint: disable = too-few-public-methods
+    """
+    Utility class for inferring the types of variables from the library functions they are
+    assigned the result of, used when mypy timed out on a module.
+    """
+
+    # Types of the objects returned by library functions.
+    RETURN_TYPES = {
+        "pandas.DataFrame": '"pandas.core.frame.DataFrame"',
+        "pandas.read_csv": '"pandas.core.frame.DataFrame"',
+        "pandas.read_excel": '"pandas.core.frame.DataFrame"',
+        "pandas.read_json": '"pandas.core.frame.DataFrame"',
+        "pandas.read_parquet": '"pandas.core.frame.DataFrame"',
+        "pandas.read_pickle": '"pandas.core.frame.DataFrame"',
+        "pandas.read_sql": '"pandas.core.frame.DataFrame"',
+        "pandas.read_table": '"pandas.core.frame.DataFrame"',
+    }
+
+    @staticmethod
+    def infer_types(
+        module: astroid.Module, nodes: List[astroid.node_classes.NodeNG], expr: Callable
+    ) -> Dict[astroid.node_classes.NodeNG, str]:
+        """
+        Infer the types of an attribute of nodes without mypy, from the most recent assignment of
+        the attribute.
+
+        Only variables assigned the result of a library function in RETURN_TYPES get a type.
+
+        :param module: The module node where all nodes are located in.
+        :param nodes: Nodes of which the type will be inferred on a certain attribute.
+        :param expr: Expression to extract the attribute from the node where the type will be
+            inferred on. E.g., lambda node: node.func.expr.name
+        :return: Dict with nodes and their inferred types.
+        """
+        imported_names = {}
+        for node in module.nodes_of_class((astroid.Import, astroid.ImportFrom)):
+            if isinstance(node, astroid.Import):
+                for name, alias in node.names:
+                    imported_names[alias or name] = name
+            elif node.level is None or node.level == 0:
+                for name, alias in node.names:
+                    imported_names[alias or name] = node.modname + "." + name
+
+        provenance = VariableProvenance.for_module(module)
+        nodes_with_types = {}
+        for node in nodes:
+            try:
+                full_type = provenance.most_recent(expr(node)) or ""
+            except:  # pylint: disable=bare-except
+                continue  # The attribute from the expression is not found.
+            head, _, tail = full_type.partition(".")
+            full_name = imported_names.get(head, head) + ("." + tail if tail else "")
+            if full_name in HeuristicTypeInference.RETURN_TYPES:
+                nodes_with_types[node] = HeuristicTypeInference.RETURN_TYPES[full_name]
+        return nodes_with_types
@@ -0,0 +1,141 @@
+"""Utility module for registering checkers of which the module is only imported when needed."""
+import importlib
+import importlib.resources
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from pylint.checkers import BaseChecker
+from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
+
+
+class LazyChecker(BaseChecker):
+    """
+    Checker which stands in for a checker of which the module is only imported when pylint opens
+    it.
+
+    pylint registers the messages and options of all checkers when it loads the plugin, but only
+    opens the checkers of which at least one message is enabled. The LazyChecker registers the
+    messages and options of its checker from the checker manifest, so the module of the checker,
+    and the libraries it imports, are only imported when pylint opens the LazyChecker. From then
+    on, the visit and leave methods of the checker are the visit and leave methods of the
+    LazyChecker.
+    """
+
+    __implements__ = IAstroidChecker
+
+    __RESOURCES_PACKAGE = "dslinter.resources"
+    __MANIFEST = "checkers.json"
+
+    def __init__(self, linter: PyLinter, checker_class: str):
+        """
+        Create the stand-in of a checker.
+
+        :param linter: Linter to register the checker with.
+        :param checker_class: Qualified name of the class of the checker, e.g.,
+            'dslinter.checkers.imports.ImportChecker'.
+        """
+        metadata = LazyChecker.manifest()[checker_class]
+        self.checker_class = checker_class
+        self.name = metadata["name"]
+        self.priority = metadata["priority"]
+        self.msgs = metadata["msgs"]
+        self.options = metadata["options"]
+        self._checker: Optional[BaseChecker] = None
+        super().__init__(linter)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def manifest() -> Dict[str, Dict[str, Any]]:
+        """
+        Get the checker manifest, which is read once per process.
+
+        :return: The name, priority, messages and options of every checker, by the qualified name of
+            its class.
+        """
+        package = importlib.resources.files(LazyChecker.__RESOURCES_PACKAGE)
+        manifest = json.loads((package / LazyChecker.__MANIFEST).read_text(encoding="utf-8"))
+        return {
+            checker_class: LazyChecker._from_json(metadata)
+            for checker_class, metadata in manifest.items()
+        }
+
+    @staticmethod
+    def describe(checker: BaseChecker) -> Dict[str, Any]:
+        """
+        Describe a checker as it is written to the checker manifest.
+
+        :param checker: The checker.
+        :return: The name, priority, messages and options of the checker.
+        """
+        return json.loads(json.dumps({
+            "name": checker.name,
+            "priority": checker.priority,
+            "msgs": checker.msgs,
+            "options": checker.options,
+        }))
+
+    @staticmethod
+    def _from_json(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Restore the tuples of the messages and options of a checker, which JSON stores as lists.
+
+        :param metadata: The checker as it is read from the checker manifest.
+        :return: The name, priority, messages and options of the checker.
+        """
+        return {
+            "name": metadata["name"],
+            "priority": metadata["priority"],
+            "msgs": {msgid: tuple(message) for msgid, message in metadata["msgs"].items()},
+            "options": tuple((name, option) for name, option in metadata["options"]),
+        }
+
+    @property
+    def checker(self) -> Optional[BaseChecker]:
+        """
+        Get the checker, when its module is imported.
+
+        :return: The checker or None when pylint did not open the LazyChecker yet.
+        """
+        return self.__dict__.get("_checker")
+
+    def open(self):
+        """Import and create the checker, when pylint opens the LazyChecker, and open it."""
+        if self.checker is None:
+            module_name, class_name = self.checker_class.rsplit(".", 1)
+            checker = getattr(importlib.import_module(module_name), class_name)(self.linter)
+            # The options are set on the LazyChecker, which is registered with pylint.
+            checker.config = self.config
+            self._checker = checker
+        self.checker.open()
+
+    def close(self):
+        """Close the checker, when it is opened."""
+        if self.checker is not None:
+            self.checker.close()
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get the visit and leave methods of the checker.
+
+        :param name: Name of the attribute which is not an attribute of the LazyChecker.
+        :return: The attribute of the checker.
+        """
+        checker = self.checker
+        if checker is not None and name.startswith(("visit_", "leave_")):
+            return getattr(checker, name)
+        raise AttributeError(name)
+
+    def __dir__(self) -> List[str]:
+        """
+        List the attributes of the LazyChecker and the visit and leave methods of the checker.
+
+        :return: The names of the attributes.
+        """
+        names = set(super().__dir__())
+        if self.checker is not None:
+            names.update(
+                name for name in dir(self.checker) if name.startswith(("visit_", "leave_"))
+            )
+        return sorted(names)
@@ -0,0 +1,40 @@
+"""Utility module for sharing results computed on a module between checkers."""
+from typing import Any, Callable, Hashable
+from weakref import WeakKeyDictionary
+
+import astroid
+
+
+class ModuleCache:
+    """
+    Utility class for sharing results computed on a module between checkers.
+
+    Results are stored next to the module instead of on the module node itself. They are
+    dropped when the module is released (at the end of visiting it) or garbage collected.
+    """
+
+    _entries: "WeakKeyDictionary[astroid.Module, dict]" = WeakKeyDictionary()
+
+    @staticmethod
+    def get(module: astroid.Module, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get the result stored for a module under a key, computing it on the first request.
+
+        :param module: Module the result belongs to.
+        :param key: Key identifying the computation, e.g., the query and its arguments.
+        :param compute: Function computing the result when it is not stored yet.
+        :return: The stored result.
+        """
+        entries = ModuleCache._entries.setdefault(module, {})
+        if key not in entries:
+            entries[key] = compute()
+        return entries[key]
+
+    @staticmethod
+    def release(module: astroid.Module):
+        """
+        Release all results stored for a module.
+
+        :param module: Module to release the results of.
+        """
+        ModuleCache._entries.pop(module, None)
@@ -0,0 +1,171 @@
+"""Utility module for running mypy through its daemon (dmypy)."""
+import atexit
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Optional, Tuple
+
+
+class MypyDaemon:
+    """
+    Client of a mypy daemon, which keeps typeshed and the stubs loaded in between runs.
+
+    Without a directory, a daemon is started for the current lint session and stopped when the
+    session ends. With a directory, the daemon is persistent: a daemon which is still running in
+    that directory is reused and it keeps running after the session, e.g., for editor integrations.
+    """
+
+    # Seconds of inactivity after which a daemon of a single lint session stops by itself, in case
+    # the session is killed before it could stop the daemon.
+    SESSION_TIMEOUT = 600
+
+    # Libraries imported by every check. The daemon drops the modules which are no longer imported,
+    # which makes rechecking code that imports them again slower than a check without the daemon.
+    ANCHOR_IMPORTS = ["numpy", "pandas", "pyspark"]
+    ANCHOR_FILE = "_dslinter_anchor.py"
+
+    def __init__(self, directory: str = ""):
+        """
+        Create a client of a mypy daemon.
+
+        :param directory: Directory for the status file and checked code of a persistent daemon.
+            An empty string starts a daemon for the current lint session only.
+        """
+        self.persistent = directory != ""
+        # The daemon runs in its own directory, so a relative directory would be resolved twice.
+        self.directory = os.path.abspath(directory) if self.persistent else directory
+        self._available: Optional[bool] = None
+
+    def run(self, code: str) -> Optional[str]:
+        """
+        Run mypy on some code using the daemon.
+
+        :param code: Code to run mypy on.
+        :return: Normal report written to sys.stdout by mypy or None when the daemon is not
+            available.
+        """
+        if not self._start():
+            return None
+
+        # The checked file keeps the same path, so the daemon only rechecks the changed code.
+        path = os.path.join(self.directory, "_dslinter.py")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(code)
+        anchor_path = os.path.join(self.directory, MypyDaemon.ANCHOR_FILE)
+        stdout, _, exit_status = self._dmypy("check", path, anchor_path)
+        if exit_status not in (0, 1) and self._restart():
+            stdout, _, exit_status = self._dmypy("check", path, anchor_path)
+        if exit_status not in (0, 1):
+            # The daemon stopped working, mypy will be ran without it from now on.
+            print(
+                "Could not type check with the mypy daemon. Continuing without the daemon.",
+                file=sys.stderr,
+            )
+            self._available = False
+            return None
+        return "".join(
+            line
+            for line in stdout.splitlines(keepends=True)
+            if not line.startswith(MypyDaemon.ANCHOR_FILE)
+        )
+
+    def stop(self):
+        """Stop the daemon and remove its files, unless the daemon is persistent."""
+        if self._available and not self.persistent:
+            self._dmypy("stop")
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self._available = False
+
+    def _start(self) -> bool:
+        """
+        Start the daemon or connect to the daemon which is already running.
+
+        :return: True when the daemon is available.
+        """
+        if self._available is not None:
+            return self._available
+
+        if self.persistent:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write_anchor()
+            _, _, exit_status = self._dmypy("status")
+            if exit_status != 0:
+                exit_status = self._start_daemon()
+        else:
+            # The directory is created in the process using it, so forked linters get their own
+            # daemon.
+            self.directory = tempfile.mkdtemp(prefix="dslinter")
+            self._write_anchor()
+            exit_status = self._start_daemon("--timeout", str(MypyDaemon.SESSION_TIMEOUT))
+            if exit_status == 0:
+                atexit.register(self.stop)
+            else:
+                shutil.rmtree(self.directory, ignore_errors=True)
+
+        self._available = exit_status == 0
+        if not self._available:
+            print(
+                "Could not start the mypy daemon. Continuing without the daemon.", file=sys.stderr
+            )
+        return self._available
+
+    def _restart(self) -> bool:
+        """
+        Start the daemon again when it is not running anymore, e.g., when a daemon of a long lint
+        session, like the lint server, stopped by itself after it was idle.
+
+        :return: True when the daemon is started again.
+        """
+        _, _, exit_status = self._dmypy("status")
+        if exit_status == 0:
+            return False  # The daemon is running, so it failed for another reason.
+        args = () if self.persistent else ("--timeout", str(MypyDaemon.SESSION_TIMEOUT))
+        return self._start_daemon(*args) == 0
+
+    def _write_anchor(self):
+        """Write the file importing the anchor libraries next to the checked code."""
+        path = os.path.join(self.directory, MypyDaemon.ANCHOR_FILE)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("".join("import " + library + "\n" for library in MypyDaemon.ANCHOR_IMPORTS))
+
+    def _start_daemon(self, *args: str) -> int:
+        """
+        Start a new daemon in a separate interpreter.
+
+        The daemon is not started through mypy.api, as that forks the linter process itself into
+        the daemon, including all state of the running linter. It runs in its own directory, as
+        mypy searches the working directory for modules.
+
+        :param args: Arguments of the start command.
+        :return: Exit status of the start command.
+        """
+        status_file = os.path.join(self.directory, "dmypy.json")
+        command = [sys.executable, "-m", "mypy.dmypy", "--status-file", status_file, "start"]
+        try:
+            return subprocess.run(
+                command + list(args),
+                cwd=self.directory,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            ).returncode
+        except OSError:
+            return 2
+
+    def _dmypy(self, *args: str) -> Tuple[str, str, int]:
+        """
+        Run a dmypy command on the daemon.
+
+        :param args: Command and its arguments.
+        :return: Report written to sys.stdout, report written to sys.stderr and the exit status.
+        """
+        # mypy is imported when it runs, so loading the plugin does not import it.
+        import mypy.api  # pylint: disable = import-outside-toplevel
+
+        status_file = os.path.join(self.directory, "dmypy.json")
+        try:
+            return mypy.api.run_dmypy(["--status-file", status_file] + list(args))
+        except Exception:  # pylint: disable=broad-except
+            return "", "", 2
@@ -0,0 +1,110 @@
+"""Utility module for finding the nodes of a certain type in a module."""
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+import astroid
+
+from dslinter.utils.module_cache import ModuleCache
+
+
+class NodeIndex:
+    """
+    Index of all nodes in a tree by their type, built in a single walk over the tree.
+
+    The nodes are numbered in post-order (the children of a node before the node itself), which is
+    the order ASTUtil.search_nodes has always returned them in. In this order, the nodes in the
+    subtree of a node are numbered consecutively, so the nodes of a type in any subtree are found
+    with a binary search in the list of nodes of that type.
+    """
+
+    def __init__(self, root: astroid.node_classes.NodeNG):
+        """
+        Build the index of a tree.
+
+        :param root: Root of the tree, usually a Module node.
+        """
+        # Lowest number in the subtree of each node and the number of the node itself.
+        self._ranges: Dict[astroid.node_classes.NodeNG, Tuple[int, int]] = {}
+        # Nodes and their numbers by the class of the nodes.
+        self._nodes: Dict[type, List[astroid.node_classes.NodeNG]] = {}
+        self._numbers: Dict[type, List[int]] = {}
+        # Classes of the indexed nodes which are a subclass of a searched type, by searched type.
+        self._classes: Dict[type, List[type]] = {}
+
+        # The walk is iterative, as generated code can be nested deeper than the recursion limit.
+        count = 0
+        starts: Dict[astroid.node_classes.NodeNG, int] = {}
+        stack = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                starts[node] = count
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(list(node.get_children())))
+            else:
+                self._ranges[node] = (starts[node], count)
+                self._nodes.setdefault(type(node), []).append(node)
+                self._numbers.setdefault(type(node), []).append(count)
+                count += 1
+
+    @staticmethod
+    def for_module(module: astroid.Module) -> "NodeIndex":
+        """
+        Get the index of a module, which is built once and shared by all checkers.
+
+        :param module: The module to get the index of.
+        :return: The index of the module.
+        """
+        return ModuleCache.get(module, "node_index", lambda: NodeIndex(module))
+
+    def contains(self, node: astroid.node_classes.NodeNG) -> bool:
+        """
+        Evaluate whether a node is in the indexed tree.
+
+        :param node: The node.
+        :return: True when the node is indexed.
+        """
+        return node in self._ranges
+
+    def span(self, node: astroid.node_classes.NodeNG) -> Tuple[int, int]:
+        """
+        Get the numbers of the nodes in the subtree of a node.
+
+        :param node: Root of the subtree, which has to be in the indexed tree.
+        :return: The lowest number in the subtree and the number of the node itself.
+        """
+        return self._ranges[node]
+
+    def search(
+        self, node: astroid.node_classes.NodeNG, type_searched: type
+    ) -> List[astroid.node_classes.NodeNG]:
+        """
+        Search for all nodes of a certain type in the subtree of a node, including the node itself.
+
+        :param node: Root of the subtree, which has to be in the indexed tree.
+        :param type_searched: Type of node where is searched for, subclasses included.
+        :return: The nodes found, in post-order.
+        """
+        start, end = self._ranges[node]
+        found = []
+        for node_class in self._subclasses(type_searched):
+            numbers = self._numbers[node_class]
+            first, last = bisect_left(numbers, start), bisect_right(numbers, end)
+            found.append(list(zip(numbers[first:last], self._nodes[node_class][first:last])))
+        if len(found) == 1:
+            return [found_node for _, found_node in found[0]]
+        return [found_node for _, found_node in heapq.merge(*found, key=lambda pair: pair[0])]
+
+    def _subclasses(self, type_searched: type) -> List[type]:
+        """
+        Get the classes of the indexed nodes which are a subclass of a searched type.
+
+        :param type_searched: Type of node where is searched for.
+        :return: The classes.
+        """
+        if type_searched not in self._classes:
+            self._classes[type_searched] = [
+                node_class for node_class in self._nodes if issubclass(node_class, type_searched)
+            ]
+        return self._classes[type_searched]
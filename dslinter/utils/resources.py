@@ -1,33 +1,58 @@
 """Utility module for reading resources."""
 
-import pickle
-from typing import Dict, List, Union
+import importlib.resources
+from functools import lru_cache
+from typing import FrozenSet, Mapping, Union
 
-from pkg_resources import resource_stream
+from dslinter.utils.signature_database import SignatureDatabase
 
 
 class Resources:
     """Utility class for reading resources."""
 
     __RESOURCES_PACKAGE = "dslinter.resources"
+    __SIGNATURE_DATABASE = "signatures.db"
 
     @staticmethod
-    def get_hyperparameters(hyperparameter_resource) -> Dict[str, Dict[str, Union[int, List[str]]]]:
+    @lru_cache(maxsize=None)
+    def get_signature_database() -> SignatureDatabase:
         """
-        Get the hyperparameters resource.
+        Get the database with the signatures of the learning algorithms of every library.
 
-        :return: Dict with every learning algorithm from scikit-learn as keys. Each value is a Dict
-        containing the keys 'positional' and 'keywords' containing its amount of keywords and a list
-        with the names of its keywords respectively.
+        The database is opened once per process and its signatures are only read when they are
+        looked up.
+
+        :return: The signature database.
+        """
+        package = importlib.resources.files(Resources.__RESOURCES_PACKAGE)
+        # The database is mapped into memory, so it stays readable when the file is a temporary
+        # copy of a resource in a zipped package, which is removed again.
+        with importlib.resources.as_file(package / Resources.__SIGNATURE_DATABASE) as path:
+            return SignatureDatabase(str(path))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_hyperparameters(library: str) -> Mapping[str, Mapping[str, Union[int, FrozenSet[str]]]]:
+        """
+        Get the hyperparameters of the learning algorithms of the latest version of a library in the
+        signature database.
+
+        The mapping is shared by all callers, so it is read-only.
+
+        :param library: Name of the library, i.e., 'scikitlearn', 'pytorch' or 'tensorflow'.
+        :return: Mapping with every learning algorithm of the library as keys. Each value is a
+        Mapping containing the keys 'positional' and 'keywords' containing its amount of keywords
+        and a frozenset with the names of its keywords respectively.
         """
-        return Resources.read_pickle(hyperparameter_resource)
+        return Resources.get_signature_database().signatures(library)
 
     @staticmethod
-    def read_pickle(file):
+    @lru_cache(maxsize=None)
+    def get_learning_classes(library: str) -> FrozenSet[str]:
         """
-        Read a pickled object from disk.
+        Get the names of the learning algorithms of a library.
 
-        :param file: File name of the pickle in the resource package.
-        :return: Deserialized object.
+        :param library: Name of the library, i.e., 'scikitlearn', 'pytorch' or 'tensorflow'.
+        :return: Frozenset with the names of the learning algorithms.
         """
-        return pickle.load(resource_stream(Resources.__RESOURCES_PACKAGE, file))
+        return frozenset(Resources.get_hyperparameters(library))
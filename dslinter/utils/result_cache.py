@@ -0,0 +1,329 @@
+"""Utility module for caching the messages of checked files on disk."""
+import ast
+import hashlib
+import os
+import pickle
+import platform
+import sys
+import sysconfig
+import tempfile
+from collections import deque
+from functools import lru_cache
+from importlib import metadata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import astroid
+from pylint.lint import PyLinter
+
+
+class ResultCache:
+    """
+    Persistent cache of the result of checking a file, e.g., its messages, addressed by the path of
+    the file.
+
+    An entry is used when the configuration is the same and neither the file nor its dependencies
+    changed. The configuration consists of the version of dslinter, the versions of the packages the
+    checkers depend on, the enabled messages and the options of all checkers. The dependencies of a
+    file are recorded with the entry, with the digest of their content or None for files which did
+    not exist:
+
+    - the modules it imports from the linted code, directly or through the modules it imports, as
+      both mypy and astroid infer types through imported modules. Imported modules which are not
+      found in the linted code are recorded as missing, so adding them invalidates the entry,
+    - the files read while it is checked, e.g., the datasets loaded by the dataset API conflict
+      checker.
+    """
+
+    # Packages which influence the results of the checkers.
+    PACKAGES = [
+        "pylint", "astroid", "mypy", "data-science-types", "pyspark-stubs", "pandas", "numpy",
+    ]
+    # Options which only change how the results are reported, not the results themselves.
+    REPORTING_OPTIONS = {
+        "jobs", "result-cache-dir", "output-format", "reports", "score", "msg-template",
+        "evaluation", "persistent", "exit-zero", "fail-under", "fail-on", "output",
+    }
+
+    # Whether the files read while checking a module are recorded, which is only needed when the
+    # cache is used.
+    record_read_files: bool = False
+    # Files read while checking a module, by the path of the module.
+    _read_files: Dict[str, Set[str]] = {}
+
+    def __init__(self, directory: str, configuration: str):
+        """
+        Create a cache in a directory.
+
+        :param directory: Directory where the entries are stored. It is created when needed.
+        :param configuration: Digest of the configuration, see ResultCache.configuration.
+        """
+        self.directory = directory
+        self._configuration = configuration
+        # Digests of the files read during this run, as the linted files do not change while they
+        # are linted.
+        self._digests: Dict[str, Optional[str]] = {}
+
+    def get(self, path: str) -> Optional[Tuple]:
+        """
+        Get the result stored for a file, when neither the file nor its dependencies changed.
+
+        :param path: Path of the file.
+        :return: The result or None when the file is not cached or the entry is outdated.
+        """
+        try:
+            with open(self._entry_path(path), "rb") as file:
+                entry = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            return None
+        if entry["configuration"] != self._configuration or entry["digest"] != self._digest(path):
+            return None
+        for dependency, digest in entry["dependencies"].items():
+            if self._digest(dependency) != digest:
+                return None
+        return entry["result"]
+
+    def put(self, path: str, result: Tuple, dependencies: Iterable[str]):
+        """
+        Store the result of checking a file.
+
+        :param path: Path of the file.
+        :param result: The result, which can be pickled.
+        :param dependencies: Paths of the files the result depends on, including the files which did
+            not exist.
+        """
+        entry = {
+            "configuration": self._configuration,
+            "digest": self._digest(path),
+            "dependencies": {dependency: self._digest(dependency) for dependency in dependencies},
+            "result": result,
+        }
+        entry_path = self._entry_path(path)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            # Write to a temporary file first, so concurrent linters never read a partial entry.
+            file_descriptor, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(entry_path), suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(entry, file)
+            os.replace(tmp_path, entry_path)
+        except (OSError, pickle.PicklingError):
+            pass  # The cache is an optimization only, linting continues without it.
+
+    def _entry_path(self, path: str) -> str:
+        """
+        Get the path of the entry of a file.
+
+        :param path: Path of the file.
+        :return: Path of the entry.
+        """
+        key = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key[:2], key + ".pickle")
+
+    def _digest(self, path: str) -> Optional[str]:
+        """
+        Compute the digest of the content of a file, once per run.
+
+        :param path: Path of the file.
+        :return: Hexadecimal digest or None when the file does not exist.
+        """
+        if path not in self._digests:
+            try:
+                with open(path, "rb") as file:
+                    self._digests[path] = hashlib.sha256(file.read()).hexdigest()
+            except OSError:
+                self._digests[path] = None
+        return self._digests[path]
+
+    @staticmethod
+    def configuration(linter: PyLinter) -> str:
+        """
+        Compute the digest of the configuration which influences the results of the checkers.
+
+        :param linter: The linter, after its configuration is loaded.
+        :return: Hexadecimal digest.
+        """
+        digest = hashlib.sha256()
+        digest.update(ResultCache._dslinter_version().encode("utf-8"))
+        digest.update(platform.python_version().encode("utf-8"))
+        for package in ResultCache.PACKAGES:
+            try:
+                digest.update((package + "==" + metadata.version(package)).encode("utf-8"))
+            except metadata.PackageNotFoundError:
+                digest.update((package + "==none").encode("utf-8"))
+        enabled = sorted(
+            message.msgid
+            for message in linter.msgs_store.messages
+            if linter.is_message_enabled(message.msgid)
+        )
+        digest.update(repr(enabled).encode("utf-8"))
+        options = set()
+        for provider in linter.options_providers:
+            for name, _, value in provider.options_and_values():
+                if name not in ResultCache.REPORTING_OPTIONS:
+                    options.add((name, repr(value)))
+        digest.update(repr(sorted(options)).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _dslinter_version() -> str:
+        """
+        Compute the digest of the source code of dslinter, so a changed checker invalidates the
+        cache without a release.
+
+        :return: Hexadecimal digest.
+        """
+        digest = hashlib.sha256()
+        package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for root, directories, files in os.walk(package):
+            directories[:] = sorted(
+                name for name in directories if name not in ("tests", "__pycache__")
+            )
+            for name in sorted(files):
+                if name.endswith((".py", ".json", ".db")):
+                    path = os.path.join(root, name)
+                    with open(path, "rb") as file:
+                        digest.update(os.path.relpath(path, package).encode("utf-8"))
+                        digest.update(file.read())
+        return digest.hexdigest()
+
+    @staticmethod
+    def depend_on_file(node: astroid.node_classes.NodeNG, path: str):
+        """
+        Record that the result of the module of a node depends on a file, e.g., a dataset a checker
+        reads.
+
+        :param node: A node of the module.
+        :param path: Path of the file, relative to the working directory or absolute.
+        """
+        module_file = node.root().file
+        if ResultCache.record_read_files and module_file is not None:
+            read_files = ResultCache._read_files.setdefault(os.path.abspath(module_file), set())
+            read_files.add(os.path.abspath(path))
+
+    @staticmethod
+    def dependencies(path: str) -> List[str]:
+        """
+        Get the dependencies of a checked file: the modules of the linted code it imports, directly
+        or indirectly, and the files read while it was checked. The files read are forgotten.
+
+        :param path: Path of the file.
+        :return: Paths of the dependencies, including the paths of imported modules which were not
+            found.
+        """
+        path = os.path.abspath(path)
+        search_path = ResultCache._search_path()
+        found: Set[str] = set()
+        missing: Set[str] = set()
+        queue = deque([path])
+        while queue:
+            module_path = queue.popleft()
+            # The path each imported name resolves to. The packages come before their modules in the
+            # imports.
+            resolved: Dict[Tuple[int, str], Optional[str]] = {}
+            for level, name in ResultCache._imports(module_path):
+                parent = resolved.get((level, name.rpartition(".")[0]))
+                if parent is not None and not parent.endswith("__init__.py"):
+                    continue  # A name imported from a module, which cannot be a module itself.
+                candidates = ResultCache._module_candidates(module_path, level, name, search_path)
+                existing = [candidate for candidate in candidates if os.path.isfile(candidate)]
+                if existing:
+                    missing.update(candidates[:candidates.index(existing[0])])
+                else:
+                    missing.update(candidates)
+                resolved[(level, name)] = existing[0] if existing else None
+                if existing and existing[0] not in found and existing[0] != path:
+                    found.add(existing[0])
+                    queue.append(existing[0])
+        read_files = ResultCache._read_files.pop(path, set())
+        return sorted(found | missing | read_files)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _imports(path: str) -> Tuple[Tuple[int, str], ...]:
+        """
+        Get the modules a module imports, including the packages the modules are in.
+
+        :param path: Path of the module.
+        :return: Tuples of the level of the import, 0 for an absolute import, and the name of the
+            module.
+        """
+        try:
+            with open(path, "rb") as file:
+                tree = ast.parse(file.read())
+        except (OSError, SyntaxError, ValueError):
+            return ()
+        imports = set()
+        for node in ast.walk(tree):
+            names = []
+            if isinstance(node, ast.Import):
+                names = [(0, alias.name) for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                names = [(node.level, module)] if module else []
+                # The imported names can be modules as well, e.g., 'from package import module'.
+                names += [
+                    (node.level, module + "." + alias.name if module else alias.name)
+                    for alias in node.names if alias.name != "*"
+                ]
+            for level, name in names:
+                parts = name.split(".")
+                imports.update((level, ".".join(parts[:end])) for end in range(1, len(parts) + 1))
+        return tuple(sorted(imports))
+
+    @staticmethod
+    def _module_candidates(
+        importer: str, level: int, name: str, search_path: List[str]
+    ) -> List[str]:
+        """
+        Get the paths a module can be found at in the linted code, in the order they are searched.
+
+        Modules in the standard library and the installed packages are not part of the linted code.
+
+        :param importer: Path of the importing module.
+        :param level: Level of the import, 0 for an absolute import.
+        :param name: Name of the imported module.
+        :param search_path: Directories containing linted code which absolute imports are searched
+            in.
+        :return: Paths of the module files and package '__init__.py' files.
+        """
+        if level > 0:
+            directory = os.path.dirname(importer)
+            for _ in range(level - 1):
+                directory = os.path.dirname(directory)
+            directories = [directory]
+        else:
+            directories = search_path
+        relative = os.path.join(*name.split("."))
+        candidates = []
+        for directory in directories:
+            candidates.append(os.path.join(directory, relative + ".py"))
+            candidates.append(os.path.join(directory, relative, "__init__.py"))
+        return candidates
+
+    @staticmethod
+    def _search_path() -> List[str]:
+        """
+        Get the directories on sys.path which contain linted code, rather than the standard library
+        or packages.
+
+        :return: Absolute paths of the directories.
+        """
+        excluded = tuple(
+            os.path.abspath(path) for name in ("stdlib", "platstdlib", "purelib", "platlib")
+            for path in [sysconfig.get_paths().get(name)] if path
+        )
+        directories = []
+        for entry in sys.path:
+            directory = os.path.abspath(entry or os.getcwd())
+            if (
+                os.path.isdir(directory)
+                and not any(
+                    directory == path or directory.startswith(path + os.sep) for path in excluded
+                )
+                and "site-packages" not in directory
+                and directory not in directories
+            ):
+                directories.append(directory)
+        return directories
@@ -0,0 +1,318 @@
+"""Utility module for checking files in parallel processes, scheduled by their size."""
+import multiprocessing
+import os
+import queue
+import traceback
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pylint.lint import PyLinter
+from pylint.lint.parallel import (
+    _merge_mapreduce_data,
+    _worker_check_single_file,
+    _worker_initialize,
+)
+from pylint.message import Message
+from pylint.typing import FileItem, MessageLocationTuple
+from pylint.utils import merge_stats
+
+from dslinter.utils.result_cache import ResultCache
+
+
+class FileScheduler:  # pylint: disable = too-few-public-methods
+    """
+    Schedule files over workers by their size, with work stealing.
+
+    The files are assigned to the workers up front, largest first and each to the worker with the
+    least bytes assigned so far, so every worker gets about the same amount of work. Every worker
+    checks its own files, largest first. A worker which has checked all its files steals the largest
+    remaining file of the worker with the most bytes remaining, so a single large file, e.g., an
+    exported notebook, does not leave the other workers idle while the worker which got it still
+    has files waiting.
+    """
+
+    def __init__(self, sizes: Sequence[int], workers: int):
+        """
+        Assign files to workers.
+
+        :param sizes: Size of every file, which is identified by its position.
+        :param workers: Number of workers.
+        """
+        self._sizes = sizes
+        self._queues: List[Deque[int]] = [deque() for _ in range(workers)]
+        self._remaining = [0] * workers
+        for file in sorted(range(len(sizes)), key=lambda file: (-sizes[file], file)):
+            worker = min(range(workers), key=lambda worker: (self._remaining[worker], worker))
+            self._queues[worker].append(file)
+            self._remaining[worker] += sizes[file]
+
+    def next(self, worker: int) -> Optional[int]:
+        """
+        Take the next file a worker checks.
+
+        :param worker: Number of the worker.
+        :return: Position of the file or None when all files are taken.
+        """
+        if not self._queues[worker]:
+            worker = max(
+                range(len(self._queues)), key=lambda other: (self._remaining[other], -other)
+            )
+            if not self._queues[worker]:
+                return None
+        file = self._queues[worker].popleft()
+        self._remaining[worker] -= self._sizes[file]
+        return file
+
+
+class ScheduledCheck:  # pylint: disable = too-few-public-methods
+    """
+    Check files in parallel processes, scheduled by a FileScheduler.
+
+    Unlike pylint -j, which reports the messages of a file as soon as any process has checked it,
+    the messages are reported in the order pylint checks the files in a single process, so the
+    output does not depend on the number of processes or on which process checked which file. With
+    a ResultCache, the files of which the result is cached are not checked again.
+    """
+
+    # Seconds to wait for a result before evaluating whether the processes are still running.
+    POLL_INTERVAL = 1.0
+
+    @staticmethod
+    def check(  # pylint: disable = too-many-locals
+        linter: PyLinter,
+        jobs: int,
+        files: Iterable[FileItem],
+        arguments: Sequence[str],
+        cache: Optional[ResultCache] = None,
+    ):
+        """
+        Check files in parallel processes and report their messages with the reporter of the linter.
+
+        :param linter: The linter, which is copied to every process.
+        :param jobs: Number of processes.
+        :param files: The files to check, which are listed when the linter is opened, like pylint
+            does.
+        :param arguments: The files or modules given on the command line, to add their directories
+            to sys.path.
+        :param cache: Cache of the results of checked files, None to check all files.
+        """
+        linter.open()
+        files = list(files)
+        checked = ScheduledCheck._cached(files, cache)
+        pending = [file for file in range(len(files)) if file not in checked]
+        jobs = min(jobs, len(pending))
+        scheduler = FileScheduler(
+            [ScheduledCheck._size(files[file].filepath) for file in pending], jobs
+        )
+        results = multiprocessing.Queue()
+        tasks = [multiprocessing.SimpleQueue() for _ in range(jobs)]
+        processes = ScheduledCheck._start(linter, arguments, tasks, results, cache is not None)
+
+        # The file every process is checking, None when it is stopped.
+        checking: List[Optional[int]] = [None] * jobs
+        reported = 0
+        try:
+            for worker in range(jobs):
+                checking[worker] = ScheduledCheck._assign(
+                    scheduler, worker, tasks[worker], files, pending
+                )
+            while True:
+                # The messages are reported in the order of the files, as soon as all files before
+                # are checked.
+                while reported in checked:
+                    ScheduledCheck._report(linter, checked[reported])
+                    reported += 1
+                if all(file is None for file in checking):
+                    break
+                try:
+                    worker, file, result, dependencies = results.get(
+                        timeout=ScheduledCheck.POLL_INTERVAL
+                    )
+                except queue.Empty:
+                    ScheduledCheck._raise_on_stopped(processes, checking, files)
+                    continue
+                if isinstance(result, str):
+                    raise RuntimeError(f"Checking {files[file].filepath} failed:\n{result}")
+                checked[file] = result
+                if cache is not None:
+                    cache.put(files[file].filepath, result, dependencies)
+                checking[worker] = ScheduledCheck._assign(
+                    scheduler, worker, tasks[worker], files, pending
+                )
+        finally:
+            for worker, process in enumerate(processes):
+                if checking[worker] is not None:
+                    process.terminate()
+                process.join()
+
+        ScheduledCheck._merge(linter, checked)
+
+    @staticmethod
+    def _cached(files: List[FileItem], cache: Optional[ResultCache]) -> Dict[int, Tuple]:
+        """
+        Get the cached results of the files.
+
+        :param files: The files to check.
+        :param cache: Cache of the results of checked files, None to check all files.
+        :return: The cached result of every file of which the result is cached, by its position.
+        """
+        checked: Dict[int, Tuple] = {}
+        if cache is not None:
+            for file, file_item in enumerate(files):
+                result = cache.get(file_item.filepath)
+                if result is not None:
+                    checked[file] = result
+        return checked
+
+    @staticmethod
+    def _start(
+        linter: PyLinter,
+        arguments: Sequence[str],
+        tasks: List["multiprocessing.SimpleQueue"],
+        results: "multiprocessing.Queue",
+        dependencies: bool,
+    ) -> List[multiprocessing.Process]:
+        """
+        Start a process for every queue of files to check.
+
+        :param linter: The linter, which is copied to every process.
+        :param arguments: The files or modules given on the command line.
+        :param tasks: Queue of the files to check of every process.
+        :param results: Queue to put the results of the processes in.
+        :param dependencies: Whether to determine the dependencies of every file.
+        :return: The processes.
+        """
+        # The processes get the linter without its reporter, like the processes of pylint -j.
+        original_reporter = linter.reporter
+        linter.reporter = None
+        processes = [
+            multiprocessing.Process(
+                target=ScheduledCheck._work,
+                args=(linter, arguments, worker, worker_tasks, results, dependencies),
+                daemon=True,
+            )
+            for worker, worker_tasks in enumerate(tasks)
+        ]
+        for process in processes:
+            process.start()
+        linter.set_reporter(original_reporter)
+        return processes
+
+    @staticmethod
+    def _merge(linter: PyLinter, checked: Dict[int, Tuple]):
+        """
+        Merge the map/reduce data and the statistics of the checked files into the linter.
+
+        :param linter: The linter.
+        :param checked: The result of checking every file, by its position.
+        """
+        _merge_mapreduce_data(linter, {file: [result[7]] for file, result in checked.items()})
+        linter.stats = merge_stats([linter.stats] + [result[5] for result in checked.values()])
+        for checker in linter.get_checkers():
+            if checker is not linter:
+                checker.stats = linter.stats
+
+    @staticmethod
+    def _size(path: str) -> int:
+        """
+        Get the size of a file.
+
+        :param path: Path of the file.
+        :return: The size in bytes, 0 when the file cannot be read.
+        """
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _assign(
+        scheduler: FileScheduler,
+        worker: int,
+        tasks: "multiprocessing.SimpleQueue",
+        files: List[FileItem],
+        pending: List[int],
+    ) -> Optional[int]:
+        """
+        Send the next file to check to a process, or stop the process when all files are taken.
+
+        :param scheduler: The scheduler of the files which are not cached.
+        :param worker: Number of the process.
+        :param tasks: Queue of the files to check of the process.
+        :param files: The files.
+        :param pending: Positions of the files which are not cached, in the order the scheduler
+            knows them.
+        :return: Position of the file or None when the process is stopped.
+        """
+        position = scheduler.next(worker)
+        file = None if position is None else pending[position]
+        tasks.put(None if file is None else (file, files[file]))
+        return file
+
+    @staticmethod
+    def _raise_on_stopped(
+        processes: List[multiprocessing.Process], checking: List[Optional[int]], files
+    ):
+        """
+        Raise an error when a process stopped while checking a file, e.g., because it ran out of
+        memory.
+
+        :param processes: The processes.
+        :param checking: The file every process is checking, None when it is stopped.
+        :param files: The files to check.
+        :raises RuntimeError: When a process stopped while checking a file.
+        """
+        for worker, process in enumerate(processes):
+            if checking[worker] is not None and not process.is_alive():
+                raise RuntimeError(
+                    f"The process checking {files[checking[worker]].filepath} stopped with exit "
+                    f"code {process.exitcode}."
+                )
+
+    @staticmethod
+    def _report(linter: PyLinter, result: Tuple):
+        """
+        Report the messages of a checked file with the reporter of the linter.
+
+        :param linter: The linter.
+        :param result: The result of checking the file, see
+            pylint.lint.parallel._worker_check_single_file.
+        """
+        _, module, file_path, base_name, messages, _, msg_status, _ = result
+        linter.file_state.base_name = base_name
+        linter.set_current_module(module, file_path)
+        for msg in messages:
+            msg = Message(msg[0], msg[1], MessageLocationTuple(*msg[2]), msg[3], msg[4])
+            linter.reporter.handle_message(msg)
+        linter.msg_status |= msg_status
+
+    @staticmethod
+    def _work(  # pylint: disable = too-many-arguments
+        linter: PyLinter,
+        arguments: Sequence[str],
+        worker: int,
+        tasks: "multiprocessing.SimpleQueue",
+        results: "multiprocessing.Queue",
+        dependencies: bool,
+    ):
+        """
+        Check the files sent to a process, until it is stopped.
+
+        :param linter: The linter.
+        :param arguments: The files or modules given on the command line.
+        :param worker: Number of the process.
+        :param tasks: Queue of the files to check, followed by None to stop.
+        :param results: Queue to put the result of checking every file in, or the traceback when it
+            failed, together with the dependencies of the file.
+        :param dependencies: Whether to determine the dependencies of every file, see
+            ResultCache.dependencies.
+        """
+        _worker_initialize(linter, arguments)
+        ResultCache.record_read_files = dependencies
+        for file, file_item in iter(tasks.get, None):
+            try:
+                result = _worker_check_single_file(file_item)
+            except Exception:  # pylint: disable = broad-except
+                result = traceback.format_exc()
+            read_files = ResultCache.dependencies(file_item.filepath) if dependencies else []
+            results.put((worker, file, result, read_files))
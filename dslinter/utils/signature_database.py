@@ -0,0 +1,355 @@
+"""Utility module for reading and writing the database of the signatures of library classes."""
+import mmap
+import struct
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple, Union
+
+Signature = Mapping[str, Union[int, FrozenSet[str]]]
+
+
+class SignatureDatabase:
+    """
+    Read-only database of the signatures of the classes of libraries, e.g., the learning classes of
+    scikit-learn.
+
+    The database is a sorted string table in a single file, which is memory-mapped so a lookup only
+    reads the pages of the records it compares. The file starts with a header and a directory of its
+    sections:
+
+    - the magic bytes and the schema version,
+    - per section the library, the version of the library, the offset of its index and its number
+      of records.
+
+    The directory is followed by a pool of the names of the parameters, which are shared by many
+    classes. The index of a section contains the offsets of its records, sorted by the name of the
+    class. A record contains the name of the class, its amount of parameters and the offsets of the
+    names of its parameters in the pool. All integers are little-endian and all strings are UTF-8
+    prefixed with their length.
+    """
+
+    MAGIC = b"DSLSIGDB"
+    SCHEMA_VERSION = 1
+
+    _HEADER = struct.Struct("<8sII")
+    _SECTION = struct.Struct("<II")
+    _OFFSET = struct.Struct("<I")
+    _LENGTH = struct.Struct("<H")
+
+    def __init__(self, path: str):
+        """
+        Open a database and read its directory of sections.
+
+        :param path: Path of the database file.
+        :raises ValueError: When the file is not a database of the supported schema version.
+        """
+        with open(path, "rb") as file_handler:
+            try:
+                self._data = mmap.mmap(file_handler.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                self._data = file_handler.read()
+        if len(self._data) < SignatureDatabase._HEADER.size:
+            raise ValueError(f"'{path}' is not a signature database.")
+        magic, schema_version, section_count = SignatureDatabase._HEADER.unpack_from(self._data, 0)
+        if magic != SignatureDatabase.MAGIC:
+            raise ValueError(f"'{path}' is not a signature database.")
+        if schema_version != SignatureDatabase.SCHEMA_VERSION:
+            raise ValueError(
+                f"Signature database '{path}' has schema version {schema_version} instead of "
+                f"{SignatureDatabase.SCHEMA_VERSION}."
+            )
+
+        # The sections are in the order they are written, so the last one of a library is its latest
+        # version.
+        self._sections: List[Tuple[str, str, int, int]] = []
+        position = SignatureDatabase._HEADER.size
+        for _ in range(section_count):
+            library, position = self._read_string(position)
+            version, position = self._read_string(position)
+            index, count = SignatureDatabase._SECTION.unpack_from(self._data, position)
+            position += SignatureDatabase._SECTION.size
+            self._sections.append((library, version, index, count))
+
+    def sections(self) -> List[Tuple[str, str]]:
+        """
+        Get the sections of the database.
+
+        :return: The library and the version of the library of every section.
+        """
+        return [(library, version) for library, version, _, _ in self._sections]
+
+    def signatures(self, library: str, version: Optional[str] = None) -> "LibrarySignatures":
+        """
+        Get the signatures of a version of a library.
+
+        :param library: Name of the library, e.g., 'scikitlearn'.
+        :param version: Version of the library or None for the latest version in the database.
+        :return: Read-only mapping of the names of the classes to their signatures.
+        :raises KeyError: When the database has no section for the library and version.
+        """
+        for section_library, section_version, index, count in reversed(self._sections):
+            if section_library == library and (version is None or section_version == version):
+                return LibrarySignatures(self, index, count)
+        raise KeyError(f"No signatures of {library} {version or '(any version)'} in the database.")
+
+    def _read_string(self, position: int) -> Tuple[str, int]:
+        """
+        Read a string prefixed with its length.
+
+        :param position: Offset of the string.
+        :return: The string and the offset after it.
+        """
+        data, size = self._read_bytes(position)
+        return data.decode("utf-8"), position + size
+
+    def _read_bytes(self, position: int) -> Tuple[bytes, int]:
+        """
+        Read the bytes of a string prefixed with its length.
+
+        :param position: Offset of the string.
+        :return: The bytes and the size of the string including its length.
+        """
+        (length,) = SignatureDatabase._LENGTH.unpack_from(self._data, position)
+        start = position + SignatureDatabase._LENGTH.size
+        return self._data[start:start + length], SignatureDatabase._LENGTH.size + length
+
+    def _record_offset(self, index: int, number: int) -> int:
+        """
+        Get the offset of a record of a section.
+
+        :param index: Offset of the index of the section.
+        :param number: Number of the record in the section.
+        :return: Offset of the record.
+        """
+        position = index + number * SignatureDatabase._OFFSET.size
+        return SignatureDatabase._OFFSET.unpack_from(self._data, position)[0]
+
+    def _find(self, index: int, count: int, name: str) -> Optional[int]:
+        """
+        Find the record of a class in a section with a binary search over its index.
+
+        :param index: Offset of the index of the section.
+        :param count: Number of records in the section.
+        :param name: Name of the class.
+        :return: Offset of the record or None when the section has no record of the class.
+        """
+        key = name.encode("utf-8")
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            offset = self._record_offset(index, middle)
+            found = self._read_bytes(offset)[0]
+            if found == key:
+                return offset
+            if found < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def _read_record(self, offset: int) -> Tuple[int, List[str]]:
+        """
+        Read the parameters in a record.
+
+        :param offset: Offset of the record.
+        :return: The amount of parameters and the names of the parameters.
+        """
+        position = offset + self._read_bytes(offset)[1]
+        (positional,) = SignatureDatabase._LENGTH.unpack_from(self._data, position)
+        position += SignatureDatabase._LENGTH.size
+        (keyword_count,) = SignatureDatabase._LENGTH.unpack_from(self._data, position)
+        position += SignatureDatabase._LENGTH.size
+        keywords = []
+        for _ in range(keyword_count):
+            (keyword,) = SignatureDatabase._OFFSET.unpack_from(self._data, position)
+            keywords.append(self._read_string(keyword)[0])
+            position += SignatureDatabase._OFFSET.size
+        return positional, keywords
+
+    def _read_signature(self, offset: int) -> Signature:
+        """
+        Read the signature in a record.
+
+        :param offset: Offset of the record.
+        :return: Read-only mapping with the amount of parameters as 'positional' and their names as
+            'keywords'.
+        """
+        positional, keywords = self._read_record(offset)
+        return MappingProxyType({"positional": positional, "keywords": frozenset(keywords)})
+
+    @staticmethod
+    def write(path: str, sections: List[Tuple[str, str, Dict[str, Tuple[int, List[str]]]]]):
+        """
+        Write a database.
+
+        :param path: Path of the database file.
+        :param sections: The library, the version of the library and the signatures of every
+            section. The signatures map the names of the classes to their amount of parameters and
+            the names of their parameters.
+        """
+        encode = SignatureDatabase._encode
+        # The offsets are relative to the start of the file, in which the header is followed by the
+        # directory, the pool of the names of the parameters and the records of the sections.
+        start = SignatureDatabase._HEADER.size + sum(
+            len(encode(library)) + len(encode(version)) + SignatureDatabase._SECTION.size
+            for library, version, _ in sections
+        )
+        pool, keyword_offsets = SignatureDatabase._encode_pool(sections, start)
+        start += len(pool)
+
+        directory = bytearray()
+        body = bytearray()
+        for library, version, signatures in sections:
+            index = start + len(body)
+            body += SignatureDatabase._encode_section(signatures, index, keyword_offsets)
+            directory += encode(library) + encode(version)
+            directory += SignatureDatabase._SECTION.pack(index, len(signatures))
+
+        header = SignatureDatabase._HEADER.pack(
+            SignatureDatabase.MAGIC, SignatureDatabase.SCHEMA_VERSION, len(sections)
+        )
+        with open(path, "wb") as file_handler:
+            file_handler.write(header + directory + pool + body)
+
+    @staticmethod
+    def _encode(string: str) -> bytes:
+        """
+        Encode a string prefixed with its length.
+
+        :param string: The string.
+        :return: The encoded string.
+        """
+        data = string.encode("utf-8")
+        return SignatureDatabase._LENGTH.pack(len(data)) + data
+
+    @staticmethod
+    def _encode_pool(
+        sections: List[Tuple[str, str, Dict[str, Tuple[int, List[str]]]]], start: int
+    ) -> Tuple[bytes, Dict[str, int]]:
+        """
+        Encode the pool of the names of the parameters of all sections.
+
+        :param sections: The sections, see write.
+        :param start: Offset of the pool in the file.
+        :return: The pool and the offsets of the names in the file.
+        """
+        pool = bytearray()
+        keyword_offsets: Dict[str, int] = {}
+        for _, _, signatures in sections:
+            for _, keywords in signatures.values():
+                for keyword in keywords:
+                    if keyword not in keyword_offsets:
+                        keyword_offsets[keyword] = start + len(pool)
+                        pool += SignatureDatabase._encode(keyword)
+        return bytes(pool), keyword_offsets
+
+    @staticmethod
+    def _encode_section(
+        signatures: Dict[str, Tuple[int, List[str]]], start: int, keyword_offsets: Dict[str, int]
+    ) -> bytes:
+        """
+        Encode the index of a section followed by its records.
+
+        :param signatures: The signatures of the section, see write.
+        :param start: Offset of the section in the file.
+        :param keyword_offsets: Offsets of the names of the parameters in the file.
+        :return: The encoded section.
+        """
+        names = sorted(signatures, key=lambda name: name.encode("utf-8"))
+        offset_size = SignatureDatabase._OFFSET.size
+        section = bytearray(len(names) * offset_size)
+        for number, name in enumerate(names):
+            positional, keywords = signatures[name]
+            SignatureDatabase._OFFSET.pack_into(section, number * offset_size, start + len(section))
+            section += SignatureDatabase._encode(name)
+            section += SignatureDatabase._LENGTH.pack(positional)
+            section += SignatureDatabase._LENGTH.pack(len(keywords))
+            for keyword in keywords:
+                section += SignatureDatabase._OFFSET.pack(keyword_offsets[keyword])
+        return bytes(section)
+
+    def read_sections(self) -> List[Tuple[str, str, Dict[str, Tuple[int, List[str]]]]]:
+        """
+        Read all sections of the database, e.g., to write them again with an added section.
+
+        :return: The library, the version of the library and the signatures of every section, see
+            write.
+        """
+        sections = []
+        for library, version, index, count in self._sections:
+            signatures = {}
+            for number in range(count):
+                offset = self._record_offset(index, number)
+                name = self._read_string(offset)[0]
+                signatures[name] = self._read_record(offset)
+            sections.append((library, version, signatures))
+        return sections
+
+
+class LibrarySignatures(Mapping[str, Signature]):
+    """
+    Read-only mapping of the names of the classes of a section of a SignatureDatabase to their
+    signatures.
+    """
+
+    def __init__(self, database: SignatureDatabase, index: int, count: int):
+        """
+        Create the mapping of a section.
+
+        :param database: The database.
+        :param index: Offset of the index of the section.
+        :param count: Number of records in the section.
+        """
+        self._database = database
+        self._index = index
+        self._count = count
+        self._signatures: Dict[str, Optional[Signature]] = {}
+
+    def __getitem__(self, name: str) -> Signature:
+        """
+        Get the signature of a class, reading it from the database the first time.
+
+        :param name: Name of the class.
+        :return: The signature.
+        :raises KeyError: When the section has no signature of the class.
+        """
+        if name not in self._signatures:
+            self._signatures[name] = None
+            if isinstance(name, str):
+                offset = self._database._find(self._index, self._count, name)
+                if offset is not None:
+                    self._signatures[name] = self._database._read_signature(offset)
+        signature = self._signatures[name]
+        if signature is None:
+            raise KeyError(name)
+        return signature
+
+    def __contains__(self, name: object) -> bool:
+        """
+        Evaluate whether the section has a signature of a class.
+
+        :param name: Name of the class.
+        :return: True when the section has a signature of the class.
+        """
+        try:
+            self[name]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the names of the classes, in the order of their UTF-8 encoding.
+
+        :return: Iterator over the names.
+        """
+        for number in range(self._count):
+            offset = self._database._record_offset(self._index, number)
+            yield self._database._read_string(offset)[0]
+
+    def __len__(self) -> int:
+        """
+        Get the number of classes in the section.
+
+        :return: The number of classes.
+        """
+        return self._count
@@ -1,20 +1,110 @@
 """Utility module for type inference."""
-import os
-from typing import Callable, Dict, List, Tuple
+import json
+import subprocess
+import sys
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from weakref import WeakSet
 
 import astroid
-import mypy.api
 
 from dslinter.utils.ast import ASTUtil
-import uuid
+from dslinter.utils.heuristic_type_inference import HeuristicTypeInference
+from dslinter.utils.module_cache import ModuleCache
+from dslinter.utils.mypy_daemon import MypyDaemon
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+from dslinter.utils.type_propagation import TypePropagation
+from dslinter.utils.variable_provenance import VariableProvenance
+
+if TYPE_CHECKING:
+    # The pre-pass uses the type inference itself, so it is only imported for its type.
+    from dslinter.utils.type_inference_prepass import TypeInferencePrepass
 
 
 class TypeInference:
     """Utility class for type inference."""
 
-    #pylint: disable = line-too-long
+    # Persistent cache of revealed types, None when results are not cached on disk.
+    cache: Optional[TypeInferenceCache] = None
+
+    @staticmethod
+    def configure_cache(directory: str, max_size: int):
+        """
+        Configure the persistent cache of revealed types.
+
+        :param directory: Directory to store the cache in. An empty string disables the cache.
+        :param max_size: Maximum size of the cache in bytes.
+        """
+        TypeInference.cache = TypeInferenceCache(directory, max_size) if directory else None
+
+    # How the types are inferred: 'mypy', 'dmypy' or 'propagation'.
+    backend: str = "mypy"
+    # Client of the mypy daemon used to run mypy, None when mypy runs without the daemon.
+    daemon: Optional[MypyDaemon] = None
+
+    @staticmethod
+    def configure_backend(backend: str, daemon_directory: str = ""):
+        """
+        Configure how the types are inferred.
+
+        :param backend: 'mypy' to run mypy for every module, 'dmypy' to run mypy through its daemon
+            or 'propagation' to infer the types without mypy, see TypePropagation.
+        :param daemon_directory: Directory of a persistent daemon. An empty string starts a daemon
+            for the current lint session only.
+        """
+        if TypeInference.daemon is not None:
+            TypeInference.daemon.stop()
+        TypeInference.backend = backend
+        TypeInference.daemon = MypyDaemon(daemon_directory) if backend == "dmypy" else None
+
+    # Pre-pass type checking the modules of a linted package together, None when every module is
+    # type checked on its own.
+    prepass: Optional["TypeInferencePrepass"] = None
+    # Queries of the checkers answered by the pre-pass, as (node type, expression, libraries).
+    prepass_queries: List[Tuple[type, Callable, Optional[Tuple[str, ...]]]] = []
+
+    # Seconds mypy may take for a single module before its types are inferred heuristically,
+    # 0 for no limit.
+    timeout: float = 0
+    # Modules of which the types are inferred heuristically, because mypy timed out on them.
+    fallback_modules: "WeakSet[astroid.Module]" = WeakSet()
+
+    # Libraries of which the objects can be, or be converted to, pandas DataFrames.
+    DATAFRAME_LIBRARIES = ("pandas", "pyspark")
+
     @staticmethod
-    def infer_types(module: astroid.Module, node_type: type, expr: Callable) -> Dict[astroid.node_classes.NodeNG, str]:
+    def register_prepass_query(
+        node_type: type, expr: Callable, libraries: Optional[Tuple[str, ...]] = None
+    ):
+        """
+        Register a query of a checker, so the pre-pass infers its types in advance.
+
+        :param node_type: Type of node of which the type will be inferred on a certain attribute.
+        :param expr: Expression to extract the attribute from the node where the type will be
+            inferred on. E.g., lambda node: node.func.expr.name
+        :param libraries: Libraries a module has to use for the query to be answered, see
+            infer_types.
+        """
+        if (node_type, expr, libraries) not in TypeInference.prepass_queries:
+            TypeInference.prepass_queries.append((node_type, expr, libraries))
+
+    @staticmethod
+    def called_object_name(node: astroid.Call) -> str:
+        """
+        Expression for the name of the object a function is called on, e.g., 'df' in 'df.abs()'.
+
+        :param node: Call node to extract the name from.
+        :return: Name of the object the function is called on.
+        """
+        return node.func.expr.name
+
+    @staticmethod
+    def infer_types(
+        module: astroid.Module,
+        node_type: type,
+        expr: Callable,
+        libraries: Optional[Tuple[str, ...]] = None,
+    ) -> Dict[astroid.node_classes.NodeNG, str]:
         """
         Infer the types of an attribute of all nodes of the same type in a module.
 
@@ -22,15 +112,103 @@ class TypeInference:
         :param node_type: Type of node of which the type will be inferred on a certain attribute.
         :param expr: Expression to extract the attribute from the node where the type will be
             inferred on. E.g., lambda node: node.func.expr.name
+        :param libraries: Libraries the types the checker looks for come from, e.g., ('pandas',).
+            When given, mypy is not ran on modules which do not use any of these libraries and
+            no types are inferred for them.
         :return: All nodes in the module of type 'node_type' with the inferred type of the attribute
             accessible with the expression 'expr'.
         """
+        if libraries is not None and not TypeInference.uses_libraries(module, libraries):
+            return {}
+        if TypeInference.backend == "propagation":
+            return ModuleCache.get(
+                module,
+                ("infer_types_propagation", node_type, expr),
+                lambda: TypePropagation.infer_types(ASTUtil.search_nodes(module, node_type), expr),
+            )
+        if TypeInference.prepass is not None and module.file is not None:
+            TypeInference.prepass.prepare_package(module.file)
+
         nodes = ASTUtil.search_nodes(module, node_type)
+        if not nodes:
+            return {}
         source_code = ASTUtil.get_source_code(module)
         mypy_code = TypeInference.add_reveal_type_calls(source_code, nodes, expr)
-        mypy_result = TypeInference.run_mypy(mypy_code)
+        # Checkers asking for the same query on the same module share a single mypy run. The
+        # instrumented code identifies the query, so equivalent expressions are shared as well.
+        return ModuleCache.get(
+            module,
+            ("infer_types", node_type, mypy_code),
+            lambda: TypeInference._infer_instrumented_types(module, nodes, expr, mypy_code),
+        )
+
+    @staticmethod
+    def uses_libraries(module: astroid.Module, libraries: Tuple[str, ...]) -> bool:
+        """
+        Evaluate whether a module imports one of the libraries and references the imported names.
+
+        This is a cheap check whether objects of the libraries can occur in a module, so mypy does
+        not have to run on modules without them. Objects only obtained through functions of other
+        modules, without the module importing the library itself, are not taken into account.
+
+        :param module: The module to evaluate.
+        :param libraries: Names of the top-level packages of the libraries, e.g., ('pandas',).
+        :return: True when the module imports one of the libraries and uses what it imports.
+        """
+        return ModuleCache.get(
+            module,
+            ("uses_libraries", libraries),
+            lambda: TypeInference._uses_libraries(module, libraries),
+        )
+
+    @staticmethod
+    def _uses_libraries(module: astroid.Module, libraries: Tuple[str, ...]) -> bool:
+        """
+        Evaluate whether a module imports one of the libraries and references the imported names.
+
+        :param module: The module to evaluate.
+        :param libraries: Names of the top-level packages of the libraries, e.g., ('pandas',).
+        :return: True when the module imports one of the libraries and uses what it imports.
+        """
+        imported_names = set()
+        for node in module.nodes_of_class((astroid.Import, astroid.ImportFrom)):
+            if isinstance(node, astroid.Import):
+                for name, alias in node.names:
+                    if name.split(".")[0] in libraries:
+                        imported_names.add(alias or name.split(".")[0])
+            elif node.level is None or node.level == 0:
+                if node.modname.split(".")[0] in libraries:
+                    for name, alias in node.names:
+                        if name == "*":
+                            return True  # The imported names are unknown.
+                        imported_names.add(alias or name)
+        if not imported_names:
+            return False
+        return any(node.name in imported_names for node in module.nodes_of_class(astroid.Name))
+
+    @staticmethod
+    def _infer_instrumented_types(
+        module: astroid.Module,
+        nodes: List[astroid.node_classes.NodeNG],
+        expr: Callable,
+        mypy_code: str,
+    ) -> Dict[astroid.node_classes.NodeNG, str]:
+        """
+        Run mypy on code instrumented with reveal_type() calls and combine the result
+        with the nodes.
+
+        :param module: The module node where all nodes are located in.
+        :param nodes: Nodes of which the type is revealed in the instrumented code.
+        :param expr: Expression to extract the attribute from the node where the type is
+            inferred on.
+        :param mypy_code: Source code of the module including the reveal_type() calls.
+        :return: Dict with nodes and their inferred types.
+        """
         try:
-            mypy_types = TypeInference.parse_mypy_result(mypy_result)
+            mypy_types = TypeInference.reveal_types(mypy_code)
+        except TimeoutError:
+            TypeInference.fallback_modules.add(module)
+            return HeuristicTypeInference.infer_types(module, nodes, expr)
         except SyntaxError as ex:
             mypy_code_split = mypy_code.splitlines()
             faulty_code = mypy_code_split[int(ex.lineno) - 1]
@@ -48,6 +226,33 @@ class TypeInference:
                 return {}
         return TypeInference.combine_nodes_with_inferred_types(nodes, mypy_types)
 
+    @staticmethod
+    def reveal_types(mypy_code: str) -> List[Tuple[int, str]]:
+        """
+        Get the types revealed by mypy in code instrumented with reveal_type() calls.
+
+        The persistent cache is consulted first, mypy only runs when the code is not cached.
+
+        :param mypy_code: Code including the reveal_type() calls.
+        :return: List of (line number, inferred type) Tuples.
+        """
+        if TypeInference.prepass is not None:
+            prepared_types = TypeInference.prepass.prepared_types(mypy_code)
+            if prepared_types is not None:
+                return prepared_types
+
+        if TypeInference.cache is not None:
+            mypy_types = TypeInference.cache.get(mypy_code)
+            if mypy_types is not None:
+                return mypy_types
+
+        mypy_result = TypeInference.run_mypy(mypy_code)
+        mypy_types = TypeInference.parse_mypy_result(mypy_result)
+        # An empty result means mypy itself failed, which should not be remembered.
+        if TypeInference.cache is not None and mypy_result != "":
+            TypeInference.cache.put(mypy_code, mypy_types)
+        return mypy_types
+
     @staticmethod
     def add_reveal_type_calls(code: str, nodes: List, expr: Callable) -> str:
         """
@@ -94,7 +299,11 @@ class TypeInference:
         :param node: The node where a call is added to in the source code.
         :return: Line number where the reveal_type() call can be added.
         """
-        if hasattr(node.parent, "blockstart_tolineno") and node not in node.parent.body and len(node.parent.body) > 0:
+        if (
+            hasattr(node.parent, "blockstart_tolineno")
+            and node not in node.parent.body
+            and len(node.parent.body) > 0
+        ):
             return TypeInference.line_to_add_call(node.parent.body[0])
         return node.tolineno
 
@@ -103,22 +312,68 @@ class TypeInference:
         """
         Run mypy on some code.
 
+        When the mypy daemon is configured, mypy is ran through the daemon. If the daemon is not
+        available, mypy is ran without it.
+
         :param code: Code to run mypy on.
         :return: Normal report written to sys.stdout by mypy.
+        :raises TimeoutError: When mypy runs longer than the configured timeout.
         """
-        id1 = str(uuid.uuid1())
-        _tmp_dslinter_file = "_tmp_dslinter"+id1+".py"
-        file = open(_tmp_dslinter_file, "w", encoding="utf-8")
-        file.write(code)
-        file.close()
-        result = mypy.api.run([_tmp_dslinter_file])
-        os.remove(_tmp_dslinter_file)
+        if TypeInference.daemon is not None:
+            result = TypeInference.daemon.run(code)
+            if result is not None:
+                return result
+
+        # The code is passed to mypy in memory, where it is checked as the module at path <string>.
+        result = TypeInference.run_mypy_api(["-c", code], TypeInference.timeout)
 
         if result[1] != '':
             # raise Exception("Running mypy resulted in an error: " + result[1])
             return ""
         return result[0]
 
+    @staticmethod
+    def run_mypy_api(args: List[str], timeout: float) -> Tuple[str, str, int]:
+        """
+        Run mypy with command line arguments, like mypy.api.run does.
+
+        Without a timeout, mypy runs in this process. With a timeout, mypy runs in a separate
+        process, so it can be stopped when it takes too long.
+
+        :param args: Command line arguments of mypy.
+        :param timeout: Seconds after which mypy is stopped, 0 for no limit.
+        :return: Normal report written to sys.stdout, error report written to sys.stderr and the
+            exit status.
+        :raises TimeoutError: When mypy runs longer than the timeout.
+        """
+        if timeout <= 0:
+            # mypy is imported when it runs, so loading the plugin does not import it.
+            import mypy.api  # pylint: disable = import-outside-toplevel
+
+            return mypy.api.run(args)
+
+        # The arguments are passed through stdin, as they include the code, which can be too long
+        # for the command line.
+        script = (
+            "import json, sys, mypy.api; json.dump(mypy.api.run(json.load(sys.stdin)), sys.stdout)"
+        )
+        try:
+            process = subprocess.run(
+                [sys.executable, "-c", script],
+                input=json.dumps(args),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
+        except subprocess.TimeoutExpired as ex:
+            raise TimeoutError(f"mypy did not finish within {timeout} seconds.") from ex
+        try:
+            stdout, stderr, exit_status = json.loads(process.stdout)
+        except ValueError:
+            return "", process.stderr, process.returncode
+        return stdout, stderr, exit_status
+
     @staticmethod
     def parse_mypy_result(mypy_result: str) -> List[Tuple[int, str]]:
         """
@@ -151,14 +406,16 @@ class TypeInference:
         :param types: List of (line number, inferred type) Tuples.
         :return: Dict with nodes and their inferred types.
         """
-        unseen_types = types.copy()
+        # Queue the types per line, so multiple calls on the same line get their types in order.
+        types_per_line = defaultdict(deque)
+        for line, type_inferred in types:
+            types_per_line[line].append(type_inferred)
+
         nodes_with_types = {}
         for node in nodes:
-            for line, type_inferred in unseen_types:
-                if TypeInference.line_to_add_call(node) == line:
-                    nodes_with_types[node] = type_inferred
-                    # Remove the tuple so multiple calls on the same line get the correct type.
-                    unseen_types.remove((line, type_inferred))
+            unseen_types = types_per_line.get(TypeInference.line_to_add_call(node))
+            if unseen_types:
+                nodes_with_types[node] = unseen_types.popleft()
         return nodes_with_types
 
     @staticmethod
@@ -169,64 +426,19 @@ class TypeInference:
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
-        variables_with_full_types = {}
-        nodes = ASTUtil.search_nodes(module, astroid.Assign)
-        for node in nodes:
-            if hasattr(node, "targets"):
-                for var in node.targets:
-                    if hasattr(var, "name"):
-                        variable_name = var.name
-                        if isinstance(node.value, astroid.nodes.Const):
-                            variables_with_full_types[variable_name] = 'const'
-                        elif hasattr(node.value, "func"):
-                            call = node.value.func
-                            full_type = ""
-                            if hasattr(call, "attrname"):
-                                full_type = "." + call.attrname + full_type
-                            while hasattr(call, "expr"):
-                                call = call.expr
-                                if hasattr(call, "attrname"):
-                                    full_type = "." + call.attrname + full_type
-                            if hasattr(call, "name"):
-                                full_type = call.name + full_type
-                            variables_with_full_types[variable_name] = full_type
-
-        return variables_with_full_types
+        provenance = VariableProvenance.for_module(module)
+        return {name: provenance.most_recent(name) for name in provenance.names()}
 
     @staticmethod
-    def infer_variable_full_types(module: astroid.Module) -> Dict[str, str]:
+    def infer_variable_full_types(module: astroid.Module) -> Dict[str, List[str]]:
         """
         When there is no stub available for a library (e.g., missing tensorflow-stubs),
         use this method instead of infer_types. Infer variable type in Assign nodes.
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
-        variables_with_full_types = {}
-        nodes = ASTUtil.search_nodes(module, astroid.Assign)
-        for node in nodes:
-            if hasattr(node, "targets"):
-                for var in node.targets:
-                    if hasattr(var, "name"):
-                        variable_name = var.name
-                        if isinstance(node.value, astroid.nodes.Const):
-                            variables_with_full_types[variable_name] = ['const']
-                        elif hasattr(node.value, "func"):
-                            call = node.value.func
-                            full_type = ""
-                            if hasattr(call, "attrname"):
-                                full_type = "." + call.attrname + full_type
-                            while hasattr(call, "expr"):
-                                call = call.expr
-                                if hasattr(call, "attrname"):
-                                    full_type = "." + call.attrname + full_type
-                            if hasattr(call, "name"):
-                                full_type = call.name + full_type
-                            if variable_name not in variables_with_full_types:
-                                variables_with_full_types[variable_name] = [full_type]
-                            else:
-                                variables_with_full_types[variable_name].append(full_type)
-
-        return variables_with_full_types
+        provenance = VariableProvenance.for_module(module)
+        return {name: provenance.all(name) for name in provenance.names()}
 
     @staticmethod
     def infer_native_variable_most_recent_types(module: astroid.Module) -> Dict[str, str]:
@@ -236,11 +448,8 @@ class TypeInference:
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
-        variables_with_types = {}
-        variables_with_full_types = TypeInference.infer_variable_most_recent_full_types(module)
-        for k, v in variables_with_full_types.items():
-            variables_with_types[k] = v.split(".")[0]
-        return variables_with_types
+        provenance = VariableProvenance.for_module(module)
+        return {name: provenance.root_library(name) for name in provenance.names()}
 
     @staticmethod
     def infer_library_variable_most_recent_types(module: astroid.Module) -> Dict[str, str]:
@@ -250,12 +459,12 @@ class TypeInference:
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
+        provenance = VariableProvenance.for_module(module)
         variables_with_types = {}
-        variables_with_full_types = TypeInference.infer_variable_most_recent_full_types(module)
-        for k, v in variables_with_full_types.items():
-            strings = v.split(".")
-            if len(strings) >= 2:
-                variables_with_types[k] = strings[0] + "." + strings[1]
+        for name in provenance.names():
+            library_submodule = provenance.library_submodule(name)
+            if library_submodule is not None:
+                variables_with_types[name] = library_submodule
         return variables_with_types
 
     @staticmethod
@@ -266,10 +475,10 @@ class TypeInference:
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
+        provenance = VariableProvenance.for_module(module)
         variables_with_types = {}
-        variables_with_full_types = TypeInference.infer_variable_full_types(module)
-        for k, v in variables_with_full_types.items():
-            strings = v[0].split(".")
-            if len(strings) >= 2:
-                variables_with_types[k] = strings[0] + "." + strings[1]
+        for name in provenance.names():
+            library_submodule = provenance.library_submodule(name, first=True)
+            if library_submodule is not None:
+                variables_with_types[name] = library_submodule
         return variables_with_types
@@ -0,0 +1,148 @@
+"""Utility module for caching the types revealed by mypy on disk."""
+import hashlib
+import json
+import os
+import tempfile
+from importlib import metadata
+from typing import List, Optional, Tuple
+
+
+class TypeInferenceCache:
+    """
+    Persistent cache for the types revealed by mypy, addressed by the content of the checked code.
+
+    An entry is keyed by the instrumented source code (the source of the module including its
+    reveal_type() calls) together with the versions of mypy and the stub packages, as those
+    determine the outcome of a mypy run. Entries are evicted least recently used first when the
+    cache grows beyond its maximum size.
+    """
+
+    # Packages which influence the types revealed by mypy.
+    TYPING_PACKAGES = ["mypy", "data-science-types", "pyspark-stubs"]
+    # Subdirectory with the modules type checked in a single mypy run and the incremental cache of
+    # mypy, see TypeInferencePrepass.run_mypy_batch. Its files are not entries of this cache.
+    MYPY_DIRECTORY = "mypy"
+
+    def __init__(self, directory: str, max_size: int):
+        """
+        Create a cache in a directory.
+
+        :param directory: Directory where the entries are stored. It is created when needed.
+        :param max_size: Maximum size of all entries together in bytes.
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self._environment = self._typing_environment()
+        self._size: Optional[int] = None
+
+    def get(self, code: str) -> Optional[List[Tuple[int, str]]]:
+        """
+        Get the revealed types stored for some code.
+
+        :param code: Code mypy is ran on.
+        :return: List of (line number, inferred type) Tuples or None when the code is not cached.
+        """
+        path = self._entry_path(code)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                types = json.load(file)
+            # Mark the entry as recently used for the eviction.
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return [tuple(entry) for entry in types]
+
+    def put(self, code: str, types: List[Tuple[int, str]]):
+        """
+        Store the revealed types of some code.
+
+        :param code: Code mypy is ran on.
+        :param types: List of (line number, inferred type) Tuples revealed by mypy.
+        """
+        path = self._entry_path(code)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first, so concurrent linters never read a partial entry.
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                json.dump(types, file)
+            os.replace(tmp_path, path)
+            self._add_size(os.path.getsize(path))
+        except OSError:
+            pass  # The cache is an optimization only, linting continues without it.
+
+    def _entry_path(self, code: str) -> str:
+        """
+        Get the path of the entry of some code.
+
+        :param code: Code mypy is ran on.
+        :return: Path of the entry.
+        """
+        digest = hashlib.sha256()
+        digest.update(self._environment.encode("utf-8"))
+        digest.update(code.encode("utf-8"))
+        key = digest.hexdigest()
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def _add_size(self, added: int):
+        """
+        Account for an added entry and evict entries when the cache became too large.
+
+        :param added: Size of the added entry in bytes.
+        """
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += added
+        if self._size > self.max_size:
+            self._evict()
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache is below 90% of its size limit."""
+        entries = sorted(self._entries())
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self.max_size * 0.9:
+                break
+            try:
+                os.remove(path)
+                self._size -= size
+            except OSError:
+                pass
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """
+        List all entries in the cache.
+
+        :return: List of (last use, size, path) Tuples.
+        """
+        entries = []
+        for root, directories, files in os.walk(self.directory):
+            if root == self.directory:
+                directories[:] = [
+                    name for name in directories if name != TypeInferenceCache.MYPY_DIRECTORY
+                ]
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    @staticmethod
+    def _typing_environment() -> str:
+        """
+        Describe the installed packages which influence the types revealed by mypy.
+
+        :return: Package names with their installed versions.
+        """
+        versions = []
+        for package in TypeInferenceCache.TYPING_PACKAGES:
+            try:
+                versions.append(package + "==" + metadata.version(package))
+            except metadata.PackageNotFoundError:
+                versions.append(package + "==none")
+        return ";".join(versions)
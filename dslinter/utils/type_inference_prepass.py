@@ -0,0 +1,325 @@
+"""Utility module for inferring the types of the modules of a package before they are linted."""
+import getpass
+import glob
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import astroid
+
+from dslinter.utils.ast import ASTUtil
+from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+
+
+class TypeInferencePrepass:
+    """
+    Pre-pass of the type inference, which type checks all modules of a linted package together.
+
+    The types of the queries registered with TypeInference.register_prepass_query are revealed in a
+    single mypy run per process of the pre-pass, and kept in memory (and in the persistent cache
+    when it is configured), so TypeInference.infer_types does not run mypy for these modules
+    anymore.
+    """
+
+    # Seconds after which a module of run_mypy_batch which was not type checked anymore is removed.
+    BATCH_STALE_AFTER = 7 * 24 * 60 * 60
+
+    def __init__(self, jobs: int = 0):
+        """
+        Create a pre-pass which did not type check any package yet.
+
+        :param jobs: Number of processes the pre-pass type checks the modules in, 0 for the number
+            of available cores.
+        """
+        self.jobs = jobs
+        # Types revealed by the pre-pass, by digest of the instrumented code.
+        self._prepared_types: Dict[str, List[Tuple[int, str]]] = {}
+        # Package directories which are type checked by the pre-pass.
+        self._prepared_packages: Set[str] = set()
+
+    def prepared_types(self, mypy_code: str) -> Optional[List[Tuple[int, str]]]:
+        """
+        Get the types revealed by the pre-pass in code instrumented with reveal_type() calls.
+
+        :param mypy_code: Code including the reveal_type() calls.
+        :return: List of (line number, inferred type) Tuples or None when the pre-pass did not
+            type check the code.
+        """
+        return self._prepared_types.get(TypeInferencePrepass._digest(mypy_code))
+
+    def prepare_package(self, path: str):
+        """
+        Infer the types of all modules in the package of a file in a single mypy run.
+
+        The package is the top-most directory containing the file in which every directory has an
+        '__init__.py' file. A file outside of a package only has its own directory prepared.
+
+        :param path: Path of a file in the package.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        while os.path.isfile(os.path.join(os.path.dirname(directory), "__init__.py")):
+            directory = os.path.dirname(directory)
+        if directory in self._prepared_packages:
+            return
+        self._prepared_packages.add(directory)
+
+        paths = []
+        for root, directories, files in os.walk(directory):
+            paths += [os.path.join(root, file) for file in sorted(files) if file.endswith(".py")]
+            # Only descend into subpackages, like pylint does when it lints a package.
+            directories[:] = sorted(
+                sub for sub in directories if os.path.isfile(os.path.join(root, sub, "__init__.py"))
+            )
+            if not os.path.isfile(os.path.join(directory, "__init__.py")):
+                break
+        self.prepare(paths)
+
+    def prepare(self, paths: Iterable[str]):
+        """
+        Infer the types of the registered queries on many files in a single mypy run per process of
+        the pre-pass.
+
+        The revealed types are kept in memory (and in the persistent cache when it is configured),
+        so later calls to infer_types on these files do not run mypy anymore.
+
+        :param paths: Paths of the Python files to infer the types of.
+        """
+        codes = {}
+        for path in paths:
+            try:
+                with open(path, "rb") as file:
+                    source_code = file.read().decode("utf-8")
+                module = astroid.parse(source_code, path=path)
+            except (OSError, UnicodeDecodeError, astroid.AstroidBuildingError):
+                continue  # The file is skipped here and inferred on its own when it is linted.
+            for node_type, expr, libraries in TypeInference.prepass_queries:
+                if libraries is not None and not TypeInference.uses_libraries(module, libraries):
+                    continue
+                nodes = ASTUtil.search_nodes(module, node_type)
+                if not nodes:
+                    continue  # mypy does not run for modules without the nodes, see infer_types.
+                mypy_code = TypeInference.add_reveal_type_calls(source_code, nodes, expr)
+                digest = TypeInferencePrepass._digest(mypy_code)
+                if digest in self._prepared_types or digest in codes:
+                    continue
+                if TypeInference.cache is not None:
+                    if TypeInference.cache.get(mypy_code) is not None:
+                        continue
+                codes[digest] = mypy_code
+
+        for digest, mypy_result in self.run_mypy_shards(codes).items():
+            try:
+                mypy_types = TypeInference.parse_mypy_result(mypy_result)
+            except SyntaxError:
+                continue  # Handled when the module itself is inferred.
+            self._prepared_types[digest] = mypy_types
+            if TypeInference.cache is not None:
+                TypeInference.cache.put(codes[digest], mypy_types)
+
+    @staticmethod
+    def _digest(code: str) -> str:
+        """
+        Compute the digest identifying some code.
+
+        :param code: Code to compute the digest of.
+        :return: Hexadecimal digest.
+        """
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def run_mypy_shards(self, codes: Dict[str, str]) -> Dict[str, str]:
+        """
+        Run mypy on many pieces of code, split in shards which are type checked in parallel
+        processes.
+
+        Every shard is type checked in a single mypy run, see run_mypy_batch. The number of shards
+        is the number of processes of the pre-pass, but never more than the number of pieces of
+        code.
+
+        :param codes: Code to run mypy on, by an identifier of the code.
+        :return: Report written by mypy for each piece of code, by the identifier of the code.
+            Code which mypy did not report on successfully is left out.
+        """
+        processes = min(self.processes(), len(codes))
+        if processes <= 1:
+            return TypeInferencePrepass.run_mypy_batch(codes)
+
+        items = list(codes.items())
+        shards = [dict(items[shard::processes]) for shard in range(processes)]
+        results: Dict[str, str] = {}
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(TypeInferencePrepass._run_mypy_shard, shard, TypeInference.timeout)
+                for shard in shards
+            ]
+            for future in futures:
+                try:
+                    results.update(future.result())
+                except BrokenProcessPool:
+                    pass  # The modules of the shard are inferred on their own when they are linted.
+        return results
+
+    def processes(self) -> int:
+        """
+        Determine the number of processes the pre-pass type checks the modules in.
+
+        :return: The configured number of processes, or the number of cores available to this
+            process when it is not configured. 1 in the processes of pylint -j, which cannot start
+            processes.
+        """
+        # The processes pylint checks the modules in with -j are daemons, which cannot have
+        # children.
+        if multiprocessing.current_process().daemon:
+            return 1
+        if self.jobs > 0:
+            return self.jobs
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count() or 1
+
+    @staticmethod
+    def _run_mypy_shard(codes: Dict[str, str], timeout: float) -> Dict[str, str]:
+        """
+        Run mypy on a shard of the pre-pass, in a process of the pool of the pre-pass.
+
+        :param codes: Code to run mypy on, by an identifier of the code.
+        :param timeout: Seconds mypy may take for a single module, see TypeInference.timeout.
+        :return: Report written by mypy for each piece of code, see run_mypy_batch.
+        """
+        # The options are not inherited when the process is spawned instead of forked.
+        TypeInference.timeout = timeout
+        return TypeInferencePrepass.run_mypy_batch(codes)
+
+    @staticmethod
+    def run_mypy_batch(codes: Dict[str, str]) -> Dict[str, str]:
+        """
+        Run mypy once on many pieces of code, each checked as a separate module.
+
+        The modules are written to the same directory in every run, named by the digest of their
+        code, so mypy reuses its incremental cache for the code which did not change since a
+        previous run. A blocking error in one module, like a syntax error, stops mypy from checking
+        the others. Such modules are reported with their own output and mypy checks the other
+        modules again.
+
+        :param codes: Code to run mypy on, by an identifier of the code.
+        :return: Report written by mypy for each piece of code, by the identifier of the code.
+            Code which mypy did not report on successfully, or did not report on at all, is left
+            out.
+        """
+        results: Dict[str, str] = {}
+        # mypy reports the paths under the working directory relative to it, the others absolute.
+        directory = os.path.abspath(TypeInferencePrepass.batch_directory())
+        os.makedirs(directory, exist_ok=True)
+        # The identifiers of the code in every module, as equal code is written to the same module.
+        remaining: Dict[str, List[str]] = {}
+        for identifier, code in codes.items():
+            name = f"_dslinter_{TypeInferencePrepass._digest(code)[:32]}.py"
+            path = os.path.join(directory, name)
+            if path not in remaining:
+                TypeInferencePrepass._write_module(path, code)
+            remaining.setdefault(path, []).append(identifier)
+
+        cache_args = ["--cache-dir", os.path.join(directory, ".mypy_cache")]
+        while len(remaining) > 0:
+            try:
+                result = TypeInference.run_mypy_api(
+                    cache_args + list(remaining), TypeInference.timeout * len(remaining)
+                )
+            except TimeoutError:
+                break  # The remaining modules are inferred on their own, each with its own timeout.
+            if result[1] != "":
+                break
+            reports: Dict[str, List[str]] = {path: [] for path in remaining}
+            for line in result[0].splitlines():
+                path = os.path.abspath(line.split(".py:")[0] + ".py")
+                if path in reports:
+                    reports[path].append(line)
+
+            if "errors prevented further checking" not in result[0]:
+                reported = list(reports)
+            else:
+                reported = [
+                    path for path, lines in reports.items() if ": error: " in "\n".join(lines)
+                ]
+                if len(reported) == 0:
+                    break  # Blocked by an error outside of the checked code, e.g., in a stub.
+            for path in reported:
+                identifiers = remaining.pop(path)
+                # A module without any line in the report was not matched, which is not a result.
+                if reports[path]:
+                    report = "\n".join(reports[path])
+                    results.update((identifier, report) for identifier in identifiers)
+        TypeInferencePrepass._remove_stale_modules(directory)
+        return results
+
+    @staticmethod
+    def batch_directory() -> str:
+        """
+        Get the directory run_mypy_batch writes the modules it type checks to, with the incremental
+        cache of mypy.
+
+        :return: Path of the directory, in the directory of the persistent cache when it is
+            configured and in the temporary directory otherwise.
+        """
+        if TypeInference.cache is not None:
+            return os.path.join(TypeInference.cache.directory, TypeInferenceCache.MYPY_DIRECTORY)
+        try:
+            user = getpass.getuser()
+        except (KeyError, OSError):
+            user = "user"
+        return os.path.join(
+            tempfile.gettempdir(), f"dslinter-{TypeInferenceCache.MYPY_DIRECTORY}-{user}"
+        )
+
+    @staticmethod
+    def _write_module(path: str, code: str):
+        """
+        Write a module for run_mypy_batch, or mark it as used when it exists already.
+
+        The module is written to a temporary file first, as other linters may type check it at the
+        same time.
+
+        :param path: Path of the module.
+        :param code: Code of the module.
+        """
+        try:
+            # The name of the module is the digest of its code, so an existing module has the same
+            # code. mypy compares the digest of a module of which the modification time changed
+            # with its cache.
+            os.utime(path)
+            return
+        except OSError:
+            pass
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            file.write(code)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _remove_stale_modules(directory: str):
+        """
+        Remove the modules of run_mypy_batch which were not type checked for a while, with their
+        entries in the incremental cache of mypy, so the directory does not grow with every change
+        of the linted code.
+
+        :param directory: Directory of the modules.
+        """
+        now = time.time()
+        for path in glob.glob(os.path.join(directory, "_dslinter_*.py")):
+            try:
+                if now - os.path.getmtime(path) < TypeInferencePrepass.BATCH_STALE_AFTER:
+                    continue
+                os.remove(path)
+            except OSError:
+                continue
+            name = os.path.basename(path)[:-len(".py")]
+            for cache_path in glob.glob(os.path.join(directory, ".mypy_cache", "*", name + ".*")):
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
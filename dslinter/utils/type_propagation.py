@@ -0,0 +1,538 @@
+"""Utility module for inferring types by propagating them through the statements of a scope."""
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+import astroid
+
+from dslinter.utils.module_cache import ModuleCache
+
+# Types of the variables at a program point, by variable name. Variables of unknown type are left
+# out. None when the program point cannot be reached, e.g., after a return statement.
+Environment = Optional[Dict[str, str]]
+
+
+class TypePropagation:
+    """
+    Utility class for inferring the types of variables without mypy.
+
+    The types are propagated through the statements of each scope (module, class or function) in
+    the order they are executed: a variable has a type at a program point when every path to that
+    point assigns it a value of that type. Values get a type when they are created by a known
+    library function (e.g., pd.read_csv()) or a known method on an object of a known type (e.g.,
+    df.dropna()). Variables of an enclosing scope only have a type when every assignment in that
+    scope gives them the same type. Types are written the way mypy reveals them.
+    """
+
+    DATAFRAME = '"pandas.core.frame.DataFrame"'
+
+    # Types of the objects created by library functions and classes, by their full name.
+    FACTORIES = {
+        "pandas.DataFrame": DATAFRAME,
+        "pandas.core.frame.DataFrame": DATAFRAME,
+        "pandas.crosstab": DATAFRAME,
+        "pandas.get_dummies": DATAFRAME,
+        "pandas.json_normalize": DATAFRAME,
+        "pandas.merge": DATAFRAME,
+        "pandas.pivot_table": DATAFRAME,
+        "pandas.read_csv": DATAFRAME,
+        "pandas.read_excel": DATAFRAME,
+        "pandas.read_feather": DATAFRAME,
+        "pandas.read_fwf": DATAFRAME,
+        "pandas.read_json": DATAFRAME,
+        "pandas.read_orc": DATAFRAME,
+        "pandas.read_parquet": DATAFRAME,
+        "pandas.read_pickle": DATAFRAME,
+        "pandas.read_sql": DATAFRAME,
+        "pandas.read_sql_query": DATAFRAME,
+        "pandas.read_sql_table": DATAFRAME,
+        "pandas.read_stata": DATAFRAME,
+        "pandas.read_table": DATAFRAME,
+    }
+
+    # Types of the results of methods and attributes, by the type of the object and their name.
+    METHODS = {
+        DATAFRAME: dict.fromkeys(
+            [
+                "abs", "add", "append", "assign", "astype", "bfill", "clip", "copy", "corr", "cov",
+                "cummax", "cummin", "cumprod", "cumsum", "describe", "diff", "div", "drop",
+                "drop_duplicates", "dropna", "ffill", "fillna", "filter", "head", "interpolate",
+                "join", "mask", "melt", "merge", "mul", "nlargest", "nsmallest", "pct_change",
+                "pivot", "pivot_table", "query", "rank", "reindex", "rename", "replace",
+                "reset_index", "round", "sample", "select_dtypes", "set_index", "shift",
+                "sort_index", "sort_values", "sub", "tail", "transpose", "where",
+            ],
+            DATAFRAME,
+        ),
+    }
+    ATTRIBUTES = {DATAFRAME: {"T": DATAFRAME}}
+
+    # Types of the results of methods on objects of any type, e.g., pyspark's DataFrame.toPandas().
+    CONVERSIONS = {"toPandas": DATAFRAME}
+
+    @staticmethod
+    def infer_types(
+        nodes: List[astroid.node_classes.NodeNG], expr: Callable
+    ) -> Dict[astroid.node_classes.NodeNG, str]:
+        """
+        Infer the types of an attribute of nodes, like TypeInference.infer_types does with mypy.
+
+        :param nodes: Nodes of which the type will be inferred on a certain attribute.
+        :param expr: Expression to extract the attribute from the node where the type will be
+            inferred on. Only attributes which are variable names get a type.
+        :return: Dict with the nodes of which the type of the attribute is known and that type.
+        """
+        nodes_with_types = {}
+        for node in nodes:
+            try:
+                name = expr(node)
+            except:  # pylint: disable=bare-except
+                continue  # The attribute from the expression is not found.
+            if isinstance(name, str) and name.isidentifier():
+                inferred_type = TypePropagation.type_of(name, node)
+                if inferred_type is not None:
+                    nodes_with_types[node] = inferred_type
+        return nodes_with_types
+
+    @staticmethod
+    def type_of(name: str, node: astroid.node_classes.NodeNG) -> Optional[str]:
+        """
+        Infer the type of a variable at the program point of a node.
+
+        :param name: Name of the variable.
+        :param node: Node at the program point, e.g., the Name node of the variable.
+        :return: The type of the variable or None when it is not known.
+        """
+        scope = node.scope()
+        while not isinstance(scope, (astroid.Module, astroid.ClassDef, astroid.FunctionDef)):
+            # Names bound by lambdas and comprehensions are arguments and loop variables.
+            if name in scope.locals:
+                return None
+            scope = scope.parent.scope()
+
+        scope_analysis = _ScopeAnalysis.for_scope(scope)
+        if name not in scope.locals:
+            return scope_analysis.outer_type(name)
+        environment = scope_analysis.environments.get(node.statement())
+        return environment.get(name) if environment is not None else None
+
+
+class _ScopeAnalysis:
+    """Types of the variables before every statement of a scope."""
+
+    def __init__(self, scope: astroid.node_classes.NodeNG):
+        """
+        Propagate the types through the statements of a scope.
+
+        :param scope: Module, ClassDef or FunctionDef node.
+        """
+        self.scope = scope
+        self.environments: Dict[astroid.node_classes.NodeNG, Dict[str, str]] = {}
+        self._imported_names = _ScopeAnalysis._imports(scope.root())
+        self._global_names: Set[str] = set()
+        self._loops: List[Dict[str, List[Environment]]] = []
+        self._consistent_types: Dict[str, Optional[str]] = {}
+
+        environment = {}
+        if isinstance(scope, astroid.FunctionDef):
+            arguments = scope.args.args or []
+            annotations = scope.args.annotations or []
+            for argument, annotation in zip(arguments, annotations):
+                annotated_type = self._annotated_type(annotation)
+                if annotated_type is not None:
+                    environment[argument.name] = annotated_type
+        self._run(scope.body, environment)
+
+    @staticmethod
+    def for_scope(scope: astroid.node_classes.NodeNG) -> "_ScopeAnalysis":
+        """
+        Get the analysis of a scope, which is done once and shared by all checkers.
+
+        :param scope: Module, ClassDef or FunctionDef node.
+        :return: The analysis of the scope.
+        """
+        return ModuleCache.get(
+            scope.root(), ("type_propagation", scope), lambda: _ScopeAnalysis(scope)
+        )
+
+    @staticmethod
+    def _imports(module: astroid.Module) -> Dict[str, str]:
+        """
+        Map the names bound by the imports of a module to the full names of what they import.
+
+        :param module: The module of which the imports are mapped.
+        :return: Dict with the bound names and the full names.
+        """
+        imported_names = {}
+        for node in module.nodes_of_class((astroid.Import, astroid.ImportFrom)):
+            if isinstance(node, astroid.Import):
+                for name, alias in node.names:
+                    if alias is not None:
+                        imported_names[alias] = name
+                    else:
+                        imported_names[name.split(".")[0]] = name.split(".")[0]
+            elif node.level is None or node.level == 0:
+                for name, alias in node.names:
+                    imported_names[alias or name] = node.modname + "." + name
+        return imported_names
+
+    def outer_type(self, name: str) -> Optional[str]:
+        """
+        Get the type of a variable of an enclosing scope, which is the same wherever it is assigned.
+
+        :param name: Name of the variable which is not bound in this scope.
+        :return: The type of the variable or None when it is not known.
+        """
+        scope = self.scope.parent.scope() if self.scope.parent is not None else None
+        while scope is not None and not isinstance(scope, astroid.Module):
+            # Class bodies are not visible to the scopes they enclose.
+            if name in scope.locals and isinstance(scope, astroid.FunctionDef):
+                break
+            scope = scope.parent.scope()
+        if scope is None or name not in scope.locals:
+            return None
+        return _ScopeAnalysis.for_scope(scope).consistent_type(name)
+
+    def consistent_type(self, name: str) -> Optional[str]:
+        """
+        Get the type of a variable of this scope, when every assignment gives it the same type.
+
+        :param name: Name of the variable bound in this scope.
+        :return: The type of the variable or None when it is not known.
+        """
+        if name not in self._consistent_types:
+            self._consistent_types[name] = self._compute_consistent_type(name)
+        return self._consistent_types[name]
+
+    def _compute_consistent_type(self, name: str) -> Optional[str]:
+        """
+        Compute the type of a variable of this scope, when every assignment gives it the same type.
+
+        :param name: Name of the variable bound in this scope.
+        :return: The type of the variable or None when it is not known.
+        """
+        if name in self._global_names:
+            return None
+        types = set()
+        for binding in self.scope.locals.get(name, []):
+            statement = binding.statement()
+            if binding.frame() != self.scope:
+                return None
+            if not isinstance(statement, (astroid.Assign, astroid.AnnAssign)):
+                return None
+            environment = self.environments.get(statement)
+            if environment is None:
+                continue  # The assignment is never executed.
+            types.add(self._assigned_type(statement, environment))
+        if len(types) == 1:
+            return types.pop()
+        return None
+
+    def _run(
+        self, body: List[astroid.node_classes.NodeNG], environment: Environment
+    ) -> Environment:
+        """
+        Propagate the types through a list of statements.
+
+        :param body: Statements executed in order.
+        :param environment: Types of the variables before the first statement.
+        :return: Types of the variables after the last statement.
+        """
+        for statement in body:
+            if environment is None:
+                break  # The remaining statements cannot be reached.
+            named_expression_names = _ScopeAnalysis._named_expression_names(statement)
+            environment = _ScopeAnalysis._without(environment, named_expression_names)
+            self.environments[statement] = environment
+            environment = self._run_statement(statement, environment)
+        return environment
+
+    # pylint: disable = too-many-return-statements, too-many-branches
+    def _run_statement(
+        self, statement: astroid.node_classes.NodeNG, environment: Dict[str, str]
+    ) -> Environment:
+        """
+        Propagate the types through a single statement.
+
+        :param statement: The statement.
+        :param environment: Types of the variables before the statement.
+        :return: Types of the variables after the statement.
+        """
+        if isinstance(statement, (astroid.Assign, astroid.AnnAssign)):
+            assigned_type = self._assigned_type(statement, environment)
+            if isinstance(statement, astroid.Assign):
+                targets = statement.targets
+            else:
+                targets = [statement.target]
+            environment = _ScopeAnalysis._without_bound(environment, statement)
+            if assigned_type is not None:
+                environment = dict(environment)
+                for target in targets:
+                    if not isinstance(target, astroid.AssignName):
+                        continue
+                    if target.name not in self._global_names:
+                        environment[target.name] = assigned_type
+            return environment
+        if isinstance(statement, (astroid.Return, astroid.Raise)):
+            return None
+        if isinstance(statement, (astroid.Break, astroid.Continue)):
+            if self._loops:
+                exit_kind = "breaks" if isinstance(statement, astroid.Break) else "continues"
+                self._loops[-1][exit_kind].append(environment)
+            return None
+        if isinstance(statement, (astroid.Global, astroid.Nonlocal)):
+            self._global_names.update(statement.names)
+            return _ScopeAnalysis._without(environment, statement.names)
+        if isinstance(statement, astroid.If):
+            after_body = self._run(statement.body, environment)
+            return _ScopeAnalysis._join(after_body, self._run(statement.orelse, environment))
+        if isinstance(statement, (astroid.For, astroid.While)):
+            return self._run_loop(statement, environment)
+        if isinstance(statement, astroid.With):
+            for _, target in statement.items:
+                if target is not None:
+                    environment = _ScopeAnalysis._without_bound(environment, target, True)
+            return self._run(statement.body, environment)
+        if isinstance(statement, astroid.TryExcept):
+            after_body = self._run(statement.body, environment)
+            # An exception can be raised before or after any assignment in the body.
+            handler_environment = _ScopeAnalysis._without_bound(environment, statement)
+            result = self._run(statement.orelse, after_body)
+            for handler in statement.handlers:
+                handler_start = handler_environment
+                if handler.name is not None:
+                    handler_start = _ScopeAnalysis._without(handler_start, [handler.name.name])
+                self.environments[handler] = handler_start
+                result = _ScopeAnalysis._join(result, self._run(handler.body, handler_start))
+            return result
+        if isinstance(statement, astroid.TryFinally):
+            after_body = self._run(statement.body, environment)
+            # The final body also runs when the body is left early, e.g., by an exception.
+            final_environment = _ScopeAnalysis._join(
+                _ScopeAnalysis._without_bound(environment, statement), after_body
+            )
+            result = self._run(statement.finalbody, after_body) if after_body is not None else None
+            # Run the final body again, so the types before its statements hold on every path.
+            self._run(statement.finalbody, final_environment)
+            return result
+        if isinstance(statement, (astroid.Expr, astroid.Pass, astroid.Assert)):
+            return environment
+        # Any other statement, like an import, a definition or a match statement, gives the
+        # variables it binds an unknown type.
+        environment = _ScopeAnalysis._without_bound(environment, statement, True)
+        for child in statement.get_children():
+            if isinstance(child, astroid.node_classes.Statement) and not isinstance(
+                child, (astroid.FunctionDef, astroid.ClassDef)
+            ):
+                self._run([child], environment)
+        return environment
+
+    def _run_loop(
+        self, loop: astroid.node_classes.NodeNG, environment: Dict[str, str]
+    ) -> Environment:
+        """
+        Propagate the types through a for or while loop, until they are the same in every iteration.
+
+        :param loop: For or While node.
+        :param environment: Types of the variables before the loop.
+        :return: Types of the variables after the loop.
+        """
+        if isinstance(loop, astroid.For):
+            environment = _ScopeAnalysis._without_bound(environment, loop.target, True)
+        iteration_start = environment
+        while True:
+            self._loops.append({"breaks": [], "continues": []})
+            iteration_end = self._run(loop.body, iteration_start)
+            exits = self._loops.pop()
+            for continue_environment in exits["continues"]:
+                iteration_end = _ScopeAnalysis._join(iteration_end, continue_environment)
+            next_start = _ScopeAnalysis._join(environment, iteration_end)
+            if next_start == iteration_start:
+                break
+            iteration_start = next_start
+        if isinstance(loop, astroid.While):
+            self.environments[loop] = iteration_start
+        result = self._run(loop.orelse, iteration_start)
+        for break_environment in exits["breaks"]:
+            result = _ScopeAnalysis._join(result, break_environment)
+        return result
+
+    def _assigned_type(
+        self, statement: astroid.node_classes.NodeNG, environment: Dict[str, str]
+    ) -> Optional[str]:
+        """
+        Infer the type an Assign or AnnAssign statement gives to its targets.
+
+        :param statement: The Assign or AnnAssign node.
+        :param environment: Types of the variables before the statement.
+        :return: The type or None when it is not known.
+        """
+        if isinstance(statement, astroid.AnnAssign):
+            annotated_type = self._annotated_type(statement.annotation)
+            if annotated_type is not None or statement.value is None:
+                return annotated_type
+        return self._expression_type(statement.value, environment)
+
+    def _expression_type(
+        self, node: astroid.node_classes.NodeNG, environment: Dict[str, str]
+    ) -> Optional[str]:
+        """
+        Infer the type of the value of an expression.
+
+        :param node: The expression.
+        :param environment: Types of the variables before the statement of the expression.
+        :return: The type or None when it is not known.
+        """
+        if isinstance(node, astroid.Name):
+            if node.name in self.scope.locals:
+                return environment.get(node.name)
+            return self.outer_type(node.name)
+        if isinstance(node, astroid.Call):
+            if isinstance(node.func, astroid.Attribute):
+                if node.func.attrname in TypePropagation.CONVERSIONS:
+                    return TypePropagation.CONVERSIONS[node.func.attrname]
+                object_type = self._expression_type(node.func.expr, environment)
+                if object_type is not None:
+                    if any(keyword.arg == "inplace" for keyword in node.keywords or []):
+                        return None  # The method may return None instead of the result.
+                    return TypePropagation.METHODS.get(object_type, {}).get(node.func.attrname)
+            return TypePropagation.FACTORIES.get(self._full_name(node.func))
+        if isinstance(node, astroid.Attribute):
+            object_type = self._expression_type(node.expr, environment)
+            return TypePropagation.ATTRIBUTES.get(object_type, {}).get(node.attrname)
+        if isinstance(node, astroid.IfExp):
+            body_type = self._expression_type(node.body, environment)
+            if body_type == self._expression_type(node.orelse, environment):
+                return body_type
+            return None
+        return None
+
+    def _annotated_type(self, annotation: Optional[astroid.node_classes.NodeNG]) -> Optional[str]:
+        """
+        Infer the type of a variable from its annotation.
+
+        :param annotation: The annotation, e.g., pd.DataFrame.
+        :return: The type or None when it is not known.
+        """
+        if annotation is None:
+            return None
+        return TypePropagation.FACTORIES.get(self._full_name(annotation))
+
+    def _full_name(self, node: astroid.node_classes.NodeNG) -> Optional[str]:
+        """
+        Get the full name of an imported name or an attribute of it, e.g., 'pandas.read_csv' of
+        'pd.read_csv'.
+
+        :param node: Name or Attribute node.
+        :return: The full name or None when the node does not refer to something imported.
+        """
+        if isinstance(node, astroid.Attribute):
+            object_name = self._full_name(node.expr)
+            return object_name + "." + node.attrname if object_name is not None else None
+        if isinstance(node, astroid.Name) and node.name in self._imported_names:
+            # A variable with the same name as an imported name is not the import.
+            bindings = self.scope.locals.get(node.name, [])
+            imports = (astroid.Import, astroid.ImportFrom)
+            if all(isinstance(binding, imports) for binding in bindings):
+                return self._imported_names[node.name]
+        return None
+
+    @staticmethod
+    def _bound_names(
+        node: astroid.node_classes.NodeNG, include_self: bool = False
+    ) -> Iterator[str]:
+        """
+        Get the names bound by a node in its scope, excluding the names bound by nested scopes.
+
+        :param node: The node.
+        :param include_self: Whether the node itself is taken into account or only its children.
+        :return: The bound names.
+        """
+        if include_self:
+            if isinstance(node, (astroid.FunctionDef, astroid.ClassDef)):
+                yield node.name
+                return
+            if isinstance(node, (astroid.AssignName, astroid.DelName)):
+                yield node.name
+            elif isinstance(node, astroid.Import):
+                for name, alias in node.names:
+                    yield alias or name.split(".")[0]
+            elif isinstance(node, astroid.ImportFrom):
+                for name, alias in node.names:
+                    yield alias or name
+        for child in node.get_children():
+            is_scope = isinstance(child, (astroid.Lambda, astroid.ComprehensionScope))
+            if is_scope and not isinstance(child, astroid.FunctionDef):
+                continue
+            yield from _ScopeAnalysis._bound_names(child, True)
+
+    @staticmethod
+    def _named_expression_names(statement: astroid.node_classes.NodeNG) -> List[str]:
+        """
+        Get the names bound by assignment expressions (:=) in a statement, excluding its body.
+
+        :param statement: The statement.
+        :return: The bound names.
+        """
+        names = []
+        for child in statement.get_children():
+            if isinstance(child, astroid.node_classes.Statement):
+                continue
+            if isinstance(child, (astroid.Lambda, astroid.ComprehensionScope)):
+                continue
+            for named_expression in child.nodes_of_class(astroid.NamedExpr):
+                names.append(named_expression.target.name)
+        return names
+
+    @staticmethod
+    def _without(environment: Dict[str, str], names: Iterable[str]) -> Dict[str, str]:
+        """
+        Remove the types of variables from an environment.
+
+        :param environment: Types of the variables.
+        :param names: Names of the variables of which the type is not known anymore.
+        :return: A copy of the environment without the variables, or the environment itself when
+            unchanged.
+        """
+        names = [name for name in names if name in environment]
+        if not names:
+            return environment
+        return {
+            name: variable_type
+            for name, variable_type in environment.items()
+            if name not in names
+        }
+
+    @staticmethod
+    def _without_bound(
+        environment: Dict[str, str], node: astroid.node_classes.NodeNG, include_self: bool = False
+    ) -> Dict[str, str]:
+        """
+        Remove the types of the variables bound by a node from an environment.
+
+        :param environment: Types of the variables.
+        :param node: The node, see _bound_names.
+        :param include_self: Whether the node itself is taken into account or only its children.
+        :return: A copy of the environment without the variables, or the environment itself when
+            unchanged.
+        """
+        return _ScopeAnalysis._without(environment, _ScopeAnalysis._bound_names(node, include_self))
+
+    @staticmethod
+    def _join(first: Environment, second: Environment) -> Environment:
+        """
+        Combine the types of two paths to the same program point.
+
+        :param first: Types of the variables on the first path.
+        :param second: Types of the variables on the second path.
+        :return: Types of the variables which have the same type on both paths.
+        """
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if first is second:
+            return first
+        return {
+            name: variable_type
+            for name, variable_type in first.items()
+            if second.get(name) == variable_type
+        }
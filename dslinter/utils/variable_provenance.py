@@ -0,0 +1,137 @@
+"""Utility module for looking up where the variables in a module are assigned from."""
+from typing import Dict, List, Optional
+
+import astroid
+
+from dslinter.utils.ast import ASTUtil
+from dslinter.utils.module_cache import ModuleCache
+
+
+class VariableProvenance:
+    """
+    Index of the values assigned to the variables in a module, built in a single pass over its
+    Assign nodes.
+
+    The value of an assignment is the full name of the called function, e.g., 'pd.read_csv' for
+    'df = pd.read_csv(path)', or 'const' for a constant. Assigning a constant to a variable
+    replaces the values assigned to it before. Other assignments are not taken into account.
+    """
+
+    def __init__(self, module: astroid.Module):
+        """
+        Build the index of a module.
+
+        :param module: The module to index.
+        """
+        self._values: Dict[str, List[str]] = {}
+        for node in ASTUtil.search_nodes(module, astroid.Assign):
+            for target in node.targets:
+                if not hasattr(target, "name"):
+                    continue
+                if isinstance(node.value, astroid.nodes.Const):
+                    self._values[target.name] = ["const"]
+                elif hasattr(node.value, "func"):
+                    full_name = VariableProvenance._full_name(node.value.func)
+                    self._values.setdefault(target.name, []).append(full_name)
+
+    @staticmethod
+    def for_module(module: astroid.Module) -> "VariableProvenance":
+        """
+        Get the index of a module, which is built once and shared by all checkers.
+
+        :param module: The module to get the index of.
+        :return: The index of the module.
+        """
+        return ModuleCache.get(module, "variable_provenance", lambda: VariableProvenance(module))
+
+    @staticmethod
+    def _full_name(call: astroid.node_classes.NodeNG) -> str:
+        """
+        Get the full name of a called function, e.g., 'tf.math.add'.
+
+        :param call: Function of a Call node.
+        :return: Names of the function and the expressions it is an attribute of, separated by dots.
+        """
+        full_name = ""
+        if hasattr(call, "attrname"):
+            full_name = "." + call.attrname + full_name
+        while hasattr(call, "expr"):
+            call = call.expr
+            if hasattr(call, "attrname"):
+                full_name = "." + call.attrname + full_name
+        if hasattr(call, "name"):
+            full_name = call.name + full_name
+        return full_name
+
+    @staticmethod
+    def _library_submodule(value: str) -> Optional[str]:
+        """
+        Get the library and its submodule of a value, e.g., 'tf.math' of 'tf.math.add'.
+
+        :param value: Value assigned to a variable.
+        :return: The first two names of the value or None when the value has less than two names.
+        """
+        names = value.split(".")
+        if len(names) >= 2:
+            return names[0] + "." + names[1]
+        return None
+
+    def names(self) -> List[str]:
+        """
+        Get the names of all indexed variables.
+
+        :return: Names of the variables, in the order they are first assigned.
+        """
+        return list(self._values)
+
+    def all(self, name: str) -> List[str]:
+        """
+        Get all values assigned to a variable.
+
+        :param name: Name of the variable.
+        :return: The values in the order they are assigned, empty when the variable is not indexed.
+        """
+        return list(self._values.get(name, []))
+
+    def first(self, name: str) -> Optional[str]:
+        """
+        Get the first value assigned to a variable.
+
+        :param name: Name of the variable.
+        :return: The value or None when the variable is not indexed.
+        """
+        values = self._values.get(name)
+        return values[0] if values else None
+
+    def most_recent(self, name: str) -> Optional[str]:
+        """
+        Get the value most recently assigned to a variable.
+
+        :param name: Name of the variable.
+        :return: The value or None when the variable is not indexed.
+        """
+        values = self._values.get(name)
+        return values[-1] if values else None
+
+    def root_library(self, name: str) -> Optional[str]:
+        """
+        Get the library of the value most recently assigned to a variable, e.g., 'tf' of
+        'tf.math.add'.
+
+        :param name: Name of the variable.
+        :return: The first name of the value or None when the variable is not indexed.
+        """
+        value = self.most_recent(name)
+        return value.split(".")[0] if value is not None else None
+
+    def library_submodule(self, name: str, first: bool = False) -> Optional[str]:
+        """
+        Get the library and its submodule of the value assigned to a variable, e.g., 'tf.math' of
+        'tf.math.add'.
+
+        :param name: Name of the variable.
+        :param first: Whether to use the first value assigned instead of the most recent one.
+        :return: The first two names of the value or None when the value has less than two names.
+        """
+        value = self.first(name) if first else self.most_recent(name)
+        return VariableProvenance._library_submodule(value) if value is not None else None